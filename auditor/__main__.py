@@ -1,6 +1,8 @@
 """CLI entrypoint: python -m auditor --repo <url> --pdf <path> [--self-audit].
 
 Runs full swarm, saves report, logs LangSmith trace when configured.
+Batch mode: python -m auditor --batch manifest.jsonl [--batch-output results.jsonl] [--parallel N]
+(see src/batch.py for the manifest format).
 """
 
 from __future__ import annotations
@@ -27,7 +29,7 @@ if _project_root not in sys.path:
 # Ensure config (and LangSmith tracing) is loaded before graph
 import src.config  # noqa: F401
 
-from src.graph import create_compiled_graph
+from src.graph import get_compiled_graph
 from src.state import AgentState
 from src.tools.repo_tools import CloneError, validate_github_url
 
@@ -43,11 +45,77 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Self-audit mode: save report only to audit/report_onself_generated",
     )
+    p.add_argument(
+        "--batch",
+        type=str,
+        metavar="MANIFEST",
+        help="Run every audit in a JSONL manifest (one {id, repo, pdf} object per line) instead of --repo/--pdf",
+    )
+    p.add_argument(
+        "--batch-output",
+        type=str,
+        default="audit/batch_results.jsonl",
+        help="JSONL file batch results are appended to (default: audit/batch_results.jsonl)",
+    )
+    p.add_argument(
+        "--parallel",
+        type=int,
+        default=None,
+        help="Audits in flight at once in batch mode (default: AUDITOR_BATCH_PARALLELISM or 4)",
+    )
+    p.add_argument(
+        "--no-llm-cache",
+        action="store_true",
+        help="Always call the LLM; bypass the judge response cache",
+    )
     return p.parse_args()
 
 
+def _log_llm_cache_stats() -> None:
+    from src.llm_cache import get_llm_cache
+
+    cache = get_llm_cache()
+    if cache is not None:
+        stats = cache.stats()
+        logging.info(
+            "LLM response cache: %d hits, %d misses (%d entries, %.1f MB)",
+            stats["hits"], stats["misses"], stats["entries"], stats["bytes"] / (1024 * 1024),
+        )
+
+
+def _batch_parallelism(arg: int | None) -> int:
+    from src.batch import DEFAULT_BATCH_PARALLELISM
+
+    if arg is not None:
+        return max(1, arg)
+    raw = os.environ.get("AUDITOR_BATCH_PARALLELISM", "").strip()
+    try:
+        return max(1, int(raw)) if raw else DEFAULT_BATCH_PARALLELISM
+    except ValueError:
+        return DEFAULT_BATCH_PARALLELISM
+
+
+def run_batch_mode(args: argparse.Namespace) -> int:
+    from src.batch import run_batch
+
+    if not Path(args.batch).is_file():
+        print(f"Manifest not found: {args.batch}", file=sys.stderr)
+        return 1
+    ok, failed = run_batch(args.batch, args.batch_output, _batch_parallelism(args.parallel))
+    print(f"Batch complete: {ok} ok, {failed} failed. Results appended to {args.batch_output}")
+    _log_llm_cache_stats()
+    return 0 if failed == 0 else 1
+
+
 def main() -> int:
     args = parse_args()
+    if args.no_llm_cache:
+        os.environ["AUDITOR_NO_LLM_CACHE"] = "1"
+    if args.batch:
+        if args.repo or args.pdf:
+            print("--batch cannot be combined with --repo/--pdf.", file=sys.stderr)
+            return 1
+        return run_batch_mode(args)
     if not args.repo and not args.pdf:
         print("Provide at least one of --repo or --pdf.", file=sys.stderr)
         return 1
@@ -65,7 +133,7 @@ def main() -> int:
         "self_audit": args.self_audit,
     }
 
-    graph = create_compiled_graph()
+    graph = get_compiled_graph()
     final_state = graph.invoke(initial_state)
 
     report = final_state.get("final_report")
@@ -78,6 +146,7 @@ def main() -> int:
     else:
         print("Audit finished; no report in state.", file=sys.stderr)
 
+    _log_llm_cache_stats()
     return 0
 
 
@@ -0,0 +1,42 @@
+"""Process-wide asyncio loop for LLM fan-out from synchronous graph nodes.
+
+Graph nodes are plain functions run on LangGraph's worker threads. Instead of
+each node spinning up its own loop with asyncio.run (which would give every
+node its own semaphore and its own, loop-bound async HTTP clients), all async
+work is submitted to one long-lived loop on a daemon thread. A semaphore
+created on that loop therefore bounds concurrency across every node and every
+audit in the process.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Awaitable, TypeVar
+
+T = TypeVar("T")
+
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_lock = threading.Lock()
+
+
+def get_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared event loop, starting its daemon thread on first use."""
+    global _loop
+    with _loop_lock:
+        if _loop is None or _loop.is_closed():
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=loop.run_forever, name="auditor-async", daemon=True)
+            thread.start()
+            _loop = loop
+        return _loop
+
+
+def run_coroutine(coro: Awaitable[T], timeout: float | None = None) -> T:
+    """Run coro on the shared loop and block the calling thread for its result.
+
+    Must not be called from the shared loop itself (it would deadlock).
+    """
+    loop = get_loop()
+    future = asyncio.run_coroutine_threadsafe(coro, loop)
+    return future.result(timeout=timeout)
@@ -0,0 +1,164 @@
+"""Batch audits driven by a JSONL manifest (CLI: python -m auditor --batch manifest.jsonl).
+
+Each manifest line is a JSON object:
+
+    {"id": "team-07", "repo": "https://github.com/org/repo", "pdf": "reports/team-07.pdf"}
+
+("repo_url"/"pdf_path"/"output_id" are accepted as aliases; "self_audit" is
+optional). Audits run concurrently on a thread pool against one compiled graph,
+so the rubric, pooled LLM clients, judge semaphore, Docling worker and caches
+are shared by every audit in the process. A failing line (bad JSON, invalid
+URL, an exception anywhere in the graph) becomes an "error" result and doesn't
+stop the batch. Results are appended to the output JSONL as audits finish, one
+line each, tagged with the manifest line number. Each audit's Markdown report
+is written as audit_report_<id>.md, so concurrent audits don't overwrite each
+other.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+
+from src.state import AgentState
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_PARALLELISM = 4
+
+_ID_UNSAFE = re.compile(r"[^A-Za-z0-9._-]+")
+
+
+@dataclass
+class BatchEntry:
+    """One manifest line; error is set when the line itself is unusable."""
+
+    line: int
+    id: str
+    repo: str = ""
+    pdf: str = ""
+    self_audit: bool = False
+    error: str = ""
+
+
+def safe_report_id(raw: str) -> str:
+    """Filesystem-safe report id (used in audit_report_<id>.md)."""
+    return _ID_UNSAFE.sub("_", raw).strip("._") or "audit"
+
+
+def load_manifest(path: str | Path) -> list[BatchEntry]:
+    """Parse a JSONL manifest; blank lines are skipped, bad lines become entries with error set."""
+    entries: list[BatchEntry] = []
+    seen: set[str] = set()
+    with open(path, encoding="utf-8") as f:
+        for line_no, raw in enumerate(f, start=1):
+            raw = raw.strip()
+            if not raw or raw.startswith("#"):
+                continue
+            try:
+                item = json.loads(raw)
+                if not isinstance(item, dict):
+                    raise ValueError("expected a JSON object")
+            except ValueError as e:
+                entries.append(BatchEntry(line=line_no, id=f"line-{line_no}", error=f"invalid manifest line: {e}"))
+                continue
+            entry = BatchEntry(
+                line=line_no,
+                id=safe_report_id(str(item.get("id") or item.get("output_id") or f"line-{line_no}")),
+                repo=str(item.get("repo") or item.get("repo_url") or ""),
+                pdf=str(item.get("pdf") or item.get("pdf_path") or ""),
+                self_audit=bool(item.get("self_audit", False)),
+            )
+            if entry.id in seen:
+                entry.error = f"duplicate id {entry.id!r}"
+            elif not entry.repo and not entry.pdf:
+                entry.error = "needs at least one of repo or pdf"
+            seen.add(entry.id)
+            entries.append(entry)
+    return entries
+
+
+def _result_record(entry: BatchEntry, final_state: dict) -> dict:
+    report = final_state.get("final_report")
+    record: dict = {"status": "ok" if report is not None else "error"}
+    if report is None:
+        record["error"] = "no report in final state"
+        return record
+    from src.report_serializer import pass_rate
+
+    criteria = list(report.criterion_breakdown)
+    record.update(
+        {
+            "pass_rate": round(pass_rate(criteria), 3) if criteria else None,
+            "criteria": [
+                {"criterion_id": c.criterion_id, "verdict": c.verdict, "final_score": c.final_score}
+                for c in criteria
+            ],
+            "executive_summary": report.executive_summary,
+            "report_path": final_state.get("report_path") or "",
+        }
+    )
+    return record
+
+
+def run_audit(graph, entry: BatchEntry) -> dict:
+    """Run one manifest entry through the compiled graph; never raises."""
+    record: dict = {"line": entry.line, "id": entry.id, "repo": entry.repo, "pdf": entry.pdf}
+    if entry.error:
+        return {**record, "status": "error", "error": entry.error, "seconds": 0.0}
+    start = time.monotonic()
+    try:
+        if entry.repo:
+            from src.tools.repo_tools import validate_github_url
+
+            validate_github_url(entry.repo)
+        state: AgentState = {
+            "repo_url": entry.repo,
+            "pdf_path": entry.pdf,
+            "self_audit": entry.self_audit,
+            "report_id": entry.id,
+        }
+        record.update(_result_record(entry, graph.invoke(state)))
+    except Exception as e:
+        logger.exception("Batch: audit %s failed", entry.id)
+        record.update({"status": "error", "error": f"{type(e).__name__}: {e}"})
+    record["seconds"] = round(time.monotonic() - start, 2)
+    return record
+
+
+def run_batch(
+    manifest_path: str | Path,
+    output_path: str | Path,
+    parallelism: int = DEFAULT_BATCH_PARALLELISM,
+) -> tuple[int, int]:
+    """Audit every manifest entry with up to parallelism audits in flight; returns (ok, failed).
+
+    Results are appended to output_path (JSONL) in completion order.
+    """
+    from src.graph import get_compiled_graph
+
+    entries = load_manifest(manifest_path)
+    graph = get_compiled_graph()
+    out_path = Path(output_path)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    ok = failed = 0
+    logger.info("Batch: %d audits from %s, %d at a time.", len(entries), manifest_path, max(1, parallelism))
+    with open(out_path, "a", encoding="utf-8") as out, ThreadPoolExecutor(
+        max_workers=max(1, parallelism), thread_name_prefix="audit"
+    ) as pool:
+        futures = [pool.submit(run_audit, graph, entry) for entry in entries]
+        for future in as_completed(futures):
+            record = future.result()
+            out.write(json.dumps(record, ensure_ascii=False) + "\n")
+            out.flush()
+            if record["status"] == "ok":
+                ok += 1
+            else:
+                failed += 1
+            logger.info("Batch: %s %s (%d/%d done).", record["id"], record["status"], ok + failed, len(entries))
+    return ok, failed
@@ -4,6 +4,7 @@ No API keys or secrets are hardcoded. All values come from the environment.
 """
 
 import os
+import threading
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -54,14 +55,17 @@ _PROVIDERS: dict[str, tuple[str, ...]] = {
 }
 
 
-def get_llm(*, temperature: float = 0.2):
-    """Return the chat-model selected by ``LLM_PROVIDER`` env var.
+# Process-wide client registry: one chat client (and its keep-alive HTTP pools)
+# per (provider, model, temperature[, structured-output method, schema]).
+# Sync calls may come from any graph thread (httpx clients are thread-safe);
+# async calls all run on the single loop in src.async_runtime, so the
+# loop-bound async connection pools are never shared across event loops.
+_llm_pool: dict[tuple, object] = {}
+_llm_pool_lock = threading.Lock()
 
-    Supported values: ``openai`` (default), ``gemini``, ``deepseek``.
-    Raises ``RuntimeError`` if the required API key is not set.
-    """
-    import importlib
 
+def _resolve_provider() -> tuple[str, tuple[str, ...]]:
+    """Return (provider, _PROVIDERS entry) for ``LLM_PROVIDER``; validate its API key."""
     provider = os.getenv("LLM_PROVIDER", "openai").lower().strip()
     if provider not in _PROVIDERS:
         raise RuntimeError(
@@ -70,14 +74,20 @@ def get_llm(*, temperature: float = 0.2):
         )
 
     entry = _PROVIDERS[provider]
-    pkg, cls_name, model, key_env = entry[:4]
-    base_url = entry[4] if len(entry) > 4 else None
-
+    key_env = entry[3]
     if not os.getenv(key_env):
         raise RuntimeError(
             f"LLM_PROVIDER={provider} but {key_env} is not set. "
             f"Add it to your .env file."
         )
+    return provider, entry
+
+
+def _build_llm(entry: tuple[str, ...], temperature: float):
+    import importlib
+
+    pkg, cls_name, model, key_env = entry[:4]
+    base_url = entry[4] if len(entry) > 4 else None
 
     module = importlib.import_module(pkg)
     chat_cls = getattr(module, cls_name)
@@ -89,6 +99,54 @@ def get_llm(*, temperature: float = 0.2):
     return chat_cls(**kwargs)
 
 
+def get_llm(*, temperature: float = 0.2):
+    """Return the chat-model selected by ``LLM_PROVIDER`` env var.
+
+    Supported values: ``openai`` (default), ``gemini``, ``deepseek``.
+    Clients are pooled per (provider, model, temperature) and reused across
+    calls and audits in the same process.
+    Raises ``RuntimeError`` if the required API key is not set.
+    """
+    provider, entry = _resolve_provider()
+    key = (provider, entry[2], float(temperature))
+    with _llm_pool_lock:
+        llm = _llm_pool.get(key)
+        if llm is None:
+            llm = _llm_pool[key] = _build_llm(entry, temperature)
+        return llm
+
+
+def get_structured_llm(schema: type, *, temperature: float = 0.2):
+    """Return pooled ``get_llm(...).with_structured_output(schema)`` for the current provider.
+
+    Keyed by provider, model, temperature, structured-output method and schema,
+    so the bound runnable is built once and shares the base client's connections.
+    """
+    provider, entry = _resolve_provider()
+    method = get_structured_output_method()
+    key = (provider, entry[2], float(temperature), method, schema)
+    with _llm_pool_lock:
+        structured = _llm_pool.get(key)
+    if structured is not None:
+        return structured
+    so_kwargs: dict = {"method": method} if method else {}
+    structured = get_llm(temperature=temperature).with_structured_output(schema, **so_kwargs)
+    with _llm_pool_lock:
+        return _llm_pool.setdefault(key, structured)
+
+
+def get_llm_identity() -> tuple[str, str]:
+    """Return (provider, model) that ``get_llm`` would use, e.g. for response-cache keys."""
+    provider, entry = _resolve_provider()
+    return provider, entry[2]
+
+
+def clear_llm_pool() -> None:
+    """Drop all pooled clients (e.g. after changing LLM_PROVIDER or API keys)."""
+    with _llm_pool_lock:
+        _llm_pool.clear()
+
+
 # Providers that don't support json_schema response_format
 _JSON_MODE_PROVIDERS = {"deepseek"}
 
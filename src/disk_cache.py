@@ -0,0 +1,154 @@
+"""Shared helpers for on-disk caches (git mirrors, converted PDFs).
+
+Each cache is a directory of entries (one subdirectory per key). Entries are
+evicted least-recently-used first once the cache exceeds its byte budget.
+Recency is tracked with a ``.last_used`` stamp file inside each entry, and a
+per-entry lock file serializes writers across threads and processes.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterator
+
+try:
+    import fcntl
+except ImportError:  # Windows: fall back to in-process locks only
+    fcntl = None  # type: ignore[assignment]
+
+# Default root for all auditor caches; override with AUDITOR_CACHE_DIR.
+DEFAULT_CACHE_ROOT = Path.home() / ".cache" / "automaton-auditor"
+
+_STAMP_NAME = ".last_used"
+
+# In-process locks keyed by lock path (fcntl locks alone do not cover Windows).
+_thread_locks: dict[str, threading.Lock] = {}
+_thread_locks_guard = threading.Lock()
+
+
+def cache_root() -> Path:
+    """Return the cache root directory from AUDITOR_CACHE_DIR (or the default)."""
+    configured = os.environ.get("AUDITOR_CACHE_DIR", "").strip()
+    return Path(configured).expanduser() if configured else DEFAULT_CACHE_ROOT
+
+
+def env_megabytes(name: str, default_mb: int) -> int:
+    """Read a size budget in megabytes from the environment; return bytes."""
+    raw = os.environ.get(name, "").strip()
+    try:
+        mb = float(raw) if raw else float(default_mb)
+    except ValueError:
+        mb = float(default_mb)
+    return max(0, int(mb * 1024 * 1024))
+
+
+def dir_size(path: Path) -> int:
+    """Total size in bytes of regular files under path (0 if missing)."""
+    total = 0
+    for dirpath, _dirnames, filenames in os.walk(path):
+        for name in filenames:
+            try:
+                total += os.lstat(os.path.join(dirpath, name)).st_size
+            except OSError:
+                pass
+    return total
+
+
+# Suffix of an entry being written (renamed to the entry name when complete).
+PARTIAL_SUFFIX = ".partial"
+
+
+def touch_entry(entry: Path) -> None:
+    """Mark a cache entry as just used (LRU recency)."""
+    try:
+        (entry / _STAMP_NAME).touch()
+    except OSError:
+        pass
+
+
+def _last_used(entry: Path) -> float:
+    for candidate in (entry / _STAMP_NAME, entry):
+        try:
+            return candidate.stat().st_mtime
+        except OSError:
+            continue
+    return 0.0
+
+
+def _thread_lock_for(lock_path: Path) -> threading.Lock:
+    key = str(lock_path)
+    with _thread_locks_guard:
+        lock = _thread_locks.get(key)
+        if lock is None:
+            lock = _thread_locks[key] = threading.Lock()
+        return lock
+
+
+@contextmanager
+def entry_lock(lock_path: Path, blocking: bool = True) -> Iterator[bool]:
+    """Exclusive lock on a cache entry, across threads and processes.
+
+    Yields True when the lock was acquired. With blocking=False, yields False
+    immediately if another holder has it (used by eviction to skip busy entries).
+    """
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    tlock = _thread_lock_for(lock_path)
+    if not tlock.acquire(blocking):
+        yield False
+        return
+    try:
+        with open(lock_path, "a+") as fh:
+            if fcntl is not None:
+                flags = fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB
+                try:
+                    fcntl.flock(fh.fileno(), flags)
+                except BlockingIOError:
+                    yield False
+                    return
+            try:
+                yield True
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+    finally:
+        tlock.release()
+
+
+def evict_lru(
+    entries_dir: Path,
+    max_bytes: int,
+    lock_for: Callable[[Path], Path],
+    keep: set[str] | None = None,
+) -> list[str]:
+    """Remove least-recently-used entries until entries_dir fits in max_bytes.
+
+    Entries named in keep, and entries whose lock is held elsewhere, are skipped.
+    An in-progress "<name>.partial" write is guarded by its owning entry's lock
+    (writers hold that lock), so a live one is skipped and a stale one evicted.
+    Returns the names of removed entries.
+    """
+    import shutil
+
+    if not entries_dir.is_dir():
+        return []
+    entries = [p for p in entries_dir.iterdir() if p.is_dir()]
+    sizes = {p.name: dir_size(p) for p in entries}
+    total = sum(sizes.values())
+    removed: list[str] = []
+    keep = keep or set()
+    for entry in sorted(entries, key=_last_used):
+        if total <= max_bytes:
+            break
+        if entry.name in keep:
+            continue
+        owner = entry.with_name(entry.name[: -len(PARTIAL_SUFFIX)]) if entry.name.endswith(PARTIAL_SUFFIX) else entry
+        with entry_lock(lock_for(owner), blocking=False) as acquired:
+            if not acquired:
+                continue
+            shutil.rmtree(entry, ignore_errors=True)
+        total -= sizes.get(entry.name, 0)
+        removed.append(entry.name)
+    return removed
@@ -11,13 +11,15 @@
 
 from __future__ import annotations
 
+import threading
+
 from langgraph.graph import END, START, StateGraph
 from langgraph.types import Send
 
 from src.config import configure_tracing
 from src.nodes.context import context_builder
 from src.nodes.detectives import doc_detective, pdf_preprocess, repo_detective, vision_inspector
-from src.nodes.judges import defense_node, prosecutor_node, tech_lead_node
+from src.nodes.judges import build_judge_context, defense_node, prosecutor_node, tech_lead_node
 from src.nodes.justice import chief_justice, report_writer
 from src.state import AgentState
 
@@ -62,8 +64,8 @@ def judges_router(state: AgentState) -> list[Send]:
 
 
 def evidence_aggregator(state: AgentState) -> dict:
-    """Fan-in: no-op; state already merged by reducers from parallel detectives."""
-    return {}
+    """Fan-in: evidences already merged by reducers; serialize judge prompt artifacts once for all judges."""
+    return build_judge_context(state)
 
 
 def judges_aggregator(state: AgentState) -> dict:
@@ -162,3 +164,21 @@ def build_graph() -> StateGraph:
 def create_compiled_graph():
     """Compile the graph for invocation."""
     return build_graph().compile()
+
+
+_compiled_graph = None
+_compiled_graph_lock = threading.Lock()
+
+
+def get_compiled_graph():
+    """Process-wide compiled graph, built on first use.
+
+    The compiled graph holds no per-run state, so the CLI, batch mode and
+    services invoke the same instance (concurrently in batch mode).
+    """
+    global _compiled_graph
+    if _compiled_graph is None:
+        with _compiled_graph_lock:
+            if _compiled_graph is None:
+                _compiled_graph = create_compiled_graph()
+    return _compiled_graph
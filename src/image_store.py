@@ -0,0 +1,182 @@
+"""Process-wide store for encoded page/figure images, addressed by string handles.
+
+PDF images used to make an encode -> write -> read -> re-encode round trip
+through temp files between conversion, pre-filtering and vision
+classification. Producers now put encoded PNG bytes here and graph state
+carries only handles (AgentState.pdf_image_handles). Consumers read the bytes
+back without touching the filesystem.
+
+Memory is bounded (AUDITOR_IMAGE_STORE_MAX_MB). Once the budget is used, new
+images spill to files in a private temp dir. Images that already exist as
+files (Docling worker output, conversion-cache hard links) are registered by
+path and never copied into memory.
+
+Handles look like "mem://<id>/<file name>", so their file name (e.g.
+"report-page-7.png") still tells the image kind. Plain file paths are accepted
+wherever a handle is, so callers holding paths keep working. Handles are only
+valid in the process that created them.
+"""
+
+from __future__ import annotations
+
+import atexit
+import io
+import itertools
+import logging
+import shutil
+import tempfile
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+from src.disk_cache import env_megabytes
+
+logger = logging.getLogger(__name__)
+
+IMAGE_STORE_DEFAULT_MAX_MB = 256
+HANDLE_PREFIX = "mem://"
+
+
+@dataclass
+class _Entry:
+    name: str
+    data: bytes | None = None  # in memory ...
+    path: Path | None = None  # ... or on disk
+    owned: bool = False  # path is a spill file this store deletes on release
+
+
+class ImageStore:
+    """Bounded in-memory image store with spill-to-disk; thread-safe."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._entries: dict[str, _Entry] = {}
+        self._mem_bytes = 0
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._spill_dir: Path | None = None
+        self.spilled = 0
+
+    def _new_handle(self, name: str) -> str:
+        return f"{HANDLE_PREFIX}{next(self._ids):x}/{name}"
+
+    def put(self, data: bytes, name: str) -> str:
+        """Store encoded image bytes under a new handle (spilled to disk over the memory budget)."""
+        with self._lock:
+            handle = self._new_handle(name)
+            if self._mem_bytes + len(data) <= self.max_bytes:
+                self._entries[handle] = _Entry(name=name, data=data)
+                self._mem_bytes += len(data)
+                return handle
+            if self._spill_dir is None:
+                self._spill_dir = Path(tempfile.mkdtemp(prefix="auditor_images_"))
+            path = self._spill_dir / f"{handle[len(HANDLE_PREFIX):].replace('/', '-')}"
+            self.spilled += 1
+        path.write_bytes(data)
+        with self._lock:
+            self._entries[handle] = _Entry(name=name, path=path, owned=True)
+        return handle
+
+    def put_image(self, image, name: str) -> str:
+        """Encode a PIL image as PNG and store it."""
+        buf = io.BytesIO()
+        image.save(buf, format="PNG")
+        return self.put(buf.getvalue(), name)
+
+    def put_file(self, path: str | Path, name: str | None = None) -> str:
+        """Register an existing image file by path (not read, copied, or deleted by the store)."""
+        path = Path(path)
+        with self._lock:
+            handle = self._new_handle(name or path.name)
+            self._entries[handle] = _Entry(name=name or path.name, path=path)
+        return handle
+
+    def _entry(self, ref: str) -> _Entry | None:
+        with self._lock:
+            return self._entries.get(ref)
+
+    def name(self, ref: str) -> str:
+        """File name of the image behind a handle (or of a plain path)."""
+        entry = self._entry(ref)
+        return entry.name if entry is not None else Path(ref).name
+
+    def exists(self, ref: str) -> bool:
+        entry = self._entry(ref)
+        if entry is None:
+            return not ref.startswith(HANDLE_PREFIX) and Path(ref).exists()
+        return entry.data is not None or (entry.path is not None and entry.path.exists())
+
+    def get_bytes(self, ref: str) -> bytes:
+        """Encoded image bytes for a handle or plain path (raises FileNotFoundError if unknown)."""
+        entry = self._entry(ref)
+        if entry is None:
+            if ref.startswith(HANDLE_PREFIX):
+                raise FileNotFoundError(f"Unknown or released image handle: {ref}")
+            return Path(ref).read_bytes()
+        if entry.data is not None:
+            return entry.data
+        return entry.path.read_bytes()
+
+    def open_image(self, ref: str):
+        """PIL image for a handle or plain path (file-backed images are opened lazily from disk)."""
+        from PIL import Image
+
+        entry = self._entry(ref)
+        if entry is not None and entry.data is not None:
+            return Image.open(io.BytesIO(entry.data))
+        if entry is not None:
+            return Image.open(entry.path)
+        if ref.startswith(HANDLE_PREFIX):
+            raise FileNotFoundError(f"Unknown or released image handle: {ref}")
+        return Image.open(ref)
+
+    def write_to(self, ref: str, dest: str | Path) -> None:
+        """Write the image to dest (a copy for file-backed images)."""
+        entry = self._entry(ref)
+        if entry is not None and entry.data is None:
+            shutil.copy2(entry.path, dest)
+        else:
+            Path(dest).write_bytes(self.get_bytes(ref))
+
+    def release(self, refs) -> None:
+        """Forget handles, freeing their memory and deleting spill files; plain paths are ignored."""
+        with self._lock:
+            entries = [self._entries.pop(ref, None) for ref in refs]
+            for entry in entries:
+                if entry is not None and entry.data is not None:
+                    self._mem_bytes -= len(entry.data)
+        for entry in entries:
+            if entry is not None and entry.owned and entry.path is not None:
+                entry.path.unlink(missing_ok=True)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "images": len(self._entries),
+                "memory_bytes": self._mem_bytes,
+                "max_bytes": self.max_bytes,
+                "spilled": self.spilled,
+            }
+
+    def close(self) -> None:
+        """Drop everything and remove the spill dir."""
+        with self._lock:
+            self._entries.clear()
+            self._mem_bytes = 0
+            spill_dir, self._spill_dir = self._spill_dir, None
+        if spill_dir is not None:
+            shutil.rmtree(spill_dir, ignore_errors=True)
+
+
+_store: ImageStore | None = None
+_store_lock = threading.Lock()
+
+
+def get_image_store() -> ImageStore:
+    """Process-wide image store (AUDITOR_IMAGE_STORE_MAX_MB, default 256); spill dir removed at exit."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = ImageStore(env_megabytes("AUDITOR_IMAGE_STORE_MAX_MB", IMAGE_STORE_DEFAULT_MAX_MB))
+            atexit.register(_store.close)
+        return _store
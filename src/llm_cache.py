@@ -0,0 +1,150 @@
+"""Content-addressed SQLite cache for judge LLM responses.
+
+Key = SHA-256 over provider, model, temperature, schema, system prompt and user
+content, so re-auditing an unchanged repo/PDF (or re-running after changing
+only synthesis rules) reuses every judge response. Entries expire after a TTL
+and the table is trimmed least-recently-used first once it exceeds its byte
+budget. Disable with AUDITOR_NO_LLM_CACHE=1 (CLI: --no-llm-cache).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from src.disk_cache import cache_root, env_megabytes
+
+logger = logging.getLogger(__name__)
+
+LLM_CACHE_FILENAME = "llm_responses.sqlite3"
+DEFAULT_TTL_SEC = 7 * 24 * 3600
+DEFAULT_MAX_MB = 256
+
+
+def make_cache_key(*parts: object) -> str:
+    """Stable SHA-256 over the given parts (joined with a separator that cannot occur in repr)."""
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(repr(part).encode("utf-8"))
+        h.update(b"\x00")
+    return h.hexdigest()
+
+
+class LLMResponseCache:
+    """SQLite-backed key -> JSON text store with TTL, LRU byte budget and hit/miss counters.
+
+    One connection shared by all threads behind a lock; SQLite's own locking
+    (WAL) covers other processes using the same file.
+    """
+
+    def __init__(self, path: str | Path, ttl_sec: float = DEFAULT_TTL_SEC, max_bytes: int = DEFAULT_MAX_MB * 1024 * 1024) -> None:
+        self.path = Path(path)
+        self.ttl_sec = ttl_sec
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " key TEXT PRIMARY KEY, value TEXT NOT NULL,"
+                " created REAL NOT NULL, last_used REAL NOT NULL, size INTEGER NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS responses_last_used ON responses(last_used)")
+            self._conn.commit()
+
+    def get(self, key: str) -> str | None:
+        """Return the cached value, or None on miss / expired entry."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT value, created FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            value, created = row
+            if self.ttl_sec and now - created > self.ttl_sec:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.commit()
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE responses SET last_used = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+            return value
+
+    def put(self, key: str, value: str) -> None:
+        """Store value under key, then evict least-recently-used rows beyond max_bytes."""
+        now = time.time()
+        size = len(key) + len(value.encode("utf-8"))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, created, last_used, size) VALUES (?, ?, ?, ?, ?)",
+                (key, value, now, now, size),
+            )
+            self._evict_locked()
+            self._conn.commit()
+
+    def _evict_locked(self) -> None:
+        if self.ttl_sec:
+            self._conn.execute("DELETE FROM responses WHERE created < ?", (time.time() - self.ttl_sec,))
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for key, size in self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY last_used ASC"
+        ).fetchall():
+            if total <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            entries, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        return {"hits": self.hits, "misses": self.misses, "entries": entries, "bytes": total}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_cache: LLMResponseCache | None = None
+_cache_lock = threading.Lock()
+
+
+def llm_cache_enabled() -> bool:
+    return os.environ.get("AUDITOR_NO_LLM_CACHE", "").strip() not in ("1", "true", "yes")
+
+
+def get_llm_cache() -> LLMResponseCache | None:
+    """Process-wide cache instance, or None when disabled or the database cannot be opened."""
+    global _cache
+    if not llm_cache_enabled():
+        return None
+    with _cache_lock:
+        if _cache is None:
+            raw_ttl = os.environ.get("AUDITOR_LLM_CACHE_TTL_SEC", "").strip()
+            try:
+                ttl = float(raw_ttl) if raw_ttl else DEFAULT_TTL_SEC
+            except ValueError:
+                ttl = DEFAULT_TTL_SEC
+            try:
+                _cache = LLMResponseCache(
+                    cache_root() / LLM_CACHE_FILENAME,
+                    ttl_sec=ttl,
+                    max_bytes=env_megabytes("AUDITOR_LLM_CACHE_MAX_MB", DEFAULT_MAX_MB),
+                )
+            except (OSError, sqlite3.Error) as e:
+                logger.warning("LLM cache unavailable (%s); continuing without it.", e)
+                return None
+        return _cache
@@ -2,10 +2,17 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
+import logging
+import threading
+from dataclasses import dataclass, field
 from pathlib import Path
 
 from src.state import AgentState
+from src.tools.doc_tools import terms_from_instruction
+
+logger = logging.getLogger(__name__)
 
 # Default path relative to project root
 DEFAULT_RUBRIC_PATH = "rubric/week2_rubric.json"
@@ -26,49 +33,39 @@ def load_rubric(path: str | Path) -> dict:
     return json.loads(p.read_text(encoding="utf-8"))
 
 
-def apply_targeting(state: AgentState, rubric: dict) -> dict:
-    """Apply Targeting Protocol: map input keys to state.repo_url / state.pdf_path.
+# -----------------------------------------------------------------------------
+# Compiled rubric: parsed and routed once per rubric file version, reused by every audit
+# -----------------------------------------------------------------------------
 
-    Protocol: github_repo → RepoInvestigator (state.repo_url)
-              pdf_report → DocAnalyst (state.pdf_path)
-              pdf_images → VisionInspector (state.pdf_path for images from same PDF)
 
-    Expects state or a separate 'input' dict with keys github_repo, pdf_report, pdf_images.
-    """
-    out: dict = {}
-    # Allow inputs to be passed under "input" or at top level
-    inp = state.get("input") or state
-    if isinstance(inp.get("github_repo"), str):
-        out["repo_url"] = inp["github_repo"]
-    if isinstance(inp.get("pdf_report"), str):
-        out["pdf_path"] = inp["pdf_report"]
-    if isinstance(inp.get("pdf_images"), str):
-        out["pdf_path"] = inp["pdf_images"]
-    return out
+@dataclass(frozen=True)
+class CompiledRubric:
+    """Everything context_builder derives from the rubric; shared read-only across audits."""
 
+    rubric: dict
+    rubric_dimensions: list[dict]
+    forensic_instruction: str
+    judicial_logic: str
+    synthesis_rules: dict
+    theoretical_terms: list[str]
+    # dimension id -> evidence goals its judges see (judges.CRITERION_EVIDENCE_GOALS, rubric ids only)
+    criterion_evidence_goals: dict[str, list[str]] = field(default_factory=dict)
 
-def context_builder(
-    state: AgentState,
-    rubric_path: str | Path | None = None,
-) -> dict:
-    """Load rubric and route forensic_instruction → Detectives, judicial_logic → Judges, synthesis_rules → ChiefJustice.
 
-    Targeting Protocol: github_repo → RepoInvestigator, pdf_report → DocAnalyst, pdf_images → VisionInspector.
-    Sets state.repo_url / state.pdf_path from input keys when present.
-    """
-    path = rubric_path or DEFAULT_RUBRIC_PATH
-    try:
-        rubric = load_rubric(path)
-    except (FileNotFoundError, json.JSONDecodeError):
-        rubric = {
-            "dimensions": [],
-            "criteria": [],
-            "forensic_instruction": "",
-            "judicial_logic": "",
-            "synthesis_rules": {},
-            "synthesis_config": {},
-            "targeting": dict(TARGETING),
-        }
+EMPTY_RUBRIC = {
+    "dimensions": [],
+    "criteria": [],
+    "forensic_instruction": "",
+    "judicial_logic": "",
+    "synthesis_rules": {},
+    "synthesis_config": {},
+    "targeting": dict(TARGETING),
+}
+
+
+def compile_rubric(rubric: dict) -> CompiledRubric:
+    """Build the dimension table, routed instruction strings and goal routing from a rubric dict."""
+    from src.nodes.judges import CRITERION_EVIDENCE_GOALS
 
     # Support v3 format (dimensions) and legacy (criteria)
     dimensions = rubric.get("dimensions") or rubric.get("criteria", [])
@@ -79,6 +76,7 @@ def context_builder(
                 "id": d.get("id", ""),
                 "name": d.get("name", ""),
                 "description": d.get("success_pattern", "") or d.get("forensic_instruction", ""),
+                "target_artifact": d.get("target_artifact", ""),
             }
             for d in dimensions
         ]
@@ -95,6 +93,12 @@ def context_builder(
             "Targeting: github_repo → RepoInvestigator, pdf_report → DocAnalyst, pdf_images → VisionInspector. "
             "Collect evidence per dimension:\n\n" + "\n\n".join(forensic_parts)
         )
+        theoretical_terms = [
+            term
+            for d in dimensions
+            if d.get("id") == "theoretical_depth"
+            for term in terms_from_instruction(d.get("forensic_instruction", ""))
+        ]
         sr_narrative = rubric.get("synthesis_rules", {})
         judicial_logic = (
             "Judges evaluate evidence against rubric criteria. Output JudicialOpinion per criterion: "
@@ -110,14 +114,112 @@ def context_builder(
         forensic_instruction = rubric.get("forensic_instruction", "")
         judicial_logic = rubric.get("judicial_logic", "")
         synthesis_rules = rubric.get("synthesis_rules", {})
+        theoretical_terms = []
+
+    criterion_evidence_goals = {
+        d["id"]: list(CRITERION_EVIDENCE_GOALS[d["id"]])
+        for d in rubric_dimensions
+        if isinstance(d, dict) and d.get("id") in CRITERION_EVIDENCE_GOALS
+    }
+    return CompiledRubric(
+        rubric=rubric,
+        rubric_dimensions=rubric_dimensions,
+        forensic_instruction=forensic_instruction,
+        judicial_logic=judicial_logic,
+        synthesis_rules=synthesis_rules,
+        theoretical_terms=theoretical_terms,
+        criterion_evidence_goals=criterion_evidence_goals,
+    )
+
+
+@dataclass
+class _RubricCacheEntry:
+    stamp: tuple[int, int]  # (st_mtime_ns, st_size)
+    digest: str
+    compiled: CompiledRubric
+
+
+_rubric_cache: dict[Path, _RubricCacheEntry] = {}
+_rubric_cache_lock = threading.Lock()
+
+
+def get_compiled_rubric(path: str | Path = DEFAULT_RUBRIC_PATH) -> CompiledRubric:
+    """Compiled rubric for path, recompiled only when the file changes.
+
+    A changed mtime/size triggers a re-read; the file is recompiled only if its
+    SHA-256 differs too (a touch keeps the cached artifact). A missing or
+    invalid rubric compiles the empty rubric and is not cached.
+    """
+    p = Path(path).resolve()
+    try:
+        st = p.stat()
+        stamp = (st.st_mtime_ns, st.st_size)
+        with _rubric_cache_lock:
+            entry = _rubric_cache.get(p)
+        if entry is not None and entry.stamp == stamp:
+            return entry.compiled
+        data = p.read_bytes()
+        digest = hashlib.sha256(data).hexdigest()
+        if entry is not None and entry.digest == digest:
+            compiled = entry.compiled
+        else:
+            compiled = compile_rubric(json.loads(data.decode("utf-8")))
+            logger.debug("Rubric: compiled %s (%s).", p, digest[:12])
+    except (OSError, ValueError):
+        return compile_rubric(EMPTY_RUBRIC)
+    with _rubric_cache_lock:
+        _rubric_cache[p] = _RubricCacheEntry(stamp=stamp, digest=digest, compiled=compiled)
+    return compiled
+
+
+def clear_rubric_cache() -> None:
+    with _rubric_cache_lock:
+        _rubric_cache.clear()
+
+
+def apply_targeting(state: AgentState, rubric: dict) -> dict:
+    """Apply Targeting Protocol: map input keys to state.repo_url / state.pdf_path.
+
+    Protocol: github_repo → RepoInvestigator (state.repo_url)
+              pdf_report → DocAnalyst (state.pdf_path)
+              pdf_images → VisionInspector (state.pdf_path for images from same PDF)
+
+    Expects state or a separate 'input' dict with keys github_repo, pdf_report, pdf_images.
+    """
+    out: dict = {}
+    # Allow inputs to be passed under "input" or at top level
+    inp = state.get("input") or state
+    if isinstance(inp.get("github_repo"), str):
+        out["repo_url"] = inp["github_repo"]
+    if isinstance(inp.get("pdf_report"), str):
+        out["pdf_path"] = inp["pdf_report"]
+    if isinstance(inp.get("pdf_images"), str):
+        out["pdf_path"] = inp["pdf_images"]
+    return out
+
+
+def context_builder(
+    state: AgentState,
+    rubric_path: str | Path | None = None,
+) -> dict:
+    """Load rubric and route forensic_instruction → Detectives, judicial_logic → Judges, synthesis_rules → ChiefJustice.
+
+    Targeting Protocol: github_repo → RepoInvestigator, pdf_report → DocAnalyst, pdf_images → VisionInspector.
+    Sets state.repo_url / state.pdf_path from input keys when present.
+    The rubric is compiled once per file version (get_compiled_rubric).
+    """
+    compiled = get_compiled_rubric(rubric_path or DEFAULT_RUBRIC_PATH)
 
     # Apply Targeting Protocol: set repo_url, pdf_path from input
-    targeting_updates = apply_targeting(state, rubric)
+    targeting_updates = apply_targeting(state, compiled.rubric)
 
+    # Shallow copies: the compiled rubric is shared by every audit in the process
     return {
-        "rubric_dimensions": rubric_dimensions,
-        "forensic_instruction": forensic_instruction,
-        "judicial_logic": judicial_logic,
-        "synthesis_rules": synthesis_rules,
+        "rubric_dimensions": list(compiled.rubric_dimensions),
+        "forensic_instruction": compiled.forensic_instruction,
+        "judicial_logic": compiled.judicial_logic,
+        "synthesis_rules": dict(compiled.synthesis_rules),
+        "theoretical_terms": list(compiled.theoretical_terms),
+        "criterion_evidence_goals": dict(compiled.criterion_evidence_goals),
         **targeting_updates,
     }
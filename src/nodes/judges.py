@@ -6,12 +6,14 @@ and Orchestration Fraud rules. Retry on parse failure.
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import os
 from typing import Literal
 
 from pydantic import ValidationError
 
-from src.state import AgentState, Evidence, JudicialOpinion
+from src.state import AgentState, Evidence, JudicialOpinion, JudicialOpinionBatch
 
 logger = logging.getLogger(__name__)
 
@@ -82,11 +84,20 @@ TECH_LEAD_SYSTEM = (
 # -----------------------------------------------------------------------------
 
 
-def _evidence_for_prompt(evidences: dict[str, list[Evidence]]) -> str:
-    """Serialize state.evidences for the LLM (identical input for all judges)."""
+def _evidence_for_prompt(
+    evidences: dict[str, list[Evidence]],
+    goals: frozenset[str] | None = None,
+) -> str:
+    """Serialize state.evidences for the LLM (identical input for all judges).
+
+    With goals, only items whose goal is listed are included; refs keep their
+    original [source#i] index so citations stay valid across prompts.
+    """
     parts: list[str] = []
     for source, items in (evidences or {}).items():
         for i, e in enumerate(items):
+            if goals is not None and e.goal not in goals:
+                continue
             parts.append(
                 f"[{source}#{i}] goal={e.goal!r} found={e.found} location={e.location!r} "
                 f"rationale={e.rationale!r} confidence={e.confidence}"
@@ -96,35 +107,98 @@ def _evidence_for_prompt(evidences: dict[str, list[Evidence]]) -> str:
     return "\n".join(parts) if parts else "(no evidence)"
 
 
+# -----------------------------------------------------------------------------
+# Evidence routing: each criterion only sees the evidence goals it is judged on
+# -----------------------------------------------------------------------------
+
+# Rubric dimension id -> evidence goals (as emitted by the detectives) relevant to it.
+CRITERION_EVIDENCE_GOALS: dict[str, tuple[str, ...]] = {
+    "git_forensic_analysis": ("repo clone", "git_forensic_analysis"),
+    "state_management_rigor": ("repo clone", "state_management_rigor"),
+    "graph_orchestration": ("repo clone", "graph orchestration", "diagram architecture"),
+    "safe_tool_engineering": ("repo clone", "safe_tool_engineering"),
+    "structured_output_enforcement": ("repo clone", "structured_output_enforcement"),
+    "judicial_nuance": ("repo clone", "judicial_nuance"),
+    "chief_justice_synthesis": ("repo clone", "chief_justice_synthesis"),
+    "theoretical_depth": ("document ingest", "theoretical depth"),
+    "report_accuracy": ("document ingest", "report accuracy (paths)", "repo_file_list"),
+    "swarm_visual": ("diagram architecture", "graph orchestration"),
+}
+
+# Rubric target_artifact -> evidence source key (Targeting Protocol), for dimensions not listed above.
+TARGET_ARTIFACT_SOURCES: dict[str, str] = {
+    "github_repo": "repo",
+    "pdf_report": "docs",
+    "pdf_images": "vision",
+}
+
+
+def _evidence_routing_enabled() -> bool:
+    return os.environ.get("AUDITOR_NO_EVIDENCE_ROUTING", "").strip() not in ("1", "true", "yes")
+
+
+def _criterion_goals(
+    evidences: dict[str, list[Evidence]],
+    criterion_id: str,
+    target_artifact: str = "",
+    goal_routes: dict[str, list[str]] | None = None,
+) -> frozenset[str] | None:
+    """Evidence goals routed to criterion_id; None means send everything.
+
+    goal_routes is the compiled rubric's routing (state.criterion_evidence_goals);
+    CRITERION_EVIDENCE_GOALS is used when it is absent.
+    """
+    routes = CRITERION_EVIDENCE_GOALS if goal_routes is None else goal_routes
+    if criterion_id in routes:
+        return frozenset(routes[criterion_id])
+    source = TARGET_ARTIFACT_SOURCES.get(target_artifact)
+    if source and (evidences or {}).get(source):
+        return frozenset(e.goal for e in evidences[source])
+    return None
+
+
+def _criterion_evidence_text(
+    evidences: dict[str, list[Evidence]],
+    criterion_id: str,
+    target_artifact: str = "",
+    goal_routes: dict[str, list[str]] | None = None,
+) -> str:
+    """Evidence text for one criterion; the full text when routing is off or finds nothing."""
+    goals = None
+    if _evidence_routing_enabled():
+        goals = _criterion_goals(evidences, criterion_id, target_artifact, goal_routes)
+    if goals is not None:
+        text = _evidence_for_prompt(evidences, goals)
+        if text != "(no evidence)":
+            return text
+    return _evidence_for_prompt(evidences)
+
+
 # -----------------------------------------------------------------------------
 # Structured output with retry (rubric: .with_structured_output(JudicialOpinion), retry on malformed output)
 # -----------------------------------------------------------------------------
 
 MAX_PARSE_RETRIES = 3
 
+# Max judge LLM requests in flight at once, across all judge nodes (AUDITOR_JUDGE_CONCURRENCY).
+DEFAULT_JUDGE_CONCURRENCY = 10
 
-def _invoke_judge(
+JUDGE_TEMPERATURE = 0.2
+
+
+def _build_judge_request(
     system_prompt: str,
-    judge_name: Literal["Prosecutor", "Defense", "TechLead"],
     evidence_text: str,
     rubric_summary: str,
     criterion_id: str | None = None,
     dimension_name: str = "",
     dimension_description: str = "",
-) -> JudicialOpinion | None:
-    """Invoke LLM with structured output; retry on parse failure.
-
-    If criterion_id is set, the prompt instructs the judge to evaluate only that criterion
-    and the returned opinion is forced to that criterion_id (one verdict per judge per criterion).
-    """
-    from src.config import get_llm, get_structured_output_method
+):
+    """Return (structured_llm, system_prompt, user_content) for one judge call."""
+    from src.config import get_structured_llm, get_structured_output_method
 
-    llm = get_llm(temperature=0.2)
     method = get_structured_output_method()
-    so_kwargs: dict = {}
-    if method:
-        so_kwargs["method"] = method
-    structured_llm = llm.with_structured_output(JudicialOpinion, **so_kwargs)
+    structured_llm = get_structured_llm(JudicialOpinion, temperature=JUDGE_TEMPERATURE)
 
     # json_mode doesn't embed the schema automatically — add it to the prompt
     if method == "json_mode":
@@ -150,6 +224,99 @@ def _invoke_judge(
             f"Evidence (identical for all judges):\n{evidence_text}\n\n"
             "Produce one JudicialOpinion with score (0-10), argument, and cited_evidence."
         )
+    return structured_llm, system_prompt, user_content
+
+
+def _response_cache_key(system_prompt: str, user_content: str, schema: type = JudicialOpinion) -> str | None:
+    """Content-addressed key for one judge request; None when the response cache is off."""
+    from src.config import get_llm_identity, get_structured_output_method
+    from src.llm_cache import get_llm_cache, make_cache_key
+
+    if get_llm_cache() is None:
+        return None
+    provider, model = get_llm_identity()
+    return make_cache_key(
+        provider,
+        model,
+        JUDGE_TEMPERATURE,
+        get_structured_output_method(),
+        schema.__name__,
+        system_prompt,
+        user_content,
+    )
+
+
+def _cached_opinion(key: str | None, schema: type = JudicialOpinion):
+    """Raw (pre-finalize) response stored under key, parsed as schema; None on miss."""
+    from src.llm_cache import get_llm_cache
+
+    cache = get_llm_cache()
+    if key is None or cache is None:
+        return None
+    raw = cache.get(key)
+    if raw is None:
+        return None
+    try:
+        return schema.model_validate_json(raw)
+    except ValidationError:
+        logger.debug("Discarding unparseable cached judge response %s", key[:12])
+        return None
+
+
+def _store_opinion(key: str | None, out, schema: type = JudicialOpinion) -> None:
+    """Cache a successfully parsed response (never parse failures)."""
+    from src.llm_cache import get_llm_cache
+
+    cache = get_llm_cache()
+    if key is None or cache is None or not isinstance(out, schema):
+        return
+    cache.put(key, out.model_dump_json())
+
+
+def _finalize_opinion(
+    out,
+    judge_name: Literal["Prosecutor", "Defense", "TechLead"],
+    criterion_id: str | None,
+    evidence_text: str,
+):
+    """Force judge/criterion_id and validate cited refs on a parsed opinion."""
+    if isinstance(out, JudicialOpinion):
+        # Force criterion_id when we asked for a specific criterion
+        cid = criterion_id if criterion_id else out.criterion_id
+        # Validate cited_evidence refs against evidence (cite validation)
+        valid_refs = _validate_cited_refs(out.cited_evidence, evidence_text)
+        return JudicialOpinion(
+            judge=judge_name,
+            criterion_id=cid,
+            score=out.score,
+            argument=out.argument,
+            cited_evidence=valid_refs,
+        )
+    return out
+
+
+def _invoke_judge(
+    system_prompt: str,
+    judge_name: Literal["Prosecutor", "Defense", "TechLead"],
+    evidence_text: str,
+    rubric_summary: str,
+    criterion_id: str | None = None,
+    dimension_name: str = "",
+    dimension_description: str = "",
+) -> JudicialOpinion | None:
+    """Invoke LLM with structured output; retry on parse failure.
+
+    If criterion_id is set, the prompt instructs the judge to evaluate only that criterion
+    and the returned opinion is forced to that criterion_id (one verdict per judge per criterion).
+    Identical requests are answered from the response cache (src.llm_cache) when enabled.
+    """
+    structured_llm, system_prompt, user_content = _build_judge_request(
+        system_prompt, evidence_text, rubric_summary, criterion_id, dimension_name, dimension_description
+    )
+    cache_key = _response_cache_key(system_prompt, user_content)
+    cached = _cached_opinion(cache_key)
+    if cached is not None:
+        return _finalize_opinion(cached, judge_name, criterion_id, evidence_text)
 
     last_error: Exception | None = None
     for attempt in range(MAX_PARSE_RETRIES):
@@ -160,19 +327,91 @@ def _invoke_judge(
                     {"role": "user", "content": user_content},
                 ]
             )
-            if isinstance(out, JudicialOpinion):
-                # Force criterion_id when we asked for a specific criterion
-                cid = criterion_id if criterion_id else out.criterion_id
-                # Validate cited_evidence refs against evidence (cite validation)
-                valid_refs = _validate_cited_refs(out.cited_evidence, evidence_text)
-                return JudicialOpinion(
-                    judge=judge_name,
-                    criterion_id=cid,
-                    score=out.score,
-                    argument=out.argument,
-                    cited_evidence=valid_refs,
+            _store_opinion(cache_key, out)
+            return _finalize_opinion(out, judge_name, criterion_id, evidence_text)
+        except (ValidationError, TypeError, ValueError) as e:
+            last_error = e
+            logger.warning("Judge %s parse attempt %s failed: %s", judge_name, attempt + 1, e)
+            if attempt < MAX_PARSE_RETRIES - 1:
+                user_content += f"\n\n[Parse error: {e}. Reply with a valid JudicialOpinion JSON.]"
+    logger.error("Judge %s failed after %s retries", judge_name, MAX_PARSE_RETRIES)
+    return None
+
+
+# -----------------------------------------------------------------------------
+# Async judge engine: every (judge x criterion) call dispatched at once on the
+# shared loop (src.async_runtime), bounded by one process-wide semaphore.
+# -----------------------------------------------------------------------------
+
+_judge_semaphore: asyncio.Semaphore | None = None
+
+
+def _judge_concurrency() -> int:
+    raw = os.environ.get("AUDITOR_JUDGE_CONCURRENCY", "").strip()
+    try:
+        return max(1, int(raw)) if raw else DEFAULT_JUDGE_CONCURRENCY
+    except ValueError:
+        return DEFAULT_JUDGE_CONCURRENCY
+
+
+_warned_sync_batch = False
+
+
+def _async_judges_enabled() -> bool:
+    """Async engine is the default; AUDITOR_SYNC_JUDGES=1 falls back to blocking calls.
+
+    Batch mode only exists on the async engine; with both flags set, batching is skipped (warned once).
+    """
+    global _warned_sync_batch
+    enabled = os.environ.get("AUDITOR_SYNC_JUDGES", "").strip() not in ("1", "true", "yes")
+    if not enabled and _judge_batch_enabled() and not _warned_sync_batch:
+        _warned_sync_batch = True
+        logger.warning("AUDITOR_JUDGE_BATCH has no effect with AUDITOR_SYNC_JUDGES=1; judging per criterion.")
+    return enabled
+
+
+def _get_judge_semaphore() -> asyncio.Semaphore:
+    """Semaphore bound to the shared loop; only call from coroutines running on it."""
+    global _judge_semaphore
+    if _judge_semaphore is None:
+        _judge_semaphore = asyncio.Semaphore(_judge_concurrency())
+    return _judge_semaphore
+
+
+async def _ainvoke_judge(
+    system_prompt: str,
+    judge_name: Literal["Prosecutor", "Defense", "TechLead"],
+    evidence_text: str,
+    rubric_summary: str,
+    criterion_id: str | None = None,
+    dimension_name: str = "",
+    dimension_description: str = "",
+) -> JudicialOpinion | None:
+    """Async twin of _invoke_judge (ainvoke); same MAX_PARSE_RETRIES behavior.
+
+    The semaphore is held per attempt, so a retry queues behind other pending calls.
+    """
+    structured_llm, system_prompt, user_content = _build_judge_request(
+        system_prompt, evidence_text, rubric_summary, criterion_id, dimension_name, dimension_description
+    )
+    cache_key = _response_cache_key(system_prompt, user_content)
+    # sqlite get/put block (get commits last_used), so they run off the shared loop
+    cached = await asyncio.to_thread(_cached_opinion, cache_key)
+    if cached is not None:
+        return _finalize_opinion(cached, judge_name, criterion_id, evidence_text)
+
+    last_error: Exception | None = None
+    for attempt in range(MAX_PARSE_RETRIES):
+        try:
+            async with _get_judge_semaphore():
+                out = await structured_llm.ainvoke(
+                    [
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": user_content},
+                    ]
                 )
-            return out
+            await asyncio.to_thread(_store_opinion, cache_key, out)
+            return _finalize_opinion(out, judge_name, criterion_id, evidence_text)
         except (ValidationError, TypeError, ValueError) as e:
             last_error = e
             logger.warning("Judge %s parse attempt %s failed: %s", judge_name, attempt + 1, e)
@@ -182,6 +421,229 @@ def _invoke_judge(
     return None
 
 
+def _criterion_evidence(state: AgentState, criterion_id: str) -> str:
+    """Routed evidence text for one criterion: precomputed fragment when present, else built now."""
+    fragment = (state.get("judge_prompt_fragments") or {}).get(criterion_id)
+    if fragment:
+        return fragment["evidence_text"]
+    target_artifact = ""
+    for dim in state.get("rubric_dimensions") or []:
+        if dim.get("id") == criterion_id:
+            target_artifact = dim.get("target_artifact") or ""
+            break
+    return _criterion_evidence_text(
+        state.get("evidences") or {}, criterion_id, target_artifact, state.get("criterion_evidence_goals")
+    )
+
+
+def _criteria(state: AgentState) -> list[tuple[str, str, str]]:
+    """(criterion_id, name, description) for every rubric dimension with an id, in rubric order."""
+    out: list[tuple[str, str, str]] = []
+    for dim in state.get("rubric_dimensions") or []:
+        cid = dim.get("id") or ""
+        if not cid:
+            continue
+        out.append((cid, dim.get("name") or cid.replace("_", " ").title(), dim.get("description") or ""))
+    return out
+
+
+async def _arun_criteria(
+    state: AgentState,
+    judges: tuple[tuple[Literal["Prosecutor", "Defense", "TechLead"], str], ...],
+) -> list[JudicialOpinion]:
+    """Dispatch every (criterion x judge) call concurrently; opinions come back in rubric order.
+
+    In batch mode (AUDITOR_JUDGE_BATCH=1) each judge gets one multi-criterion
+    request instead, with per-criterion calls only for what the batch missed.
+    """
+    evidence_text, rubric_summary = _judge_inputs(state)
+    criteria = _criteria(state)
+    criterion_texts = {cid: _criterion_evidence(state, cid) for cid, _, _ in criteria}
+    if _judge_batch_enabled():
+        per_judge = await asyncio.gather(
+            *(
+                _arun_judge_batched(
+                    system_prompt, judge_name, evidence_text, rubric_summary, criteria, criterion_texts
+                )
+                for judge_name, system_prompt in judges
+            )
+        )
+        opinions = [by_cid.get(cid) for cid, _, _ in criteria for by_cid in per_judge]
+        return [op for op in opinions if op is not None]
+
+    calls = []
+    for cid, name, desc in criteria:
+        criterion_text = criterion_texts[cid]
+        for judge_name, system_prompt in judges:
+            calls.append(
+                _ainvoke_judge(
+                    system_prompt,
+                    judge_name,
+                    criterion_text,
+                    rubric_summary,
+                    criterion_id=cid,
+                    dimension_name=name,
+                    dimension_description=desc,
+                )
+            )
+    opinions = await asyncio.gather(*calls)
+    return [op for op in opinions if op is not None]
+
+
+# -----------------------------------------------------------------------------
+# Batched mode: one request per judge returns a JudicialOpinionBatch covering
+# every criterion; missing or malformed criteria fall back to _ainvoke_judge.
+# -----------------------------------------------------------------------------
+
+BATCH_INSTRUCTION = (
+    "For this request, ignore the single-opinion instruction above: output a JudicialOpinionBatch "
+    "whose `opinions` list holds exactly one opinion per listed criterion, judged independently."
+)
+
+
+def _judge_batch_enabled() -> bool:
+    return os.environ.get("AUDITOR_JUDGE_BATCH", "").strip() in ("1", "true", "yes")
+
+
+def _build_batch_request(
+    system_prompt: str,
+    evidence_text: str,
+    rubric_summary: str,
+    criteria: list[tuple[str, str, str]],
+):
+    """Return (structured_llm, system_prompt, user_content) for one multi-criterion judge call."""
+    from src.config import get_structured_llm, get_structured_output_method
+
+    method = get_structured_output_method()
+    structured_llm = get_structured_llm(JudicialOpinionBatch, temperature=JUDGE_TEMPERATURE)
+
+    system_prompt = f"{system_prompt} {BATCH_INSTRUCTION}"
+    if method == "json_mode":
+        schema_hint = (
+            "You MUST respond with a JSON object matching this schema:\n"
+            '{"opinions": [{"criterion_id": "<string>", '
+            '"score": <int 0-10>, "argument": "<string>", '
+            '"cited_evidence": ["<string>", ...]}, ...]}\n\n'
+        )
+        system_prompt = schema_hint + system_prompt
+
+    listing = "\n".join(f"- {cid}: {name} — {desc[:500]}" for cid, name, desc in criteria)
+    user_content = (
+        f"Rubric context: {rubric_summary[:400]}\n\n"
+        f"Evaluate each of these criteria separately:\n{listing}\n\n"
+        f"Evidence:\n{evidence_text}\n\n"
+        f"Produce a JudicialOpinionBatch with {len(criteria)} opinions, one per criterion_id above, "
+        "each with score (0-10), argument, and cited_evidence."
+    )
+    return structured_llm, system_prompt, user_content
+
+
+async def _ainvoke_judge_batch(
+    system_prompt: str,
+    judge_name: Literal["Prosecutor", "Defense", "TechLead"],
+    evidence_text: str,
+    rubric_summary: str,
+    criteria: list[tuple[str, str, str]],
+) -> dict[str, JudicialOpinion]:
+    """One batched request; returns finalized opinions keyed by criterion_id.
+
+    Single attempt: anything missing, unknown or unparseable is left for the
+    per-criterion path rather than re-sending the whole batch. Entries are
+    validated one by one, so a malformed opinion only costs its own criterion.
+    """
+    structured_llm, system_prompt, user_content = _build_batch_request(
+        system_prompt, evidence_text, rubric_summary, criteria
+    )
+    cache_key = _response_cache_key(system_prompt, user_content, JudicialOpinionBatch)
+    out = await asyncio.to_thread(_cached_opinion, cache_key, JudicialOpinionBatch)
+    if out is None:
+        try:
+            async with _get_judge_semaphore():
+                out = await structured_llm.ainvoke(
+                    [
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": user_content},
+                    ]
+                )
+        except (ValidationError, TypeError, ValueError) as e:
+            logger.warning("Judge %s batch parse failed: %s", judge_name, e)
+            return {}
+        except Exception as e:
+            # Provider errors (bad request, rate limit, timeout): let every criterion fall back
+            logger.warning("Judge %s batch request failed: %s: %s", judge_name, type(e).__name__, e)
+            return {}
+        if not isinstance(out, JudicialOpinionBatch):
+            return {}
+        await asyncio.to_thread(_store_opinion, cache_key, out, JudicialOpinionBatch)
+
+    wanted = {cid for cid, _, _ in criteria}
+    by_cid: dict[str, JudicialOpinion] = {}
+    invalid = 0
+    for item in out.opinions:
+        try:
+            op = JudicialOpinion.model_validate(
+                {**item.model_dump(), "judge": judge_name, "cited_evidence": item.cited_evidence or []}
+            )
+        except ValidationError:
+            invalid += 1
+            continue
+        if op.criterion_id in wanted and op.criterion_id not in by_cid:
+            by_cid[op.criterion_id] = _finalize_opinion(op, judge_name, op.criterion_id, evidence_text)
+    if invalid:
+        logger.warning("Judge %s batch: %d malformed opinion(s) skipped", judge_name, invalid)
+    return by_cid
+
+
+async def _arun_judge_batched(
+    system_prompt: str,
+    judge_name: Literal["Prosecutor", "Defense", "TechLead"],
+    evidence_text: str,
+    rubric_summary: str,
+    criteria: list[tuple[str, str, str]],
+    criterion_texts: dict[str, str] | None = None,
+) -> dict[str, JudicialOpinion | None]:
+    """Batch call for one judge, then per-criterion calls for whatever it did not cover.
+
+    The batch sees the full evidence_text (it spans every criterion); fallbacks
+    use the routed per-criterion text from criterion_texts when given.
+    """
+    by_cid: dict[str, JudicialOpinion | None] = dict(
+        await _ainvoke_judge_batch(system_prompt, judge_name, evidence_text, rubric_summary, criteria)
+    )
+    missing = [c for c in criteria if c[0] not in by_cid]
+    if missing:
+        logger.info(
+            "Judge %s batch missed %d/%d criteria; falling back per criterion",
+            judge_name, len(missing), len(criteria),
+        )
+        fallback = await asyncio.gather(
+            *(
+                _ainvoke_judge(
+                    system_prompt,
+                    judge_name,
+                    (criterion_texts or {}).get(cid, evidence_text),
+                    rubric_summary,
+                    criterion_id=cid,
+                    dimension_name=name,
+                    dimension_description=desc,
+                )
+                for cid, name, desc in missing
+            )
+        )
+        by_cid.update(zip((c[0] for c in missing), fallback))
+    return by_cid
+
+
+def _run_criteria_async(
+    state: AgentState,
+    judges: tuple[tuple[Literal["Prosecutor", "Defense", "TechLead"], str], ...],
+) -> dict:
+    """Blocking entry point for graph nodes: run _arun_criteria on the shared loop."""
+    from src.async_runtime import run_coroutine
+
+    return {"opinions": run_coroutine(_arun_criteria(state, judges))}
+
+
 def _validate_cited_refs(cited: list[str] | None, evidence_text: str) -> list[str]:
     """Filter cited_evidence to only refs that appear in the evidence blob (cite validation).
 
@@ -221,6 +683,72 @@ def tech_lead(state: AgentState) -> dict:
     return _run_judge(state, "TechLead", TECH_LEAD_SYSTEM)
 
 
+_ALL_JUDGES: tuple[tuple[Literal["Prosecutor", "Defense", "TechLead"], str], ...] = (
+    ("Prosecutor", PROSECUTOR_SYSTEM),
+    ("Defense", DEFENSE_SYSTEM),
+    ("TechLead", TECH_LEAD_SYSTEM),
+)
+
+
+def _rubric_summary(state: AgentState) -> str:
+    rubric_dimensions = state.get("rubric_dimensions") or []
+    judicial_logic = state.get("judicial_logic") or ""
+    rubric_summary = str(rubric_dimensions)[:600] if rubric_dimensions else "General audit criteria."
+    if judicial_logic:
+        rubric_summary = f"Judicial logic (from rubric): {judicial_logic}\n\nCriteria: {rubric_summary}"
+    return rubric_summary
+
+
+def build_judge_context(state: AgentState) -> dict:
+    """Build every judge prompt artifact once per run (called by evidence_aggregator).
+
+    Returns the AgentState update: full serialized evidence, rubric summary,
+    a ref-ID table ("repo#0" -> source/index/goal/location/found/confidence)
+    and per-criterion prompt fragments with routed evidence text.
+    """
+    evidences = state.get("evidences") or {}
+    ref_table: dict[str, dict] = {}
+    for source, items in evidences.items():
+        for i, e in enumerate(items):
+            ref_table[f"{source}#{i}"] = {
+                "source": source,
+                "index": i,
+                "goal": e.goal,
+                "location": e.location,
+                "found": e.found,
+                "confidence": e.confidence,
+            }
+    goal_routes = state.get("criterion_evidence_goals")
+    fragments: dict[str, dict] = {}
+    for dim in state.get("rubric_dimensions") or []:
+        cid = dim.get("id") or ""
+        if not cid:
+            continue
+        target_artifact = dim.get("target_artifact") or ""
+        fragments[cid] = {
+            "name": dim.get("name") or cid.replace("_", " ").title(),
+            "description": dim.get("description") or "",
+            "target_artifact": target_artifact,
+            "evidence_text": _criterion_evidence_text(evidences, cid, target_artifact, goal_routes),
+        }
+    return {
+        "judge_evidence_text": _evidence_for_prompt(evidences),
+        "rubric_summary": _rubric_summary(state),
+        "evidence_ref_table": ref_table,
+        "judge_prompt_fragments": fragments,
+    }
+
+
+def _judge_inputs(state: AgentState) -> tuple[str, str]:
+    """Return (evidence_text, rubric_summary) shared by every judge call for this state.
+
+    Uses the artifacts precomputed by evidence_aggregator when present.
+    """
+    if state.get("judge_evidence_text") is not None and state.get("rubric_summary") is not None:
+        return state["judge_evidence_text"], state["rubric_summary"]
+    return _evidence_for_prompt(state.get("evidences") or {}), _rubric_summary(state)
+
+
 def _run_judge(
     state: AgentState,
     judge_name: Literal["Prosecutor", "Defense", "TechLead"],
@@ -229,14 +757,9 @@ def _run_judge(
     dimension_name: str = "",
     dimension_description: str = "",
 ) -> dict:
-    evidences = state.get("evidences") or {}
-    rubric_dimensions = state.get("rubric_dimensions") or []
-    judicial_logic = state.get("judicial_logic") or ""
-    rubric_summary = str(rubric_dimensions)[:600] if rubric_dimensions else "General audit criteria."
-    if judicial_logic:
-        rubric_summary = f"Judicial logic (from rubric): {judicial_logic}\n\nCriteria: {rubric_summary}"
-
-    evidence_text = _evidence_for_prompt(evidences)
+    evidence_text, rubric_summary = _judge_inputs(state)
+    if criterion_id:
+        evidence_text = _criterion_evidence(state, criterion_id)
     opinion = _invoke_judge(
         system_prompt,
         judge_name,
@@ -271,6 +794,9 @@ def run_judges(state: AgentState) -> dict:
             all_opinions.extend(result.get("opinions") or [])
         return {"opinions": all_opinions}
 
+    if _async_judges_enabled():
+        return _run_criteria_async(state, _ALL_JUDGES)
+
     all_opinions = []
     for dim in rubric_dimensions:
         cid = dim.get("id") or ""
@@ -316,6 +842,9 @@ def _run_all_criteria_for_judge(
         result = _run_judge(state, judge_name, system_prompt)
         return result
 
+    if _async_judges_enabled():
+        return _run_criteria_async(state, ((judge_name, system_prompt),))
+
     for dim in rubric_dimensions:
         cid = dim.get("id") or ""
         name = dim.get("name") or cid.replace("_", " ").title()
@@ -191,10 +191,19 @@ def _build_dissent_summary(opinions: list[JudicialOpinion]) -> str | None:
 def _evidence_refs_to_locations(
     evidences: dict[str, list[Evidence]],
     evidence_refs: list[str],
+    ref_table: dict[str, dict] | None = None,
 ) -> list[str]:
-    """Resolve evidence refs (e.g. repo#0) to file/location paths from evidences."""
+    """Resolve evidence refs (e.g. repo#0) to file/location paths from evidences.
+
+    ref_table (state.evidence_ref_table from evidence_aggregator) is used when given.
+    """
     locations: list[str] = []
     for ref in evidence_refs or []:
+        if ref_table is not None:
+            loc = ((ref_table.get(ref) or {}).get("location") or "").strip()
+            if loc and loc not in locations:
+                locations.append(loc)
+            continue
         if "#" not in ref:
             continue
         source, idx_str = ref.split("#", 1)
@@ -255,6 +264,7 @@ def _synthesize_criterion(
     evidences: dict[str, list[Evidence]],
     synthesis_rules: dict | None = None,
     rubric_dimensions: list[dict] | None = None,
+    ref_table: dict[str, dict] | None = None,
 ) -> CriterionResult:
     """Apply all rules in order; output verdict, summary, dissent_summary, remediation. synthesis_rules from rubric when provided."""
     dimension_name = _dimension_name_for(criterion_id, rubric_dimensions)
@@ -265,7 +275,7 @@ def _synthesize_criterion(
         refs_sec = [ref for op in opinions for ref in (op.cited_evidence or [])][:10]
         remediation_sec = _build_remediation_file_level(
             criterion_id, sec, "Rule of Security applied; address security findings.",
-            evidence_locations=_evidence_refs_to_locations(evidences, refs_sec),
+            evidence_locations=_evidence_refs_to_locations(evidences, refs_sec, ref_table),
             dimension_name=dimension_name,
             dimension_description=_dimension_description_for(criterion_id, rubric_dimensions),
         )
@@ -326,7 +336,7 @@ def _synthesize_criterion(
         criterion_id,
         verdict,
         summary or "",
-        evidence_locations=_evidence_refs_to_locations(evidences, refs),
+        evidence_locations=_evidence_refs_to_locations(evidences, refs, ref_table),
         dimension_name=dimension_name,
         dimension_description=_dimension_description_for(criterion_id, rubric_dimensions),
     )
@@ -396,11 +406,12 @@ def chief_justice(state: AgentState) -> dict:
         by_criterion["overall"] = []
 
     rubric_dimensions = state.get("rubric_dimensions") or []
+    ref_table = state.get("evidence_ref_table")
     criterion_results: list[CriterionResult] = []
     for cid, ops in by_criterion.items():
         criterion_results.append(
             _synthesize_criterion(
-                cid, ops, evidences, _state_synthesis_rules, rubric_dimensions
+                cid, ops, evidences, _state_synthesis_rules, rubric_dimensions, ref_table
             )
         )
 
@@ -426,8 +437,14 @@ def audit_report_to_markdown(report: AuditReport) -> str:
 
 
 def report_writer(state: AgentState) -> dict:
-    """Produce full Markdown report and save to audit/report_onself_generated and audit/report_onpeer_generated."""
-    from src.report_serializer import save_report_to_audit_dirs
+    """Produce full Markdown report and save to audit/report_onself_generated and audit/report_onpeer_generated.
+
+    Also frees the audit's PDF images (image store handles, conversion temp dir).
+    """
+    from src.nodes.detectives import release_pdf_artifacts
+    from src.report_serializer import report_filename, save_report_to_audit_dirs
+
+    release_pdf_artifacts(state)
 
     report = state.get("final_report")
     if report is None:
@@ -438,5 +455,7 @@ def report_writer(state: AgentState) -> dict:
         )
     opinions = list(state.get("opinions") or [])
     self_audit_only = bool(state.get("self_audit"))
-    save_report_to_audit_dirs(report, opinions, self_audit_only=self_audit_only)
-    return {"final_report": report}
+    _, path = save_report_to_audit_dirs(
+        report, opinions, self_audit_only=self_audit_only, filename=report_filename(state.get("report_id"))
+    )
+    return {"final_report": report, "report_path": str(path)}
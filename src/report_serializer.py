@@ -13,7 +13,7 @@ REPORT_ON_PEER_DIR = "audit/report_onpeer_generated"
 DEFAULT_FILENAME = "audit_report.md"
 
 
-def _compute_final_score(criterion_breakdown: list[CriterionResult]) -> float:
+def pass_rate(criterion_breakdown: list[CriterionResult]) -> float:
     """Compute final score: PASS=1, PARTIAL=0.5, FAIL=0; return average 0–1."""
     if not criterion_breakdown:
         return 0.0
@@ -60,7 +60,7 @@ def serialize_report_to_markdown(
     for op in opinions:
         by_criterion[op.criterion_id].append(op)
 
-    aggregate_0_1 = _compute_final_score(report.criterion_breakdown)
+    aggregate_0_1 = pass_rate(report.criterion_breakdown)
     aggregate_1_5 = _score_1_to_5(aggregate_0_1 * 10)  # 0–1 → 0–10 → 1–5
     pct = round(aggregate_0_1 * 100, 1)
 
@@ -118,6 +118,14 @@ def serialize_report_to_markdown(
     return "".join(parts)
 
 
+def report_filename(report_id: str | None = None) -> str:
+    """audit_report.md, or audit_report_<report_id>.md so concurrent audits don't share a file."""
+    if not report_id:
+        return DEFAULT_FILENAME
+    stem, dot, ext = DEFAULT_FILENAME.rpartition(".")
+    return f"{stem}_{report_id}{dot}{ext}"
+
+
 def save_report_markdown(
     markdown: str,
     output_dir: Path | str,
@@ -136,6 +144,7 @@ def save_report_to_audit_dirs(
     opinions: list[JudicialOpinion] | None = None,
     project_root: Path | str | None = None,
     self_audit_only: bool = False,
+    filename: str = DEFAULT_FILENAME,
 ) -> tuple[Path, Path]:
     """Serialize report and save to audit dirs.
 
@@ -145,8 +154,8 @@ def save_report_to_audit_dirs(
     """
     root = Path(project_root) if project_root else Path(__file__).resolve().parent.parent
     markdown = serialize_report_to_markdown(report, opinions)
-    path_self = save_report_markdown(markdown, root / REPORT_ON_SELF_DIR)
+    path_self = save_report_markdown(markdown, root / REPORT_ON_SELF_DIR, filename)
     path_peer = path_self
     if not self_audit_only:
-        path_peer = save_report_markdown(markdown, root / REPORT_ON_PEER_DIR)
+        path_peer = save_report_markdown(markdown, root / REPORT_ON_PEER_DIR, filename)
     return path_self, path_peer
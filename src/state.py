@@ -40,6 +40,26 @@ class JudicialOpinion(BaseModel):
     cited_evidence: list[str]
 
 
+class JudicialOpinionItem(BaseModel):
+    """One opinion inside a JudicialOpinionBatch; the judge is implied by the request.
+
+    Fields are required but nullable (valid in strict JSON schemas), so an
+    incomplete entry doesn't fail the whole batch parse;
+    judges._ainvoke_judge_batch validates each into a JudicialOpinion.
+    """
+
+    criterion_id: str
+    score: Optional[int]
+    argument: Optional[str]
+    cited_evidence: Optional[list[str]]
+
+
+class JudicialOpinionBatch(BaseModel):
+    """One judge's opinions on several criteria, returned by a single batched request."""
+
+    opinions: list[JudicialOpinionItem]
+
+
 class CriterionResult(BaseModel):
     """Synthesized result for one rubric criterion after chief justice.
 
@@ -97,24 +117,34 @@ class AgentState(TypedDict, total=False):
     pdf_path: str
 
     # Cached PDF conversion (set by pdf_preprocess so doc/vision don't convert in parallel)
-    pdf_doc_context: dict  # {"path": str, "markdown": str, "chunks": list[str]}
-    pdf_image_paths: list
+    pdf_doc_context: dict  # DocContext.to_dict(): {"path", "markdown", "chunks", "index"}
+    pdf_image_handles: list  # src.image_store handles (valid within this process)
     pdf_cleanup_path: str
     input: dict  # optional: { github_repo, pdf_report, pdf_images } for Targeting Protocol
     self_audit: bool  # optional: when True, report saved only to report_onself_generated (CLI --self-audit)
+    report_id: str  # optional: report saved as audit_report_<report_id>.md (batch mode; default audit_report.md)
 
     # Loaded rubric and routed instructions (from ContextBuilder)
     rubric_dimensions: list[dict]
     forensic_instruction: str
     judicial_logic: str
     synthesis_rules: dict
+    theoretical_terms: list[str]  # quoted terms from the theoretical_depth instruction (DocAnalyst)
+    criterion_evidence_goals: dict  # dimension id -> evidence goals routed to its judges (compiled rubric)
 
     # Detective outputs: source -> list of Evidence
     evidences: Annotated[dict[str, list[Evidence]], operator.ior]
 
+    # Judge prompt artifacts, built once by evidence_aggregator (see judges.build_judge_context)
+    judge_evidence_text: Annotated[str, _last_wins]  # full serialized evidence ([source#i] refs)
+    rubric_summary: Annotated[str, _last_wins]
+    evidence_ref_table: Annotated[dict, _last_wins]  # "repo#0" -> {source, index, goal, location, found, confidence}
+    judge_prompt_fragments: Annotated[dict, _last_wins]  # criterion_id -> {name, description, target_artifact, evidence_text}
+
     # Judge outputs
     opinions: Annotated[list[JudicialOpinion], operator.add]
 
     # Synthesis and final output (last-wins reducer: when chief_justice runs multiple times in fan-in, keep last)
     criterion_results: Annotated[list[CriterionResult], _last_wins]
     final_report: Annotated[Optional[AuditReport], _last_wins]
+    report_path: Annotated[str, _last_wins]  # where report_writer saved the Markdown report
@@ -9,10 +9,9 @@ from __future__ import annotations
 import logging
 import re
 from concurrent.futures import TimeoutError as FuturesTimeoutError
-from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
 
 from pydantic import BaseModel
 
@@ -21,44 +20,119 @@ logger = logging.getLogger(__name__)
 # Docling convert can be very slow on CPU; cap wait to avoid indefinite stall.
 PDF_CONVERT_TIMEOUT_SEC = 90
 
-# Default path uses pypdf (no Docling import) to avoid stall. Set AUDITOR_FULL_PDF=1 for Docling.
-def _pdf_to_markdown_pypdf(path: str) -> str:
-    """Extract text from PDF using pypdf only. No Docling import; no stall."""
-    from pypdf import PdfReader
-    reader = PdfReader(path)
+# Below this many pages per worker, page-parallel extraction is not worth the pool startup.
+PDF_MIN_PAGES_PER_WORKER = 16
+
+
+def _extract_page_texts(path: str, start: int = 0, stop: int | None = None, reader=None) -> list[str]:
+    """Non-empty extracted text of pages [start, stop); pages that fail to extract are skipped.
+
+    Top-level so process-pool workers can run it; each worker opens the file itself.
+    """
+    if reader is None:
+        from pypdf import PdfReader
+        reader = PdfReader(path)
+    pages = reader.pages
     parts = []
-    for page in reader.pages:
+    for i in range(start, len(pages) if stop is None else stop):
         try:
-            text = page.extract_text()
+            text = pages[i].extract_text()
             if text:
                 parts.append(text)
         except Exception:
             pass
-    return "\n\n".join(parts)
+    return parts
+
+
+def _pdf_workers() -> int:
+    """Process count for page-parallel pypdf extraction from AUDITOR_PDF_WORKERS; 0 or 1 is serial."""
+    import os
+
+    raw = os.environ.get("AUDITOR_PDF_WORKERS", "").strip()
+    if raw:
+        try:
+            return max(0, int(raw))
+        except ValueError:
+            pass
+    return min(4, os.cpu_count() or 1)
 
 
-def _minimal_pipeline_options():
-    """Return PdfPipelineOptions that avoid heavy OCR/layout (used only when AUDITOR_FULL_PDF=1)."""
-    from docling.datamodel.pipeline_options import PdfPipelineOptions
-    opts = PdfPipelineOptions()
-    opts.force_backend_text = True
-    opts.do_ocr = False
-    opts.do_table_structure = False
-    opts.generate_page_images = False
-    opts.generate_picture_images = False
-    opts.document_timeout = float(PDF_CONVERT_TIMEOUT_SEC)
-    return opts
+def _iter_pdf_page_texts(path: str, workers: int | None = None):
+    """Yield page texts in page order, extracting contiguous page ranges on a process pool.
+
+    Serial for small PDFs or workers <= 1. Uses forkserver (spawn on platforms
+    without it) so workers never inherit pipes from subprocesses other graph
+    threads are running. Falls back to serial extraction if the pool fails.
+    """
+    from pypdf import PdfReader
 
+    reader = PdfReader(path)
+    n_pages = len(reader.pages)
+    workers = _pdf_workers() if workers is None else workers
+    workers = min(workers, n_pages // PDF_MIN_PAGES_PER_WORKER)
+    if workers <= 1:
+        yield from _extract_page_texts(path, reader=reader)
+        return
+
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    from concurrent.futures.process import BrokenProcessPool
+
+    step = -(-n_pages // workers)
+    ranges = [(start, min(start + step, n_pages)) for start in range(0, n_pages, step)]
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    done = 0  # ranges already yielded, so a fallback never repeats pages
+    try:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context(method)) as pool:
+            for parts in pool.map(_extract_page_texts, [path] * len(ranges), *zip(*ranges)):
+                yield from parts
+                done += 1
+    except (BrokenProcessPool, OSError) as e:
+        logger.warning("PDF: parallel extraction failed (%s); continuing serially.", e)
+        for start, stop in ranges[done:]:
+            yield from _extract_page_texts(path, start, stop, reader=reader)
 
-def _full_pipeline_options():
-    """Full pipeline with page/picture images (for Vision); can stall on CPU."""
-    from docling.datamodel.pipeline_options import PdfPipelineOptions
-    opts = PdfPipelineOptions()
-    opts.images_scale = 2.0
-    opts.generate_page_images = True
-    opts.generate_picture_images = True
-    opts.document_timeout = float(PDF_CONVERT_TIMEOUT_SEC)
-    return opts
+
+# Default path uses pypdf (no Docling import) to avoid stall. Set AUDITOR_FULL_PDF=1 for Docling.
+def _pdf_to_markdown_pypdf(path: str, workers: int | None = None) -> str:
+    """Extract text from PDF using pypdf only. No Docling import; no stall.
+
+    Large PDFs are extracted page-parallel (AUDITOR_PDF_WORKERS); output is identical to serial.
+    """
+    return "\n\n".join(_iter_pdf_page_texts(path, workers))
+
+
+def _pdf_to_markdown_and_chunks_pypdf(path: str) -> tuple[str, list[str]]:
+    """pypdf markdown plus its chunks, chunking each page as soon as it is extracted.
+
+    Same result as _chunk_markdown(_pdf_to_markdown_pypdf(path)). Saves the
+    second pass over the markdown, not memory: DocContext needs the full
+    markdown and every chunk, so peak memory still grows with the document.
+    """
+    pages: list[str] = []
+
+    def pieces() -> Iterator[str]:
+        for text in _iter_pdf_page_texts(path):
+            yield f"\n\n{text}" if pages else text
+            pages.append(text)
+
+    chunks = list(iter_chunks(pieces()))
+    return "\n\n".join(pages), chunks
+
+
+# Output-affecting settings of the full Docling pipeline (src.tools.docling_pool "full"
+# profile); also part of the conversion cache key.
+FULL_PIPELINE_SETTINGS = {
+    "images_scale": 2.0,
+    "generate_page_images": True,
+    "generate_picture_images": True,
+}
+
+
+def _use_full_pdf() -> bool:
+    import os
+
+    return os.environ.get("AUDITOR_FULL_PDF", "").strip() in ("1", "true", "yes")
 
 
 # -----------------------------------------------------------------------------
@@ -69,51 +143,348 @@ CHUNK_MAX_CHARS = 1200
 CHUNK_MIN_CHARS = 100
 
 
+# BM25 parameters (standard Okapi defaults).
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def _tokenize(text: str) -> list[str]:
+    """Lowercased word tokens longer than one character."""
+    return [t for t in _TOKEN_PATTERN.findall(text.lower()) if len(t) > 1]
+
+
+@dataclass
+class DocIndex:
+    """Token inverted index over a document's chunks with BM25 ranking.
+
+    Built once per DocContext; to_dict/from_dict give a JSON-safe form so the
+    index travels with the converted document (conversion cache, graph state).
+    """
+
+    postings: dict[str, list[tuple[int, int]]]  # token -> [(chunk index, term frequency)]
+    doc_lens: list[int]
+
+    @classmethod
+    def build(cls, chunks: list[str]) -> "DocIndex":
+        postings: dict[str, list[tuple[int, int]]] = {}
+        doc_lens: list[int] = []
+        for i, chunk in enumerate(chunks):
+            tokens = _tokenize(chunk)
+            doc_lens.append(len(tokens))
+            counts: dict[str, int] = {}
+            for t in tokens:
+                counts[t] = counts.get(t, 0) + 1
+            for t, tf in counts.items():
+                postings.setdefault(t, []).append((i, tf))
+        return cls(postings=postings, doc_lens=doc_lens)
+
+    def search(self, query: str, k: int = 5) -> list[tuple[int, float]]:
+        """Top-k (chunk index, BM25 score) for query, best first; only chunks sharing a token."""
+        import heapq
+        import math
+
+        n_docs = len(self.doc_lens)
+        if not n_docs:
+            return []
+        avgdl = (sum(self.doc_lens) / n_docs) or 1.0
+        scores: dict[int, float] = {}
+        for term in set(_tokenize(query)):
+            plist = self.postings.get(term)
+            if not plist:
+                continue
+            idf = math.log(1 + (n_docs - len(plist) + 0.5) / (len(plist) + 0.5))
+            for i, tf in plist:
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * self.doc_lens[i] / avgdl)
+                scores[i] = scores.get(i, 0.0) + idf * tf * (BM25_K1 + 1) / (tf + norm)
+        return heapq.nsmallest(k, scores.items(), key=lambda item: (-item[1], item[0]))
+
+    def to_dict(self) -> dict:
+        return {"postings": {t: [list(p) for p in plist] for t, plist in self.postings.items()}, "doc_lens": self.doc_lens}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "DocIndex":
+        return cls(
+            postings={t: [(int(i), int(tf)) for i, tf in plist] for t, plist in data.get("postings", {}).items()},
+            doc_lens=[int(n) for n in data.get("doc_lens", [])],
+        )
+
+
 @dataclass
 class DocContext:
-    """Ingested PDF: full markdown and chunks for querying."""
+    """Ingested PDF: full markdown and chunks for querying (index built from chunks if not given)."""
 
     path: str
     markdown: str
     chunks: list[str] = field(default_factory=list)
+    index: DocIndex | None = field(default=None, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        if self.index is None or len(self.index.doc_lens) != len(self.chunks):
+            self.index = DocIndex.build(self.chunks)
 
-def _chunk_markdown(markdown: str) -> list[str]:
-    """Chunk by paragraphs and section boundaries; merge/split by size."""
-    # Split on double newline (paragraphs) or header lines (# ...)
-    raw = re.split(r"\n(?=\s*#+\s|\n)", markdown)
-    chunks: list[str] = []
-    current: list[str] = []
+    def to_dict(self) -> dict:
+        """JSON-safe form (graph state, conversion cache)."""
+        return {"path": self.path, "markdown": self.markdown, "chunks": self.chunks, "index": self.index.to_dict()}
 
-    def flush():
-        nonlocal current
-        if current:
-            text = "\n\n".join(current).strip()
-            if len(text) > CHUNK_MAX_CHARS:
-                # Split by sentence or mid-paragraph
-                while len(text) > CHUNK_MAX_CHARS:
-                    head = text[:CHUNK_MAX_CHARS]
-                    last_break = max(head.rfind("\n\n"), head.rfind(". "))
-                    if last_break > CHUNK_MIN_CHARS:
-                        chunks.append(text[: last_break + 1].strip())
-                        text = text[last_break + 1 :].lstrip()
-                    else:
-                        chunks.append(text[:CHUNK_MAX_CHARS])
-                        text = text[CHUNK_MAX_CHARS:].lstrip()
-            if text:
-                chunks.append(text)
-            current = []
+    @classmethod
+    def from_dict(cls, data: dict, path: str | None = None) -> "DocContext":
+        raw_index = data.get("index")
+        return cls(
+            path=path or data.get("path", ""),
+            markdown=data.get("markdown", ""),
+            chunks=data.get("chunks", []),
+            index=DocIndex.from_dict(raw_index) if isinstance(raw_index, dict) else None,
+        )
+
+
+# Block boundaries: a newline followed by a blank line or a markdown header line.
+_BLOCK_SPLIT = re.compile(r"\n(?=\s*#+\s|\n)")
+
+
+def _trailing_run_start(buf: str, floor: int) -> int:
+    """Start of the trailing run of whitespace/'#' in buf (not scanning below floor)."""
+    m = len(buf)
+    while m > floor and (buf[m - 1].isspace() or buf[m - 1] == "#"):
+        m -= 1
+    return m
+
+
+def iter_markdown_blocks(pieces: Iterable[str]) -> Iterator[str]:
+    """Yield the blocks re.split(_BLOCK_SPLIT, "".join(pieces)) would return, incrementally.
+
+    Whether a newline splits depends only on the text after it up to the first
+    character that is neither whitespace nor '#'. So every newline before the
+    buffer's trailing whitespace/'#' run is final and can be emitted; only that
+    run (plus the current unfinished block) is carried into the next piece.
+    """
+    buf = ""
+    scan_from = 0  # newlines before this offset have already been ruled out
+    for piece in pieces:
+        if not piece:
+            continue
+        buf += piece
+        m = _trailing_run_start(buf, scan_from)
+        last = 0
+        for match in _BLOCK_SPLIT.finditer(buf, scan_from):
+            i = match.start()
+            if i >= m:
+                break
+            yield buf[last:i]
+            last = i + 1
+        buf = buf[last:]
+        scan_from = max(m - last, 0)
+    yield from _BLOCK_SPLIT.split(buf)
 
-    for block in raw:
+
+def _split_oversized(text: str) -> Iterator[str]:
+    """Split one flushed chunk into pieces of at most CHUNK_MAX_CHARS.
+
+    Prefers paragraph or sentence breaks past CHUNK_MIN_CHARS; walks an offset
+    instead of re-slicing the remainder so long texts stay linear.
+    """
+    pos, n = 0, len(text)
+    while n - pos > CHUNK_MAX_CHARS:
+        end = pos + CHUNK_MAX_CHARS
+        para, sent = text.rfind("\n\n", pos, end), text.rfind(". ", pos, end)
+        last_break = max(para - pos if para >= 0 else -1, sent - pos if sent >= 0 else -1)
+        if last_break > CHUNK_MIN_CHARS:
+            yield text[pos : pos + last_break + 1].strip()
+            pos += last_break + 1
+        else:
+            yield text[pos:end]
+            pos = end
+        while pos < n and text[pos].isspace():
+            pos += 1
+    if pos < n:
+        yield text[pos:]
+
+
+def iter_chunks(pieces: Iterable[str]) -> Iterator[str]:
+    """Chunk streamed markdown by paragraphs and section boundaries; merge/split by size.
+
+    Keeps a running length of the pending blocks, so each block is counted once.
+    The chunker's own working set is bounded by the chunk size; the chunks it
+    yields are the caller's to keep or drop.
+    """
+    current: list[str] = []
+    current_len = 0
+    for block in iter_markdown_blocks(pieces):
         block = block.strip()
         if not block:
             continue
         current.append(block)
-        if sum(len(s) for s in current) >= CHUNK_MAX_CHARS:
-            flush()
+        current_len += len(block)
+        if current_len >= CHUNK_MAX_CHARS:
+            yield from _split_oversized("\n\n".join(current).strip())
+            current, current_len = [], 0
+    if current:
+        yield from _split_oversized("\n\n".join(current).strip())
+
+
+def _chunk_markdown(markdown: str) -> list[str]:
+    """Chunk by paragraphs and section boundaries; merge/split by size."""
+    return list(iter_chunks([markdown]))
+
+
+# -----------------------------------------------------------------------------
+# Conversion cache: PDF sha256 + extraction mode + pipeline options -> markdown,
+# chunks and exported images, so unchanged / shared-template PDFs skip conversion.
+# -----------------------------------------------------------------------------
+
+PDF_CACHE_SUBDIR = "pdf-conversions"
+PDF_CACHE_DEFAULT_MAX_MB = 1024
+_PDF_CACHE_VERSION = 2  # 2: picture/table exports carry -p<page>
+_PDF_CACHE_DOC = "doc.json"
+_PDF_CACHE_IMAGES = "images"
+
 
-    flush()
-    return chunks
+def _pdf_cache_enabled() -> bool:
+    """Conversion cache is on unless AUDITOR_NO_PDF_CACHE=1."""
+    import os
+
+    return os.environ.get("AUDITOR_NO_PDF_CACHE", "").strip() not in ("1", "true", "yes")
+
+
+def _pdf_cache_dir() -> Path:
+    from src.disk_cache import cache_root
+
+    return cache_root() / PDF_CACHE_SUBDIR
+
+
+def _pdf_cache_lock_path(entry: Path) -> Path:
+    """Lock files sit beside the entries dir so evicting an entry never deletes its lock."""
+    return entry.parent.parent / (PDF_CACHE_SUBDIR + "-locks") / f"{entry.name}.lock"
+
+
+def _file_sha256(path: Path) -> str:
+    import hashlib
+
+    h = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for block in iter(lambda: fh.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _pdf_cache_key(path: Path, use_full: bool) -> str:
+    """sha256(pdf bytes) + mode + everything else that changes the cached output."""
+    import hashlib
+    import json
+
+    from src.tools.pdf_raster import raster_dpi, raster_max_pages, raster_pdf_enabled
+
+    if use_full:
+        mode = {"mode": "docling", "pipeline": FULL_PIPELINE_SETTINGS}
+    elif raster_pdf_enabled():
+        mode = {"mode": "pypdf", "raster": {"dpi": raster_dpi(), "max_pages": raster_max_pages()}}
+    else:
+        mode = {"mode": "pypdf"}
+    signature = json.dumps(
+        {**mode, "chunk": [CHUNK_MAX_CHARS, CHUNK_MIN_CHARS], "version": _PDF_CACHE_VERSION},
+        sort_keys=True,
+    )
+    return f"{_file_sha256(path)}-{hashlib.sha256(signature.encode()).hexdigest()[:16]}"
+
+
+def _pdf_cache_load(
+    path: Path,
+    use_full: bool,
+    images_into: Path | None = None,
+) -> tuple[DocContext, list[str]] | None:
+    """Cached (DocContext, image store handles) for path, or None on miss.
+
+    With images_into, cached images are hardlinked (or copied) there, registered
+    in the image store by path, and the entry only counts as a hit if images
+    were stored with it.
+    """
+    import json
+    import os
+    import shutil
+
+    from src.disk_cache import entry_lock, touch_entry
+    from src.image_store import get_image_store
+
+    if not _pdf_cache_enabled():
+        return None
+    try:
+        key = _pdf_cache_key(path, use_full)
+    except OSError:
+        return None
+    entry = _pdf_cache_dir() / key
+    with entry_lock(_pdf_cache_lock_path(entry)):
+        try:
+            data = json.loads((entry / _PDF_CACHE_DOC).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        image_names = data.get("images")
+        image_paths: list[str] = []
+        if images_into is not None:
+            if image_names is None:
+                return None
+            store = get_image_store()
+            for name in image_names:
+                src, dst = entry / _PDF_CACHE_IMAGES / name, images_into / name
+                try:
+                    os.link(src, dst)
+                except OSError:
+                    try:
+                        shutil.copy2(src, dst)
+                    except OSError:
+                        return None
+                image_paths.append(store.put_file(dst))
+        touch_entry(entry)
+    logger.info("PDF: conversion cache hit (%s).", key[:12])
+    return DocContext.from_dict(data, path=str(path)), image_paths
+
+
+def _pdf_cache_store(
+    path: Path,
+    use_full: bool,
+    context: DocContext,
+    image_paths: list[str] | None = None,
+) -> None:
+    """Store a successful conversion. image_paths are store handles (or paths); None records
+    that images were not exported."""
+    import json
+    import shutil
+
+    from src.disk_cache import PARTIAL_SUFFIX, entry_lock, env_megabytes, evict_lru, touch_entry
+    from src.image_store import get_image_store
+
+    if not _pdf_cache_enabled() or not (context.markdown or image_paths):
+        return
+    try:
+        key = _pdf_cache_key(path, use_full)
+        cache_dir = _pdf_cache_dir()
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        entry = cache_dir / key
+        with entry_lock(_pdf_cache_lock_path(entry)):
+            partial = cache_dir / f"{key}{PARTIAL_SUFFIX}"
+            shutil.rmtree(partial, ignore_errors=True)
+            (partial / _PDF_CACHE_IMAGES).mkdir(parents=True)
+            names: list[str] | None = None
+            if image_paths is not None:
+                store = get_image_store()
+                names = []
+                for ref in image_paths:
+                    name = store.name(ref)
+                    store.write_to(ref, partial / _PDF_CACHE_IMAGES / name)
+                    names.append(name)
+            doc = {**context.to_dict(), "images": names}
+            (partial / _PDF_CACHE_DOC).write_text(json.dumps(doc), encoding="utf-8")
+            shutil.rmtree(entry, ignore_errors=True)
+            partial.rename(entry)
+            touch_entry(entry)
+        evict_lru(
+            cache_dir,
+            env_megabytes("AUDITOR_PDF_CACHE_MAX_MB", PDF_CACHE_DEFAULT_MAX_MB),
+            _pdf_cache_lock_path,
+            keep={key},
+        )
+    except OSError as e:
+        logger.warning("PDF: could not write conversion cache: %s", e)
 
 
 def ingest_pdf(path: str) -> DocContext:
@@ -133,25 +504,28 @@ def ingest_pdf(path: str) -> DocContext:
     if not path_obj.exists():
         raise FileNotFoundError(f"PDF not found: {path}")
 
-    import os
-    use_full = os.environ.get("AUDITOR_FULL_PDF", "").strip() in ("1", "true", "yes")
+    use_full = _use_full_pdf()
+    cached = _pdf_cache_load(path_obj, use_full)
+    if cached is not None:
+        return cached[0]
     if not use_full:
+        from src.tools.pdf_raster import raster_pdf_enabled
+
         logger.info("Doc: extracting PDF text with pypdf (no Docling).")
-        markdown = _pdf_to_markdown_pypdf(str(path_obj))
-        chunks = _chunk_markdown(markdown)
-        return DocContext(path=str(path_obj), markdown=markdown, chunks=chunks)
-
-    from docling.datamodel.base_models import InputFormat
-    from docling.document_converter import DocumentConverter, PdfFormatOption
-    pipeline_options = _full_pipeline_options()
-    converter = DocumentConverter(
-        format_options={InputFormat.PDF: PdfFormatOption(pipeline_options=pipeline_options)}
-    )
+        markdown, chunks = _pdf_to_markdown_and_chunks_pypdf(str(path_obj))
+        context = DocContext(path=str(path_obj), markdown=markdown, chunks=chunks)
+        # In raster mode the entry's page images weren't rendered here, so don't record "no images".
+        _pdf_cache_store(path_obj, use_full, context, image_paths=None if raster_pdf_enabled() else [])
+        return context
+
+    import tempfile
+
+    from src.tools.docling_worker import get_worker
+
     logger.info("Doc: converting PDF with Docling (timeout=%ds)...", PDF_CONVERT_TIMEOUT_SEC)
     try:
-        with ThreadPoolExecutor(max_workers=1) as ex:
-            future = ex.submit(converter.convert, str(path_obj))
-            result = future.result(timeout=PDF_CONVERT_TIMEOUT_SEC)
+        with tempfile.TemporaryDirectory(prefix="docling_") as out_dir:
+            markdown, _ = get_worker().convert_to_files(path_obj, out_dir, images=False)
     except FuturesTimeoutError:
         logger.warning("Doc: PDF conversion timed out after %ds.", PDF_CONVERT_TIMEOUT_SEC)
         raise RuntimeError(
@@ -159,126 +533,77 @@ def ingest_pdf(path: str) -> DocContext:
             "Try a smaller PDF or increase CPU; Docling can be slow on CPU."
         ) from None
     logger.info("Doc: PDF conversion done.")
-    markdown = result.document.export_to_markdown()
     chunks = _chunk_markdown(markdown)
-    return DocContext(path=str(path_obj), markdown=markdown, chunks=chunks)
+    context = DocContext(path=str(path_obj), markdown=markdown, chunks=chunks)
+    _pdf_cache_store(path_obj, use_full, context)
+    return context
 
 
 def convert_pdf_once(path: str) -> tuple[DocContext, list[str], Path | None]:
-    """Convert PDF once with timeout; return DocContext, image paths, and cleanup dir.
+    """Convert PDF once with timeout; return DocContext, image store handles, and cleanup dir.
 
-    Uses minimal pipeline by default (text-only, no OCR/layout) to avoid stall.
-    Set AUDITOR_FULL_PDF=1 for page/picture images (Vision diagram analysis).
-    Caller must shutil.rmtree(cleanup_path) when done if cleanup_path is not None.
+    Uses pypdf by default (text-only, no OCR/layout) to avoid stall.
+    Set AUDITOR_FULL_PDF=1 for Docling page/picture images (Vision diagram analysis),
+    or AUDITOR_RASTER_PDF=1 to render only pages with graphics (src.tools.pdf_raster).
+    Caller must release the handles (src.image_store) and shutil.rmtree(cleanup_path)
+    when done if cleanup_path is not None.
     """
     path_obj = Path(path).resolve()
     if not path_obj.exists():
         raise FileNotFoundError(f"PDF not found: {path}")
 
-    import os
     import tempfile
     tmp_dir = Path(tempfile.mkdtemp(prefix="pdf_preprocess_"))
-    image_paths: list[str] = []
+    images: list[str] = []
     doc_context: DocContext | None = None
 
-    use_full = os.environ.get("AUDITOR_FULL_PDF", "").strip() in ("1", "true", "yes")
+    use_full = _use_full_pdf()
+    cached = _pdf_cache_load(path_obj, use_full, images_into=tmp_dir)
+    if cached is not None:
+        doc_context, images = cached
+        return doc_context, images, tmp_dir
     if not use_full:
-        logger.info("PDF: extracting text with pypdf (no Docling); no images.")
-        markdown = _pdf_to_markdown_pypdf(str(path_obj))
-        chunks = _chunk_markdown(markdown)
+        from src.tools.pdf_raster import raster_pdf_enabled, rasterize_graphic_pages
+
+        markdown, chunks = _pdf_to_markdown_and_chunks_pypdf(str(path_obj))
         doc_context = DocContext(path=str(path_obj), markdown=markdown, chunks=chunks)
-        return doc_context, image_paths, tmp_dir
+        if raster_pdf_enabled():
+            logger.info("PDF: extracting text with pypdf; rendering pages with graphics (no Docling).")
+            images = rasterize_graphic_pages(path_obj)
+        else:
+            logger.info("PDF: extracting text with pypdf (no Docling); no images.")
+        _pdf_cache_store(path_obj, use_full, doc_context, image_paths=images)
+        return doc_context, images, tmp_dir
+
+    from src.image_store import get_image_store
+    from src.tools.docling_worker import DoclingWorkerError, docling_available, get_worker
+
+    if not docling_available():
+        return DocContext(path=str(path_obj), markdown="", chunks=[]), images, tmp_dir
 
-    try:
-        from docling.datamodel.base_models import InputFormat
-        from docling.document_converter import DocumentConverter, PdfFormatOption
-    except ImportError:
-        return DocContext(path=str(path_obj), markdown="", chunks=[]), image_paths, tmp_dir
-
-    pipeline_options = _full_pipeline_options()
-    converter = DocumentConverter(
-        format_options={InputFormat.PDF: PdfFormatOption(pipeline_options=pipeline_options)}
-    )
     logger.info("PDF: single conversion with Docling (timeout=%ds)...", PDF_CONVERT_TIMEOUT_SEC)
     try:
-        with ThreadPoolExecutor(max_workers=1) as ex:
-            future = ex.submit(converter.convert, str(path_obj))
-            result = future.result(timeout=PDF_CONVERT_TIMEOUT_SEC)
+        markdown, files = get_worker().convert_to_files(path_obj, tmp_dir)
     except FuturesTimeoutError:
         logger.warning("PDF: conversion timed out after %ds.", PDF_CONVERT_TIMEOUT_SEC)
-        return DocContext(path=str(path_obj), markdown="", chunks=[]), image_paths, tmp_dir
+        return DocContext(path=str(path_obj), markdown="", chunks=[]), [], tmp_dir
+    except (DoclingWorkerError, ImportError) as e:
+        logger.warning("PDF: conversion failed: %s", e)
+        return DocContext(path=str(path_obj), markdown="", chunks=[]), [], tmp_dir
 
     logger.info("PDF: conversion done, building markdown and image list.")
-    doc = result.document
-    markdown = doc.export_to_markdown()
+    store = get_image_store()
+    images = [store.put_file(f) for f in files]  # worker output stays on disk in tmp_dir
     chunks = _chunk_markdown(markdown)
     doc_context = DocContext(path=str(path_obj), markdown=markdown, chunks=chunks)
 
-    doc_name = path_obj.stem
-    pages = getattr(doc, "pages", None)
-    if pages:
-        for page_no, page in pages.items():
-            img = getattr(page, "image", None)
-            if img is not None and hasattr(img, "pil_image"):
-                out = tmp_dir / f"{doc_name}-page-{page_no}.png"
-                try:
-                    img.pil_image.save(str(out), format="PNG")
-                    image_paths.append(str(out))
-                except Exception:
-                    pass
-    PictureItem = TableItem = None
-    try:
-        from docling.document_core import PictureItem, TableItem
-    except ImportError:
-        try:
-            from docling_core.types.doc import PictureItem, TableItem  # type: ignore
-        except ImportError:
-            pass
-    if PictureItem is not None and TableItem is not None:
-        it = getattr(doc, "iterate_items", None)
-        if it is not None:
-            pic_count = table_count = 0
-            for element, _ in (it() if callable(it) else (it or [])):
-                if isinstance(element, TableItem):
-                    table_count += 1
-                    out = tmp_dir / f"{doc_name}-table-{table_count}.png"
-                    try:
-                        im = element.get_image(doc)
-                        if im is not None:
-                            im.save(str(out), "PNG")
-                            image_paths.append(str(out))
-                    except Exception:
-                        pass
-                if isinstance(element, PictureItem):
-                    pic_count += 1
-                    out = tmp_dir / f"{doc_name}-picture-{pic_count}.png"
-                    try:
-                        im = element.get_image(doc)
-                        if im is not None:
-                            im.save(str(out), "PNG")
-                            image_paths.append(str(out))
-                    except Exception:
-                        pass
-
-    return doc_context, image_paths, tmp_dir
+    _pdf_cache_store(path_obj, use_full, doc_context, images)
+    return doc_context, images, tmp_dir
 
 
-def query_pdf(context: DocContext, question: str) -> list[str]:
-    """Return relevant excerpts only (chunks that match the question).
-
-    Uses simple keyword overlap; for production, use embeddings + similarity.
-    """
-    question_lower = question.lower()
-    words = {w for w in re.split(r"\W+", question_lower) if len(w) > 1}
-    if not words:
-        return []
-
-    excerpts: list[str] = []
-    for chunk in context.chunks:
-        chunk_lower = chunk.lower()
-        if any(w in chunk_lower for w in words):
-            excerpts.append(chunk)
-    return excerpts
+def query_pdf(context: DocContext, question: str, k: int = 5) -> list[str]:
+    """Return the k most relevant excerpts (BM25 over the context's chunk index), best first."""
+    return [context.chunks[i] for i, _score in context.index.search(question, k)]
 
 
 # -----------------------------------------------------------------------------
@@ -294,15 +619,63 @@ FILE_PATH_PATTERN = re.compile(
 NON_REPO_PATH_PREFIXES = ("home/", "users/", "tmp/", "temp/", "downloads/", "desktop/", "/tmp", "/home", "/users")
 
 
+class _SuffixNode:
+    __slots__ = ("children", "terminal", "below")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _SuffixNode] = {}
+        self.terminal = False  # a repo path ends exactly here
+        self.below = 0  # repo paths passing through (strictly longer than this suffix)
+
+
+class PathSuffixIndex:
+    """Trie of repo paths keyed by reversed path components (a suffix index).
+
+    matches(p) answers "is p a repo path, does some repo path end with /p, or
+    does p end with /<repo path>" in time proportional to p's depth, instead of
+    scanning every repo path.
+    """
+
+    def __init__(self, repo_paths: Iterable[str] = ()) -> None:
+        self._root = _SuffixNode()
+        for p in repo_paths:
+            self.add(p)
+
+    def add(self, path: str) -> None:
+        node = self._root
+        for part in reversed(_normalize_path(path).split("/")):
+            node.below += 1
+            node = node.children.setdefault(part, _SuffixNode())
+        node.terminal = True
+
+    def matches(self, path: str) -> bool:
+        node = self._root
+        for part in reversed(_normalize_path(path).split("/")):
+            node = node.children.get(part)
+            if node is None:
+                return False
+            if node.terminal:
+                return True  # exact, or path ends with /<repo path>
+        return node.below > 0  # some repo path ends with /<path>
+
+
+def _looks_non_repo(path: str) -> bool:
+    n = path.replace("\\", "/").strip().lower()
+    return any(n.startswith(prefix) or prefix in n for prefix in NON_REPO_PATH_PREFIXES)
+
+
 def extract_file_paths(text: str) -> list[str]:
     """Extract file paths mentioned in report (e.g. src/tools/ast_parser.py).
     Excludes paths that look like local/absolute (home/, Downloads/, etc.) so they are not counted as hallucinated."""
     raw = list(dict.fromkeys(FILE_PATH_PATTERN.findall(text)))
-    normalized = [p.replace("\\", "/").strip().lower() for p in raw]
-    return [
-        p for p, n in zip(raw, normalized)
-        if not any(n.startswith(prefix) or prefix in n for prefix in NON_REPO_PATH_PREFIXES)
-    ]
+    return [p for p in raw if not _looks_non_repo(p)]
+
+
+def extract_repo_file_paths(text: str, index: PathSuffixIndex) -> list[str]:
+    """Like extract_file_paths, but keeps local-looking paths that do exist in the repo
+    (e.g. src/temp/cache.py), as answered by index."""
+    raw = list(dict.fromkeys(FILE_PATH_PATTERN.findall(text)))
+    return [p for p in raw if not _looks_non_repo(p) or index.matches(p)]
 
 
 class PathExtractionResult(BaseModel):
@@ -316,32 +689,25 @@ class PathExtractionResult(BaseModel):
 def cross_reference_paths(
     doc_paths: list[str],
     repo_paths: list[str] | set[str],
+    index: PathSuffixIndex | None = None,
 ) -> PathExtractionResult:
     """Classify mentioned paths as verified (in repo) or hallucinated.
 
-    Normalize for comparison: strip leading ./ and use forward slashes.
+    Normalize for comparison: strip leading ./ and use forward slashes. A path
+    also verifies on a suffix match either way (doc "src/state.py" vs repo
+    "state.py"), answered by a PathSuffixIndex (built from repo_paths if not given).
     """
-    repo_set = {
-        _normalize_path(p) for p in (repo_paths if isinstance(repo_paths, list) else list(repo_paths))
-    }
+    if index is None:
+        index = PathSuffixIndex(repo_paths)
     mentioned = list(dict.fromkeys(doc_paths))
     verified: list[str] = []
     hallucinated: list[str] = []
 
     for p in mentioned:
-        norm = _normalize_path(p)
-        if norm in repo_set:
+        if index.matches(p):
             verified.append(p)
         else:
-            # Partial match: e.g. doc "src/state.py" vs repo "state.py"
-            match = any(
-                norm == r or norm.endswith("/" + r) or r.endswith("/" + norm)
-                for r in repo_set
-            )
-            if match:
-                verified.append(p)
-            else:
-                hallucinated.append(p)
+            hallucinated.append(p)
 
     return PathExtractionResult(mentioned=mentioned, verified=verified, hallucinated=hallucinated)
 
@@ -364,6 +730,83 @@ THEORETICAL_TERMS = [
 ]
 
 
+# Quoted phrases in a rubric instruction: "... these specific terms: 'Dialectical Synthesis', ..."
+_QUOTED_TERM = re.compile(r"'([^']{2,80})'")
+
+
+def terms_from_instruction(text: str) -> list[str]:
+    """Terms quoted in rubric text; 'A / B' also yields A and B (as in THEORETICAL_TERMS).
+
+    When the text introduces a list ("...terms: 'A', 'B'."), only that sentence is used,
+    so later quoted labels (e.g. 'Keyword Dropping') are not mistaken for terms.
+    """
+    text = text or ""
+    marker = text.lower().find("terms:")
+    if marker >= 0:
+        text = text[marker:]
+        end = text.find(". ")
+        text = text if end < 0 else text[: end + 1]
+    terms: list[str] = []
+    for phrase in _QUOTED_TERM.findall(text):
+        phrase = phrase.strip()
+        terms.append(phrase)
+        if " / " in phrase:
+            terms.extend(p.strip() for p in phrase.split(" / ") if p.strip())
+    return list(dict.fromkeys(terms))
+
+
+class MultiTermMatcher:
+    """Aho-Corasick automaton: every term occurrence in one pass over the text.
+
+    Terms are matched case-insensitively against text the caller has already
+    lowercased; overlapping terms (Fan-In inside Fan-In / Fan-Out) are all reported.
+    """
+
+    def __init__(self, terms: Iterable[str]) -> None:
+        self.terms: list[str] = [t for t in dict.fromkeys(terms) if t]
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[list[int]] = [[]]
+        for idx, term in enumerate(self.terms):
+            node = 0
+            for ch in term.lower():
+                nxt = self._goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[node][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                node = nxt
+            self._out[node].append(idx)
+        # Breadth-first failure links; each node inherits its fallback's outputs.
+        queue = list(self._goto[0].values())
+        for node in queue:
+            for ch, child in self._goto[node].items():
+                f = self._fail[node]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                fallback = self._goto[f].get(ch, 0)
+                self._fail[child] = fallback if fallback != child else 0
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+                queue.append(child)
+
+    def iter_matches(self, text: str) -> Iterator[tuple[int, int]]:
+        """Yield (term index, end offset) for every occurrence in lowercased text."""
+        goto, fail, out = self._goto, self._fail, self._out
+        node = 0
+        for pos, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for idx in out[node]:
+                yield idx, pos + 1
+
+    def found(self, text: str) -> set[int]:
+        """Indices of terms occurring in lowercased text."""
+        return {idx for idx, _end in self.iter_matches(text)}
+
+
 class TheoreticalDepthResult(BaseModel):
     """Structured result for Theoretical Depth: terms found and excerpts."""
 
@@ -372,24 +815,33 @@ class TheoreticalDepthResult(BaseModel):
     is_substantive: bool = False  # True if excerpts explain, not just mention
 
 
-def detect_theoretical_depth(context: DocContext) -> TheoreticalDepthResult:
+def detect_theoretical_depth(context: DocContext, terms: list[str] | None = None) -> TheoreticalDepthResult:
     """Detect theoretical depth: search for rubric terms and return excerpts.
 
-    Marks as substantive if excerpts contain explanation cues (e.g. "means",
-    "refers to") or are sufficiently long.
+    terms defaults to THEORETICAL_TERMS (context_builder derives them from the
+    rubric). One matcher pass over the document, then over chunks until every
+    found term has its first chunk. Marks as substantive if excerpts contain
+    explanation cues (e.g. "means", "refers to") or are sufficiently long.
     """
+    matcher = MultiTermMatcher(THEORETICAL_TERMS if terms is None else terms)
+    in_doc = matcher.found(context.markdown.lower())
+    first_chunk: dict[int, int] = {}
+    for ci, chunk in enumerate(context.chunks):
+        if in_doc <= first_chunk.keys():
+            break
+        for idx in matcher.found(chunk.lower()):
+            first_chunk.setdefault(idx, ci)
+
     terms_found: list[str] = []
     excerpts: list[str] = []
     explanation_cues = ("means", "refers to", "is when", "describes", "involves", "allows")
 
-    for term in THEORETICAL_TERMS:
-        if term.lower() not in context.markdown.lower():
+    for idx, term in enumerate(matcher.terms):
+        if idx not in in_doc:
             continue
         terms_found.append(term)
-        for chunk in context.chunks:
-            if term.lower() in chunk.lower():
-                excerpts.append(chunk[:800])
-                break
+        if idx in first_chunk:
+            excerpts.append(context.chunks[first_chunk[idx]][:800])
 
     is_substantive = any(
         cue in " ".join(excerpts).lower() for cue in explanation_cues
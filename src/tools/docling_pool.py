@@ -0,0 +1,228 @@
+"""Long-lived Docling converters, one per pipeline-options profile.
+
+Building a DocumentConverter and its pipeline loads layout/OCR models, which
+dominates conversion time for small PDFs. Converters here are built once per
+profile and reused across audits by the process that hosts them (the
+src.tools.docling_worker child). warm_up() preloads models ahead of the first
+PDF; health() reports per-profile state and reset() drops a converter so the
+next call rebuilds it.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+from src.tools.doc_tools import FULL_PIPELINE_SETTINGS, PDF_CONVERT_TIMEOUT_SEC
+
+logger = logging.getLogger(__name__)
+
+PROFILE_FULL = "full"  # page + picture images (Vision), OCR/layout on
+PROFILE_MINIMAL = "minimal"  # backend text only, no OCR/tables/images
+
+
+def _full_pipeline_options():
+    """Full pipeline with page/picture images (for Vision); can stall on CPU."""
+    from docling.datamodel.pipeline_options import PdfPipelineOptions
+    opts = PdfPipelineOptions()
+    for name, value in FULL_PIPELINE_SETTINGS.items():
+        setattr(opts, name, value)
+    opts.document_timeout = float(PDF_CONVERT_TIMEOUT_SEC)
+    return opts
+
+
+def _minimal_pipeline_options():
+    """Return PdfPipelineOptions that avoid heavy OCR/layout."""
+    from docling.datamodel.pipeline_options import PdfPipelineOptions
+    opts = PdfPipelineOptions()
+    opts.force_backend_text = True
+    opts.do_ocr = False
+    opts.do_table_structure = False
+    opts.generate_page_images = False
+    opts.generate_picture_images = False
+    opts.document_timeout = float(PDF_CONVERT_TIMEOUT_SEC)
+    return opts
+
+
+PROFILES: dict[str, Callable[[], object]] = {
+    PROFILE_FULL: _full_pipeline_options,
+    PROFILE_MINIMAL: _minimal_pipeline_options,
+}
+
+
+@dataclass
+class _PoolEntry:
+    converter: object
+    lock: threading.Lock  # Docling pipelines are not documented as thread-safe; one convert at a time
+    warmed: bool = False
+    conversions: int = 0
+    failures: int = 0
+    last_error: str = ""
+    last_seconds: float = 0.0
+
+
+_pool: dict[str, _PoolEntry] = {}
+_pool_lock = threading.Lock()
+
+
+def _build_converter(profile: str):
+    from docling.datamodel.base_models import InputFormat
+    from docling.document_converter import DocumentConverter, PdfFormatOption
+
+    if profile not in PROFILES:
+        raise ValueError(f"Unknown Docling profile {profile!r}. Supported: {', '.join(PROFILES)}")
+    return DocumentConverter(
+        format_options={InputFormat.PDF: PdfFormatOption(pipeline_options=PROFILES[profile]())}
+    )
+
+
+def _entry(profile: str) -> _PoolEntry:
+    with _pool_lock:
+        entry = _pool.get(profile)
+        if entry is None:
+            entry = _pool[profile] = _PoolEntry(converter=_build_converter(profile), lock=threading.Lock())
+        return entry
+
+
+def get_converter(profile: str = PROFILE_FULL):
+    """Pooled DocumentConverter for profile (built on first use). Raises ImportError without Docling."""
+    return _entry(profile).converter
+
+
+def warm_up(profiles: tuple[str, ...] = (PROFILE_FULL,)) -> dict[str, bool]:
+    """Build converters and load their PDF pipeline models now; returns profile -> success."""
+    status: dict[str, bool] = {}
+    for profile in profiles:
+        try:
+            entry = _entry(profile)
+            with entry.lock:
+                if not entry.warmed:
+                    from docling.datamodel.base_models import InputFormat
+
+                    start = time.monotonic()
+                    init = getattr(entry.converter, "initialize_pipeline", None)
+                    if callable(init):
+                        init(InputFormat.PDF)
+                    entry.warmed = True
+                    logger.info("Docling: %s pipeline warmed in %.1fs.", profile, time.monotonic() - start)
+            status[profile] = True
+        except Exception as e:
+            logger.warning("Docling: warm-up of %s pipeline failed: %s", profile, e)
+            status[profile] = False
+    return status
+
+
+def health() -> dict[str, dict]:
+    """Per-profile pool state: warmed, busy, conversion/failure counts, last error and duration."""
+    with _pool_lock:
+        entries = dict(_pool)
+    return {
+        profile: {
+            "warmed": e.warmed,
+            "busy": e.lock.locked(),
+            "conversions": e.conversions,
+            "failures": e.failures,
+            "last_error": e.last_error,
+            "last_seconds": round(e.last_seconds, 2),
+        }
+        for profile, e in entries.items()
+    }
+
+
+def reset(profile: str | None = None) -> None:
+    """Drop one profile's converter (or all); the next use rebuilds it."""
+    with _pool_lock:
+        if profile is None:
+            _pool.clear()
+        else:
+            _pool.pop(profile, None)
+
+
+def convert(path: str | Path, profile: str = PROFILE_FULL):
+    """Convert path with the pooled converter, in the calling process.
+
+    No timeout here: a Docling convert can't be interrupted from a thread. Callers go
+    through src.tools.docling_worker, which runs this in a child it can kill.
+    """
+    entry = _entry(profile)
+    with entry.lock:
+        start = time.monotonic()
+        try:
+            result = entry.converter.convert(str(path))
+        except Exception as e:
+            entry.failures += 1
+            entry.last_error = str(e)
+            raise
+        finally:
+            entry.last_seconds = time.monotonic() - start
+        entry.conversions += 1
+        entry.warmed = True
+        return result
+
+
+# -----------------------------------------------------------------------------
+# Image export (page images, tables, pictures) shared by doc_tools and vision_tools
+# -----------------------------------------------------------------------------
+
+
+def export_document_images(doc, out_dir: Path, doc_name: str) -> list[str]:
+    """Save a converted document's page, table and picture images as PNGs in out_dir.
+
+    Names: <doc>-page-<n>.png, <doc>-picture-<k>-p<n>.png, <doc>-table-<k>-p<n>.png
+    (-p<n> is the source page, omitted when Docling has no provenance).
+    """
+    image_paths: list[str] = []
+
+    # Page images
+    pages = getattr(doc, "pages", None)
+    if pages:
+        for page_no, page in pages.items():
+            img = getattr(page, "image", None)
+            if img is not None and hasattr(img, "pil_image"):
+                out = out_dir / f"{doc_name}-page-{page_no}.png"
+                try:
+                    img.pil_image.save(str(out), format="PNG")
+                    image_paths.append(str(out))
+                except Exception:
+                    pass
+
+    # Figures and tables via iterate_items
+    PictureItem = TableItem = None
+    try:
+        from docling.document_core import PictureItem, TableItem
+    except ImportError:
+        try:
+            from docling_core.types.doc import PictureItem, TableItem  # type: ignore
+        except ImportError:
+            pass
+
+    if PictureItem is not None and TableItem is not None:
+        it = getattr(doc, "iterate_items", None)
+        if it is not None:
+            counts = {"table": 0, "picture": 0}
+            for element, _ in (it() if callable(it) else (it or [])):
+                if isinstance(element, TableItem):
+                    kind = "table"
+                elif isinstance(element, PictureItem):
+                    kind = "picture"
+                else:
+                    continue
+                counts[kind] += 1
+                # "-p<page>" suffix: image_prep drops a page image when a crop from it survives
+                prov = getattr(element, "prov", None) or []
+                page_no = getattr(prov[0], "page_no", None) if prov else None
+                suffix = f"-p{page_no}" if page_no is not None else ""
+                out = out_dir / f"{doc_name}-{kind}-{counts[kind]}{suffix}.png"
+                try:
+                    im = element.get_image(doc)
+                    if im is not None:
+                        im.save(str(out), "PNG")
+                        image_paths.append(str(out))
+                except Exception:
+                    pass
+
+    return image_paths
@@ -0,0 +1,249 @@
+"""Process-isolated Docling conversion with a hard deadline and a memory cap.
+
+A Docling conversion can't be interrupted from a thread: after a timeout the
+runaway convert keeps a core pinned (and memory growing) until it finishes on
+its own. Conversions here run in a long-lived child process that hosts the warm
+converter pool (src.tools.docling_pool). The parent polls the child's RSS via
+/proc while it waits and SIGKILLs it at the deadline or above the memory cap;
+the next conversion respawns it. Results come back as files (document.md plus
+exported PNGs in the caller's output dir), so only paths cross the pipe.
+"""
+
+from __future__ import annotations
+
+import atexit
+import importlib.util
+import logging
+import threading
+import time
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from pathlib import Path
+
+from src.disk_cache import env_megabytes
+from src.tools.doc_tools import PDF_CONVERT_TIMEOUT_SEC
+from src.tools.docling_pool import PROFILE_FULL
+
+logger = logging.getLogger(__name__)
+
+DOCLING_MAX_RSS_DEFAULT_MB = 4096
+POLL_INTERVAL_SEC = 0.25
+MARKDOWN_FILENAME = "document.md"
+
+
+class DoclingWorkerError(RuntimeError):
+    """Conversion failed in the worker, or the worker died or was killed for memory."""
+
+
+def docling_available() -> bool:
+    """True if Docling is importable (checked without importing it)."""
+    return importlib.util.find_spec("docling") is not None
+
+
+def _rss_bytes(pid: int) -> int | None:
+    """Resident set size of pid from /proc (None where /proc is unavailable)."""
+    try:
+        with open(f"/proc/{pid}/status", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+# -----------------------------------------------------------------------------
+# Child process
+# -----------------------------------------------------------------------------
+
+
+def _convert_to_files(path: str, profile: str, out_dir: str, images: bool) -> dict:
+    from src.tools import docling_pool
+
+    doc = docling_pool.convert(path, profile).document
+    out = Path(out_dir)
+    md_path = out / MARKDOWN_FILENAME
+    md_path.write_text(doc.export_to_markdown(), encoding="utf-8")
+    image_paths = docling_pool.export_document_images(doc, out, Path(path).stem) if images else []
+    return {"markdown_path": str(md_path), "image_paths": image_paths}
+
+
+def _serve(conn) -> None:
+    """Worker loop: one request at a time until the parent closes the pipe."""
+    from src.tools import docling_pool
+
+    while True:
+        try:
+            msg = conn.recv()
+        except (EOFError, OSError):
+            return
+        try:
+            if msg["op"] == "convert":
+                reply = {"ok": True, **_convert_to_files(msg["path"], msg["profile"], msg["out_dir"], msg["images"])}
+            elif msg["op"] == "warm":
+                reply = {"ok": True, "status": docling_pool.warm_up(tuple(msg["profiles"]))}
+            else:
+                reply = {"ok": False, "error_type": "ValueError", "error": f"Unknown op {msg['op']!r}"}
+        except Exception as e:
+            reply = {"ok": False, "error_type": type(e).__name__, "error": str(e)}
+        conn.send(reply)
+
+
+# -----------------------------------------------------------------------------
+# Parent-side handle
+# -----------------------------------------------------------------------------
+
+
+class DoclingWorker:
+    """Owns one conversion child process; requests are serialized and respawn a dead child."""
+
+    def __init__(self, max_rss_bytes: int | None = None) -> None:
+        if max_rss_bytes is None:
+            max_rss_bytes = env_megabytes("AUDITOR_DOCLING_MAX_RSS_MB", DOCLING_MAX_RSS_DEFAULT_MB)
+        self.max_rss_bytes = max_rss_bytes  # 0 = no cap
+        self._proc = None
+        self._conn = None
+        self._lock = threading.Lock()
+        self.conversions = 0
+        self.kills = 0
+        self.last_error = ""
+        self.peak_rss_bytes = 0
+
+    def _ensure_started(self) -> None:
+        if self._proc is not None and self._proc.is_alive():
+            return
+        self._discard()
+        import multiprocessing
+
+        method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        ctx = multiprocessing.get_context(method)
+        parent_conn, child_conn = ctx.Pipe()
+        proc = ctx.Process(target=_serve, args=(child_conn,), name="docling-worker", daemon=True)
+        proc.start()
+        child_conn.close()
+        self._proc, self._conn = proc, parent_conn
+        logger.info("Docling: started worker process (pid %s).", proc.pid)
+
+    def _discard(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+        if self._proc is not None:
+            self._proc.join(timeout=1)
+        self._proc = self._conn = None
+
+    def _kill(self, reason: str) -> None:
+        proc = self._proc
+        if proc is not None and proc.is_alive():
+            logger.warning("Docling: killing worker process (pid %s): %s", proc.pid, reason)
+            proc.kill()
+            proc.join(timeout=5)
+            self.kills += 1
+        self.last_error = reason
+        self._discard()
+
+    def _request(self, msg: dict, timeout: float) -> dict:
+        """Send msg and wait for the reply, enforcing the deadline and RSS cap."""
+        with self._lock:
+            self._ensure_started()
+            self._conn.send(msg)
+            deadline = time.monotonic() + timeout
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._kill(f"no result after {timeout:g}s")
+                    raise FuturesTimeoutError(f"Docling conversion timed out after {timeout:g}s")
+                try:
+                    if self._conn.poll(min(POLL_INTERVAL_SEC, remaining)):
+                        reply = self._conn.recv()
+                        break
+                    lost = False
+                except (EOFError, OSError):
+                    lost = True
+                if lost or not self._proc.is_alive():
+                    code = self._proc.exitcode
+                    self._kill(f"worker exited unexpectedly (exit code {code})")
+                    raise DoclingWorkerError(f"Docling worker exited unexpectedly (exit code {code})")
+                rss = _rss_bytes(self._proc.pid)
+                if rss is not None:
+                    self.peak_rss_bytes = max(self.peak_rss_bytes, rss)
+                    if self.max_rss_bytes and rss > self.max_rss_bytes:
+                        limit_mb = self.max_rss_bytes // (1024 * 1024)
+                        self._kill(f"RSS {rss // (1024 * 1024)} MB over the {limit_mb} MB cap")
+                        raise DoclingWorkerError(f"Docling conversion exceeded the {limit_mb} MB memory cap")
+        if not reply.get("ok"):
+            self.last_error = f"{reply.get('error_type')}: {reply.get('error')}"
+            if reply.get("error_type") in ("ImportError", "ModuleNotFoundError"):
+                raise ImportError(reply.get("error"))
+            raise DoclingWorkerError(f"Docling conversion failed: {self.last_error}")
+        return reply
+
+    def convert_to_files(
+        self,
+        path: str | Path,
+        out_dir: str | Path,
+        profile: str = PROFILE_FULL,
+        images: bool = True,
+        timeout: float = PDF_CONVERT_TIMEOUT_SEC,
+    ) -> tuple[str, list[str]]:
+        """Convert path in the worker; return (markdown, image paths written under out_dir).
+
+        Raises:
+            concurrent.futures.TimeoutError: No result by the deadline (worker killed).
+            DoclingWorkerError: Conversion failed, worker crashed, or RSS cap exceeded.
+            ImportError: Docling is not installed.
+        """
+        reply = self._request(
+            {"op": "convert", "path": str(path), "profile": profile, "out_dir": str(out_dir), "images": images},
+            timeout,
+        )
+        self.conversions += 1
+        markdown = Path(reply["markdown_path"]).read_text(encoding="utf-8")
+        return markdown, list(reply["image_paths"])
+
+    def warm_up(self, profiles: tuple[str, ...] = (PROFILE_FULL,), timeout: float = 600) -> dict[str, bool]:
+        """Start the worker and preload its converter models; returns profile -> success."""
+        try:
+            return dict(self._request({"op": "warm", "profiles": list(profiles)}, timeout)["status"])
+        except (FuturesTimeoutError, DoclingWorkerError, ImportError) as e:
+            logger.warning("Docling: worker warm-up failed: %s", e)
+            return {profile: False for profile in profiles}
+
+    def health(self) -> dict:
+        """Worker pid/liveness, current and peak RSS, conversion and kill counts, last error."""
+        proc = self._proc
+        alive = proc is not None and proc.is_alive()
+        rss = _rss_bytes(proc.pid) if alive else None
+        return {
+            "pid": proc.pid if alive else None,
+            "alive": alive,
+            "busy": self._lock.locked(),
+            "rss_mb": round(rss / (1024 * 1024), 1) if rss is not None else None,
+            "peak_rss_mb": round(self.peak_rss_bytes / (1024 * 1024), 1),
+            "max_rss_mb": self.max_rss_bytes // (1024 * 1024) or None,
+            "conversions": self.conversions,
+            "kills": self.kills,
+            "last_error": self.last_error,
+        }
+
+    def shutdown(self) -> None:
+        """Stop the worker (waits for an in-flight request to finish)."""
+        with self._lock:
+            if self._proc is not None and self._proc.is_alive():
+                self._conn.close()  # child's recv() sees EOF and returns
+                self._proc.join(timeout=5)
+                if self._proc.is_alive():
+                    self._proc.kill()
+            self._discard()
+
+
+_worker: DoclingWorker | None = None
+_worker_lock = threading.Lock()
+
+
+def get_worker() -> DoclingWorker:
+    """Process-wide Docling worker, created on first use and stopped at interpreter exit."""
+    global _worker
+    with _worker_lock:
+        if _worker is None:
+            _worker = DoclingWorker()
+            atexit.register(_worker.shutdown)
+        return _worker
@@ -0,0 +1,246 @@
+"""Local pre-processing of PDF images before vision classification.
+
+Docling exports every page plus every picture and table crop, so the same
+diagram often appears twice (full page and figure crop) and text-only pages are
+exported too. Before anything is sent to the vision model this module:
+
+- drops near-duplicates by 64-bit difference hash (dHash), and drops a page
+  image when a figure crop from that page survives (page provenance from the
+  export names; a crop and its full page are too different for dHash);
+- keeps only diagram-like images: ink ratio in range, a minimum edge density,
+  a sane aspect ratio, and enough ink on long horizontal/vertical strokes (box
+  borders, arrows) - text runs are short, so text-only pages fail this check;
+- downscales what is left to the model's useful resolution (gpt-4o high
+  detail works on at most 2048px long side / 768px short side) into new
+  image store entries. Source images are never modified in place: they may
+  be hard links into the PDF conversion cache.
+
+Images are image store handles (src.image_store) or plain file paths.
+Requires Pillow and NumPy (both installed with Docling). Without them images
+pass through unchanged.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Useful resolution for the vision model; larger images are resized server-side anyway.
+VISION_MAX_LONG_SIDE = 2048
+VISION_MAX_SHORT_SIDE = 768
+
+# Feature extraction works on a copy whose long side is at most this.
+ANALYSIS_LONG_SIDE = 768
+HASH_SIZE = 8  # dHash grid -> 64-bit hash
+DUPLICATE_MAX_DISTANCE = 6  # Hamming distance at or below which two images are the same
+
+# Diagram-likeness thresholds (grayscale 0-255).
+INK_THRESHOLD = 60  # pixel differs from the page background by more than this
+EDGE_THRESHOLD = 40  # gradient magnitude counted as an edge
+MIN_INK_RATIO = 0.003  # blank / near-blank
+MAX_INK_RATIO = 0.6  # photos, full-bleed backgrounds
+MIN_EDGE_DENSITY = 0.002
+MAX_ASPECT_RATIO = 5.0  # rules, banners, thin strips
+MIN_LINE_RUN_FRACTION = 0.06  # a "long" stroke spans at least this much of the image side
+MIN_LINE_INK_RATIO = 0.08  # share of ink on long strokes
+
+# Preference when deduplicating: tighter crops first.
+_KIND_PRIORITY = {"picture": 0, "other": 1, "page": 2, "table": 3}
+
+_PAGE_NO = re.compile(r"-(?:page-|(?:picture|table)-\d+-p)(\d+)$")
+
+
+@dataclass
+class ImageFeatures:
+    """Cheap per-image statistics used for dedup and the diagram pre-filter."""
+
+    width: int
+    height: int
+    ink_ratio: float
+    edge_density: float
+    line_ink_ratio: float
+    dhash: int
+
+    @property
+    def aspect_ratio(self) -> float:
+        return max(self.width, self.height) / max(1, min(self.width, self.height))
+
+
+def image_prep_enabled() -> bool:
+    """AUDITOR_NO_IMAGE_PREP=1 sends every extracted image to the vision model."""
+    return os.environ.get("AUDITOR_NO_IMAGE_PREP", "").strip() not in ("1", "true", "yes")
+
+
+def image_kind(ref: str | Path) -> str:
+    """page / picture / table from docling_pool.export_document_images file names, else other.
+
+    Works on store handles too: they end with the image's file name.
+    """
+    stem = Path(ref).stem
+    for kind in ("page", "picture", "table"):
+        if f"-{kind}-" in stem:
+            return kind
+    return "other"
+
+
+def image_page(ref: str | Path) -> int | None:
+    """Source page number from export names (<doc>-page-<n>, <doc>-picture-<k>-p<n>), else None."""
+    m = _PAGE_NO.search(Path(ref).stem)
+    return int(m.group(1)) if m else None
+
+
+def hamming(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+
+def _dhash(gray) -> int:
+    """Difference hash: sign of horizontal gradients on a (HASH_SIZE+1) x HASH_SIZE thumbnail."""
+    import numpy as np
+    from PIL import Image
+
+    small = np.asarray(gray.resize((HASH_SIZE + 1, HASH_SIZE), Image.Resampling.LANCZOS), dtype=np.int16)
+    bits = (small[:, 1:] > small[:, :-1]).ravel()
+    return int("".join("1" if b else "0" for b in bits), 2)
+
+
+def _long_run_pixels(mask, min_run: int) -> int:
+    """Number of True pixels lying on row-wise runs of at least min_run."""
+    import numpy as np
+
+    padded = np.pad(mask, ((0, 0), (1, 1))).astype(np.int8)
+    d = np.diff(padded, axis=1).ravel()
+    lengths = np.flatnonzero(d == -1) - np.flatnonzero(d == 1)
+    return int(lengths[lengths >= min_run].sum())
+
+
+def image_features(ref: str) -> ImageFeatures:
+    """Compute ImageFeatures for one image handle or path (raises on unreadable images)."""
+    import numpy as np
+
+    from src.image_store import get_image_store
+
+    with get_image_store().open_image(ref) as im:
+        width, height = im.size
+        gray = im.convert("L")
+    gray.thumbnail((ANALYSIS_LONG_SIDE, ANALYSIS_LONG_SIDE))
+    a = np.asarray(gray, dtype=np.int16)
+
+    background = int(np.median(a))
+    ink = np.abs(a - background) > INK_THRESHOLD
+    ink_count = int(ink.sum())
+
+    gx = np.abs(np.diff(a, axis=1))[:-1, :]
+    gy = np.abs(np.diff(a, axis=0))[:, :-1]
+    edge_density = float(((gx + gy) > EDGE_THRESHOLD).mean()) if gx.size else 0.0
+
+    h, w = ink.shape
+    long_ink = _long_run_pixels(ink, max(8, int(w * MIN_LINE_RUN_FRACTION)))
+    long_ink += _long_run_pixels(ink.T, max(8, int(h * MIN_LINE_RUN_FRACTION)))
+
+    return ImageFeatures(
+        width=width,
+        height=height,
+        ink_ratio=ink_count / ink.size,
+        edge_density=edge_density,
+        line_ink_ratio=min(1.0, long_ink / ink_count) if ink_count else 0.0,
+        dhash=_dhash(gray),
+    )
+
+
+def is_diagram_candidate(features: ImageFeatures) -> bool:
+    """Cheap diagram-likeness test: enough (but not too much) ink, edges, and long strokes."""
+    return (
+        features.aspect_ratio <= MAX_ASPECT_RATIO
+        and MIN_INK_RATIO <= features.ink_ratio <= MAX_INK_RATIO
+        and features.edge_density >= MIN_EDGE_DENSITY
+        and features.line_ink_ratio >= MIN_LINE_INK_RATIO
+    )
+
+
+def diagram_likelihood(features: ImageFeatures, kind: str = "other") -> float:
+    """Ranking score for candidates: share of ink on long strokes, nudged up for figure crops."""
+    return features.line_ink_ratio + (0.1 if kind == "picture" else 0.0)
+
+
+def downscale_for_vision(ref: str) -> str:
+    """Handle of a stored copy within the model's useful resolution (ref itself if already small enough)."""
+    from PIL import Image
+
+    from src.image_store import get_image_store
+
+    store = get_image_store()
+    with store.open_image(ref) as im:
+        w, h = im.size
+        scale = min(1.0, VISION_MAX_LONG_SIDE / max(w, h), VISION_MAX_SHORT_SIDE / max(1, min(w, h)))
+        if scale >= 1.0:
+            return ref
+        size = (max(1, round(w * scale)), max(1, round(h * scale)))
+        small = im.convert("RGB").resize(size, Image.Resampling.LANCZOS)
+    return store.put_image(small, f"{Path(store.name(ref)).stem}-vision.png")
+
+
+def prepare_vision_images(image_paths: list[str], by_likelihood: bool = False) -> list[str]:
+    """Candidate diagrams from image_paths (store handles or paths), deduplicated and downscaled.
+
+    Returned in input order, or most diagram-like first when by_likelihood is set.
+    Downscaled copies are new image store handles (the caller releases them).
+    Unreadable images are dropped; without Pillow/NumPy every existing image is
+    returned unfiltered (ranked by image kind only when by_likelihood is set).
+    """
+    from src.image_store import get_image_store
+
+    store = get_image_store()
+    order = sorted(range(len(image_paths)), key=lambda i: (_KIND_PRIORITY[image_kind(image_paths[i])], i))
+    try:
+        import numpy  # noqa: F401
+        from PIL import Image  # noqa: F401
+    except ImportError:
+        logger.debug("Vision: Pillow/NumPy unavailable; skipping image pre-filter.")
+        ranked = order if by_likelihood else range(len(image_paths))
+        return [image_paths[i] for i in ranked if store.exists(image_paths[i])]
+
+    kept: list[tuple[int, ImageFeatures]] = []
+    crop_pages: set[int] = set()  # pages with a surviving picture crop (pictures sort first)
+    duplicates = rejected = 0
+    for i in order:
+        kind = image_kind(image_paths[i])
+        if kind == "page" and image_page(image_paths[i]) in crop_pages:
+            duplicates += 1
+            continue
+        try:
+            features = image_features(image_paths[i])
+        except Exception as e:
+            logger.debug("Vision: cannot read %s: %s", image_paths[i], e)
+            rejected += 1
+            continue
+        if kind == "table" or not is_diagram_candidate(features):
+            rejected += 1
+            continue
+        if any(hamming(features.dhash, k.dhash) <= DUPLICATE_MAX_DISTANCE for _, k in kept):
+            duplicates += 1
+            continue
+        kept.append((i, features))
+        if kind == "picture" and image_page(image_paths[i]) is not None:
+            crop_pages.add(image_page(image_paths[i]))
+
+    if by_likelihood:
+        kept.sort(key=lambda item: (-diagram_likelihood(item[1], image_kind(image_paths[item[0]])), item[0]))
+    else:
+        kept.sort(key=lambda item: item[0])
+    out: list[str] = []
+    for i, _ in kept:
+        try:
+            out.append(downscale_for_vision(image_paths[i]))
+        except Exception as e:
+            logger.debug("Vision: cannot downscale %s: %s", image_paths[i], e)
+            out.append(image_paths[i])
+    logger.info(
+        "Vision: %d of %d images are diagram candidates (%d not diagram-like, %d near-duplicates).",
+        len(out), len(image_paths), rejected, duplicates,
+    )
+    return out
@@ -0,0 +1,208 @@
+"""Selective page rasterizer for the vision path (no Docling).
+
+Getting images out of Docling means running its layout models with page
+images on every page. For diagram checks it is enough to render only the pages
+that can contain a diagram: pypdf tells us which pages draw a sizeable image
+XObject or a non-trivial number of stroked vector shapes (directly or in a
+form XObject), and pypdfium2 renders just those pages at AUDITOR_RASTER_DPI.
+Text-only pages are never rendered.
+
+Rendered pages go straight into the image store (src.image_store) under the
+Docling export naming ("<stem>-page-<n>.png", 1-based), so src.tools.image_prep
+treats them as page images. Opt in with
+AUDITOR_RASTER_PDF=1; pypdfium2 is optional (no images without it).
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import re
+import threading
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RASTER_DPI = 144
+DEFAULT_RASTER_MAX_PAGES = 40
+
+# An image XObject smaller than this (pixels, each side) is a logo, bullet or rule.
+MIN_IMAGE_SIDE = 64
+# Vector content counts as a drawing with this many stroked shapes or subpaths.
+# Text pages still draw rules, underlines, example-box edges (each a stroked
+# single straight segment, which is not counted as a shape) and filled
+# code/callout backgrounds; diagrams stroke box borders, arrows and connectors.
+# Raw line/curve segment counts don't separate the two: renderers flatten
+# rounded corners into dozens of tiny Beziers.
+MIN_STROKED_SHAPES = 8
+MIN_VECTOR_SUBPATHS = 60
+
+# PDFium is not thread-safe; batch mode rasterizes from concurrent audit threads.
+_pdfium_lock = threading.Lock()
+
+_NUM = rb"[-+]?(?:\d+\.?\d*|\.\d+)"
+_SUBPATH = re.compile(_NUM + rb"\s+" + _NUM + rb"\s+m(?![A-Za-z])")
+# A stroke operator right after a path construction operator (only clipping may sit between).
+_STROKE = re.compile(rb"(?<![A-Za-z])(?:[lcvyh]|re)\s+(?:W\*?\s+)?[Ss](?![A-Za-z*])")
+# ... and the subset that strokes a lone straight segment ("x y m x y l S").
+_LINE_STROKE = re.compile(
+    _NUM + rb"\s+" + _NUM + rb"\s+m\s+" + _NUM + rb"\s+" + _NUM + rb"\s+l\s+(?:W\*?\s+)?[Ss](?![A-Za-z*])"
+)
+
+
+def raster_pdf_enabled() -> bool:
+    """AUDITOR_RASTER_PDF=1 renders graphic pages with pypdfium2 when Docling is not used."""
+    return os.environ.get("AUDITOR_RASTER_PDF", "").strip() in ("1", "true", "yes")
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = os.environ.get(name, "").strip()
+    try:
+        return max(1, int(raw)) if raw else default
+    except ValueError:
+        return default
+
+
+def raster_dpi() -> int:
+    return _env_int("AUDITOR_RASTER_DPI", DEFAULT_RASTER_DPI)
+
+
+def raster_max_pages() -> int:
+    return _env_int("AUDITOR_RASTER_MAX_PAGES", DEFAULT_RASTER_MAX_PAGES)
+
+
+def _stream_bytes(obj) -> bytes:
+    try:
+        data = obj.get_data()
+    except Exception:
+        return b""
+    return data if isinstance(data, bytes) else b""
+
+
+def _vector_counts(data: bytes) -> tuple[int, int]:
+    """(stroked shapes, subpaths) in a content stream; lone stroked lines are not shapes."""
+    shapes = len(_STROKE.findall(data)) - len(_LINE_STROKE.findall(data))
+    return max(0, shapes), len(_SUBPATH.findall(data))
+
+
+def _is_drawing(strokes: int, subpaths: int) -> bool:
+    return strokes >= MIN_STROKED_SHAPES or subpaths >= MIN_VECTOR_SUBPATHS
+
+
+def _scan_xobjects(resources, seen: set[int]) -> tuple[bool, int, int]:
+    """(has sizeable image, stroked shapes, subpaths) over resources' XObjects, recursing into forms."""
+    has_image = False
+    strokes = subpaths = 0
+    try:
+        xobjects = resources.get("/XObject") if resources is not None else None
+        xobjects = xobjects.get_object() if xobjects is not None else None
+    except Exception:
+        return False, 0, 0
+    if not xobjects:
+        return False, 0, 0
+    for name in xobjects:
+        try:
+            ref = xobjects.raw_get(name)
+            key = getattr(ref, "idnum", None) or id(ref)
+            if key in seen:
+                continue
+            seen.add(key)
+            xobj = xobjects[name].get_object()
+            subtype = xobj.get("/Subtype")
+            if subtype == "/Image":
+                if min(int(xobj.get("/Width", 0)), int(xobj.get("/Height", 0))) >= MIN_IMAGE_SIDE:
+                    has_image = True
+            elif subtype == "/Form":
+                form_strokes, form_subpaths = _vector_counts(_stream_bytes(xobj))
+                sub_image, sub_strokes, sub_subpaths = _scan_xobjects(xobj.get("/Resources"), seen)
+                has_image = has_image or sub_image
+                strokes += form_strokes + sub_strokes
+                subpaths += form_subpaths + sub_subpaths
+        except Exception:
+            continue
+        if has_image:
+            break
+    return has_image, strokes, subpaths
+
+
+def page_has_graphics(page) -> bool:
+    """True if a pypdf page draws a sizeable image or enough vector paths to be a drawing."""
+    has_image, strokes, subpaths = _scan_xobjects(page.get("/Resources"), set())
+    if has_image or _is_drawing(strokes, subpaths):
+        return True
+    try:
+        contents = page.get_contents()
+    except Exception:
+        contents = None
+    page_strokes, page_subpaths = _vector_counts(_stream_bytes(contents) if contents is not None else b"")
+    return _is_drawing(strokes + page_strokes, subpaths + page_subpaths)
+
+
+def select_graphic_pages(path: str | Path) -> list[int]:
+    """0-based indices of pages that may contain a diagram, in page order."""
+    from pypdf import PdfReader
+
+    reader = PdfReader(str(path))
+    selected: list[int] = []
+    for i, page in enumerate(reader.pages):
+        try:
+            if page_has_graphics(page):
+                selected.append(i)
+        except Exception as e:
+            logger.debug("Raster: cannot inspect page %d of %s: %s", i + 1, path, e)
+    return selected
+
+
+def rasterize_pages(path: str | Path, pages: list[int], dpi: int | None = None) -> list[str]:
+    """Render the given 0-based pages with pypdfium2 into the image store; returns handles."""
+    import pypdfium2 as pdfium
+
+    from src.image_store import get_image_store
+
+    path = Path(path)
+    store = get_image_store()
+    scale = (dpi or raster_dpi()) / 72.0
+    out: list[str] = []
+    with _pdfium_lock:
+        pdf = pdfium.PdfDocument(str(path))
+    try:
+        for i in pages:
+            try:
+                with _pdfium_lock:
+                    page = pdf[i]
+                    try:
+                        image = page.render(scale=scale).to_pil()
+                    finally:
+                        page.close()
+                # PNG encoding is Pillow's work; other audits may use PDFium meanwhile
+                out.append(store.put_image(image, f"{path.stem}-page-{i + 1}.png"))
+            except Exception as e:
+                logger.debug("Raster: cannot render page %d of %s: %s", i + 1, path, e)
+    finally:
+        with _pdfium_lock:
+            pdf.close()
+    return out
+
+
+def rasterize_graphic_pages(path: str | Path, dpi: int | None = None) -> list[str]:
+    """Render only the pages with images or vector drawings (at most AUDITOR_RASTER_MAX_PAGES).
+
+    Returns image store handles; [] when pypdfium2 is not installed or the PDF cannot be read.
+    """
+    try:
+        import pypdfium2  # noqa: F401
+    except ImportError:
+        logger.warning("Raster: pypdfium2 is not installed; no page images for Vision.")
+        return []
+    try:
+        pages = select_graphic_pages(path)
+    except Exception as e:
+        logger.warning("Raster: cannot inspect %s: %s", path, e)
+        return []
+    limit = raster_max_pages()
+    if len(pages) > limit:
+        logger.info("Raster: %d pages with graphics; rendering the first %d.", len(pages), limit)
+        pages = pages[:limit]
+    dpi = dpi or raster_dpi()
+    logger.info("Raster: rendering %d page(s) with graphics at %d DPI.", len(pages), dpi)
+    return rasterize_pages(path, pages, dpi)
@@ -0,0 +1,211 @@
+"""RepoIndex: one walk of a cloned repo, each Python file read and parsed at most once.
+
+All repo analyzers (graph structure, state management, safe tooling, structured
+output, chief justice, judicial nuance) query the same index instead of opening
+and re-parsing their own files.
+"""
+
+from __future__ import annotations
+
+import ast
+import os
+import subprocess
+from dataclasses import dataclass, field
+from pathlib import Path
+
+
+def _is_sparse_checkout(repo_path: Path) -> bool:
+    return (repo_path / ".git" / "info" / "sparse-checkout").exists()
+
+
+def _git_tracked_files(root: Path) -> list[str] | None:
+    """Tracked paths from the index (includes files outside a sparse checkout); None on failure."""
+    try:
+        r = subprocess.run(
+            ["git", "-C", str(root), "ls-files", "-z"],
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        return None
+    if r.returncode != 0:
+        return None
+    return [p for p in r.stdout.split("\0") if p]
+
+
+def _dotted_name(node: ast.AST) -> str | None:
+    """Name or attribute chain as a dotted string (os.system, builder.add_edge); None otherwise."""
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        base = _dotted_name(node.value)
+        return f"{base}.{node.attr}" if base else None
+    return None
+
+
+@dataclass
+class CallSite:
+    """One call expression in a parsed file."""
+
+    name: str  # last component: add_edge, system, StateGraph
+    qualified: str  # dotted form when resolvable (os.system), else same as name
+    lineno: int
+    node: ast.Call = field(repr=False, compare=False)
+
+
+@dataclass
+class ParsedFile:
+    """AST-derived facts for one Python file, computed in a single walk."""
+
+    tree: ast.Module
+    symbols: dict[str, str]  # top-level name -> "class" | "function" | "assign"
+    calls: list[CallSite]
+    names: set[str]  # every ast.Name id referenced in the file
+
+
+def _parse(source: str) -> ParsedFile:
+    tree = ast.parse(source)
+    symbols: dict[str, str] = {}
+    for stmt in tree.body:
+        if isinstance(stmt, ast.ClassDef):
+            symbols[stmt.name] = "class"
+        elif isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            symbols[stmt.name] = "function"
+        elif isinstance(stmt, (ast.Assign, ast.AnnAssign)):
+            targets = stmt.targets if isinstance(stmt, ast.Assign) else [stmt.target]
+            for t in targets:
+                if isinstance(t, ast.Name):
+                    symbols[t.id] = "assign"
+
+    calls: list[CallSite] = []
+    names: set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Call):
+            func = node.func
+            if isinstance(func, ast.Name):
+                name = func.id
+            elif isinstance(func, ast.Attribute):
+                name = func.attr
+            else:
+                continue
+            calls.append(
+                CallSite(
+                    name=name,
+                    qualified=_dotted_name(func) or name,
+                    lineno=getattr(node, "lineno", 0),
+                    node=node,
+                )
+            )
+        elif isinstance(node, ast.Name):
+            names.add(node.id)
+    return ParsedFile(tree=tree, symbols=symbols, calls=calls, names=names)
+
+
+class RepoIndex:
+    """File listing, source text and parsed AST for a cloned repository.
+
+    The tree is walked once on construction. Sources are read and parsed lazily
+    on first access and memoized, so every file is read and parsed at most once
+    no matter how many analyzers ask for it.
+    """
+
+    def __init__(self, repo_path: str | Path) -> None:
+        self.root = Path(repo_path)
+        self.files: list[str] = self._walk()
+        self._file_set = set(self.files)
+        self._sources: dict[str, str | None] = {}
+        self._parsed: dict[str, ParsedFile | None] = {}
+        self._parse_errors: dict[str, str] = {}
+
+    def _walk(self) -> list[str]:
+        if not self.root.is_dir():
+            return []
+        out: list[str] = []
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            if ".git" in dirnames:
+                dirnames.remove(".git")
+            rel_dir = os.path.relpath(dirpath, self.root)
+            for name in filenames:
+                rel = name if rel_dir == "." else os.path.join(rel_dir, name)
+                out.append(rel.replace("\\", "/"))
+        return sorted(out)
+
+    # -- lookups --------------------------------------------------------------
+
+    def has(self, rel: str) -> bool:
+        return rel in self._file_set
+
+    def first_existing(self, *candidates: str) -> str | None:
+        """First candidate path present in the repo (e.g. src/graph.py then graph.py)."""
+        for rel in candidates:
+            if rel in self._file_set:
+                return rel
+        return None
+
+    def files_in(self, directory: str, suffix: str = "") -> list[str]:
+        """Direct children of directory ending with suffix (non-recursive, sorted)."""
+        prefix = directory.rstrip("/") + "/"
+        return [
+            f for f in self.files
+            if f.startswith(prefix) and "/" not in f[len(prefix):] and f.endswith(suffix)
+        ]
+
+    def list_files(self, extensions: tuple[str, ...]) -> list[str]:
+        """Relative paths with the given extensions; full tree from git index when sparse."""
+        files = self.files
+        if _is_sparse_checkout(self.root):
+            tracked = _git_tracked_files(self.root)
+            if tracked is not None:
+                files = sorted(tracked)
+        return [f for f in files if os.path.splitext(f)[1].lower() in extensions]
+
+    def path(self, rel: str) -> Path:
+        return self.root / rel
+
+    # -- content --------------------------------------------------------------
+
+    def source(self, rel: str) -> str | None:
+        """File text (undecodable bytes replaced); None if missing or unreadable."""
+        if rel not in self._sources:
+            try:
+                self._sources[rel] = (self.root / rel).read_text(encoding="utf-8", errors="replace")
+            except OSError:
+                self._sources[rel] = None
+        return self._sources[rel]
+
+    def snippet(self, rel: str, max_chars: int) -> str:
+        return (self.source(rel) or "")[:max_chars]
+
+    def parsed(self, rel: str) -> ParsedFile | None:
+        """Parsed facts for a Python file; None if missing or not valid Python."""
+        if rel not in self._parsed:
+            src = self.source(rel)
+            result: ParsedFile | None = None
+            if src is not None:
+                try:
+                    result = _parse(src)
+                except SyntaxError as e:
+                    self._parse_errors[rel] = str(e)
+            self._parsed[rel] = result
+        return self._parsed[rel]
+
+    def parse_error(self, rel: str) -> str | None:
+        self.parsed(rel)
+        return self._parse_errors.get(rel)
+
+    def tree(self, rel: str) -> ast.Module | None:
+        p = self.parsed(rel)
+        return p.tree if p else None
+
+    def symbols(self, rel: str) -> dict[str, str]:
+        p = self.parsed(rel)
+        return p.symbols if p else {}
+
+    def calls(self, rel: str) -> list[CallSite]:
+        p = self.parsed(rel)
+        return p.calls if p else []
+
+    def has_call(self, rel: str, qualified: str) -> bool:
+        """True if the file contains a real call to qualified (AST, so docstrings/comments don't count)."""
+        return any(c.qualified == qualified for c in self.calls(rel))
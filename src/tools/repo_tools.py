@@ -16,6 +16,8 @@ import tempfile
 from pathlib import Path
 from pydantic import BaseModel
 
+from src.tools.repo_index import RepoIndex
+
 
 # -----------------------------------------------------------------------------
 # Structured errors (Safe Tool Engineering)
@@ -144,7 +146,179 @@ def _get_remote_origin(repo_path: Path) -> str | None:
     return r.stdout.strip()
 
 
-def clone_repo_sandboxed(repo_url: str, target_dir: str | Path | None = None) -> tuple[str, Path | None]:
+# -----------------------------------------------------------------------------
+# Bare-mirror clone cache (re-audits of the same repo skip the network clone)
+# -----------------------------------------------------------------------------
+
+# Mirrors live under <cache root>/git-mirrors; total size bounded by AUDITOR_CLONE_CACHE_MAX_MB.
+CLONE_CACHE_SUBDIR = "git-mirrors"
+CLONE_CACHE_DEFAULT_MAX_MB = 2048
+# Branches and tags only: a --mirror clone of GitHub also pulls every refs/pull/* ref.
+MIRROR_REFSPECS = ("+refs/heads/*:refs/heads/*", "+refs/tags/*:refs/tags/*")
+
+
+def _clone_cache_enabled() -> bool:
+    """Mirror cache is on unless AUDITOR_NO_CLONE_CACHE=1."""
+    import os
+
+    return os.environ.get("AUDITOR_NO_CLONE_CACHE", "").strip() not in ("1", "true", "yes")
+
+
+def _clone_cache_dir() -> Path:
+    from src.disk_cache import cache_root
+
+    return cache_root() / CLONE_CACHE_SUBDIR
+
+
+def _mirror_key(repo_url: str) -> str:
+    """Filesystem-safe cache key from the normalized URL (github.com/owner/repo)."""
+    return re.sub(r"[^\w.-]", "_", _normalize_github_url(repo_url))
+
+
+def _mirror_lock_path(mirror: Path) -> Path:
+    """Lock files sit beside the mirrors dir so evicting a mirror never deletes its lock."""
+    return mirror.parent.parent / (CLONE_CACHE_SUBDIR + "-locks") / f"{mirror.name}.lock"
+
+
+def _run_git(args: list[str], repo_url: str, action: str, timeout: int = 120) -> None:
+    """Run a git command for repo_url; raise CloneError/AuthenticationError on failure."""
+    try:
+        result = subprocess.run(
+            ["git", *args],
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
+    except subprocess.TimeoutExpired:
+        raise CloneError(f"git {action} timed out") from None
+    except FileNotFoundError:
+        raise CloneError("git executable not found") from None
+
+    if result.returncode != 0:
+        err = (result.stderr or result.stdout or "(no output)").strip()
+        # Check for authentication failure explicitly (rubric: 'Authentication failures caught and reported')
+        err_lower = err.lower()
+        if any(pattern in err_lower for pattern in _AUTH_FAILURE_PATTERNS):
+            raise AuthenticationError(
+                f"git authentication failed for {repo_url!r}: {err}"
+            )
+        raise CloneError(f"git {action} failed: {err}")
+
+
+def _clone_via_mirror_cache(repo_url: str, clone_into: Path, sparse: bool = False) -> None:
+    """Refresh (or create) the bare mirror for repo_url, then clone it locally into clone_into.
+
+    The per-repo lock is held for the fetch and the local clone so concurrent
+    audits of the same URL never read a half-written mirror. The local clone
+    hardlinks objects, so it is cheap and independent of later evictions.
+
+    Sparse mode uses its own blob:none mirror ("<key>-blobless"): only commits
+    and trees cross the network, and the sandbox is a filtered clone of it
+    whose checkout lazily fetches the few analyzed blobs from GitHub.
+    """
+    import shutil
+
+    from src.disk_cache import PARTIAL_SUFFIX, entry_lock, env_megabytes, evict_lru, touch_entry
+
+    mirrors = _clone_cache_dir()
+    mirrors.mkdir(parents=True, exist_ok=True)
+    mirror = mirrors / (_mirror_key(repo_url) + ("-blobless" if sparse else ""))
+
+    with entry_lock(_mirror_lock_path(mirror)):
+        if (mirror / "HEAD").exists():
+            # Cache hit: incremental fetch of new commits only.
+            _run_git(
+                ["-C", str(mirror), "fetch", "--quiet", "--prune", "origin", *MIRROR_REFSPECS], repo_url, "fetch"
+            )
+        else:
+            # Clone beside the final name and rename, so a killed clone never looks like a hit.
+            partial = mirror.with_name(mirror.name + PARTIAL_SUFFIX)
+            shutil.rmtree(partial, ignore_errors=True)
+            shutil.rmtree(mirror, ignore_errors=True)
+            try:
+                filter_args = ["--filter=blob:none"] if sparse else []
+                _run_git(["clone", "--quiet", "--bare", *filter_args, repo_url, str(partial)], repo_url, "clone")
+                if sparse:
+                    # Let the filtered local clone below ask this mirror for a blob:none pack.
+                    _run_git(
+                        ["-C", str(partial), "config", "uploadpack.allowFilter", "true"],
+                        repo_url, "config", timeout=10,
+                    )
+                # A bare clone records no fetch refspec; pin it so plain fetches stay branches + tags.
+                _run_git(
+                    ["-C", str(partial), "config", "remote.origin.fetch", MIRROR_REFSPECS[0]],
+                    repo_url, "config", timeout=10,
+                )
+                _run_git(
+                    ["-C", str(partial), "config", "--add", "remote.origin.fetch", MIRROR_REFSPECS[1]],
+                    repo_url, "config", timeout=10,
+                )
+            except CloneError:
+                shutil.rmtree(partial, ignore_errors=True)
+                raise
+            partial.rename(mirror)
+        touch_entry(mirror)
+        if sparse:
+            # --filter is ignored for plain-path local clones, so go through file://.
+            local_args = ["clone", "--quiet", "--no-checkout", "--filter=blob:none", mirror.as_uri()]
+        else:
+            local_args = ["clone", "--quiet", "--local", str(mirror)]
+        _run_git([*local_args, str(clone_into)], repo_url, "clone")
+
+    # Point origin back at GitHub so the remote check (and any later git use) sees the real URL.
+    _run_git(["-C", str(clone_into), "remote", "set-url", "origin", repo_url], repo_url, "remote set-url", timeout=10)
+
+    evict_lru(
+        mirrors,
+        env_megabytes("AUDITOR_CLONE_CACHE_MAX_MB", CLONE_CACHE_DEFAULT_MAX_MB),
+        lock_for=_mirror_lock_path,
+        keep={mirror.name},
+    )
+
+
+# -----------------------------------------------------------------------------
+# Partial clone + sparse checkout (commit metadata complete, only analyzed blobs)
+# -----------------------------------------------------------------------------
+
+# Files the repo analyzers open (non-cone patterns, anchored at repo root).
+# list_repo_files reads the full tree from the index, so it is unaffected.
+SPARSE_CHECKOUT_PATTERNS = (
+    "/graph.py",
+    "/state.py",
+    "/src/graph.py",
+    "/src/state.py",
+    "/src/tools/*.py",
+    "/src/nodes/judges.py",
+    "/src/nodes/justice.py",
+)
+
+
+def _sparse_clone_enabled() -> bool:
+    """Partial clone + sparse checkout is opt-in via AUDITOR_SPARSE_CLONE=1."""
+    import os
+
+    return os.environ.get("AUDITOR_SPARSE_CLONE", "").strip() in ("1", "true", "yes")
+
+
+def _apply_sparse_checkout(repo_url: str, clone_into: Path) -> None:
+    """Restrict the working tree to SPARSE_CHECKOUT_PATTERNS and check out HEAD.
+
+    In a blob:none partial clone, checkout lazily fetches only these blobs.
+    """
+    _run_git(
+        ["-C", str(clone_into), "sparse-checkout", "set", "--no-cone", *SPARSE_CHECKOUT_PATTERNS],
+        repo_url,
+        "sparse-checkout",
+    )
+    _run_git(["-C", str(clone_into), "checkout", "--quiet"], repo_url, "checkout")
+
+
+def clone_repo_sandboxed(
+    repo_url: str,
+    target_dir: str | Path | None = None,
+    use_cache: bool | None = None,
+    sparse: bool | None = None,
+) -> tuple[str, Path | None]:
     """Clone a GitHub repo into a sandboxed temporary directory only.
 
     Sandboxed Tooling precedent: Cloning must be wrapped in error handlers and
@@ -158,10 +332,20 @@ def clone_repo_sandboxed(repo_url: str, target_dir: str | Path | None = None) ->
     - Timeout and cleanup on any failure.
     - Full clone (no --depth) so all commits visible for forensic analysis.
 
+    With the mirror cache enabled (default; AUDITOR_NO_CLONE_CACHE=1 disables),
+    the network step is an incremental fetch into a bare mirror under the cache
+    dir, and the sandbox copy is a local clone of that mirror.
+
+    Sparse mode (AUDITOR_SPARSE_CLONE=1) clones with --filter=blob:none and a
+    sparse checkout of SPARSE_CHECKOUT_PATTERNS: every commit is still present
+    for git log, but only the blobs the analyzers open are fetched and written.
+
     Args:
         repo_url: HTTPS GitHub URL.
         target_dir: Optional parent (e.g. from tempfile.TemporaryDirectory()).
             If None, a new temp dir is created; caller must shutil.rmtree(cleanup_path).
+        use_cache: Force the mirror cache on/off; None follows AUDITOR_NO_CLONE_CACHE.
+        sparse: Force sparse mode on/off; None follows AUDITOR_SPARSE_CLONE.
 
     Returns:
         (repo_path, cleanup_path): repo_path is cloned repo root; cleanup_path
@@ -188,34 +372,30 @@ def clone_repo_sandboxed(repo_url: str, target_dir: str | Path | None = None) ->
     if clone_into.exists():
         shutil.rmtree(clone_into, ignore_errors=True)
 
-    try:
-        # Full clone (no --depth) so git log shows full history (all commits) for forensic analysis.
-        result = subprocess.run(
-            ["git", "clone", "--quiet", repo_url, str(clone_into)],
-            capture_output=True,
-            text=True,
-            timeout=120,
-        )
-    except subprocess.TimeoutExpired:
-        if cleanup_path is not None:
-            shutil.rmtree(cleanup_path, ignore_errors=True)
-        raise CloneError("git clone timed out") from None
-    except FileNotFoundError:
-        if cleanup_path is not None:
-            shutil.rmtree(cleanup_path, ignore_errors=True)
-        raise CloneError("git executable not found") from None
+    if use_cache is None:
+        use_cache = _clone_cache_enabled()
+    if sparse is None:
+        sparse = _sparse_clone_enabled()
 
-    if result.returncode != 0:
-        err = (result.stderr or result.stdout or "(no output)").strip()
+    try:
+        if use_cache:
+            _clone_via_mirror_cache(repo_url, clone_into, sparse=sparse)
+        elif sparse:
+            # No --depth: full commit history, but trees/blobs are fetched only on demand.
+            _run_git(
+                ["clone", "--quiet", "--filter=blob:none", "--no-checkout", repo_url, str(clone_into)],
+                repo_url,
+                "clone",
+            )
+        else:
+            # Full clone (no --depth) so git log shows full history (all commits) for forensic analysis.
+            _run_git(["clone", "--quiet", repo_url, str(clone_into)], repo_url, "clone")
+        if sparse:
+            _apply_sparse_checkout(repo_url, clone_into)
+    except CloneError:
         if cleanup_path is not None:
             shutil.rmtree(cleanup_path, ignore_errors=True)
-        # Check for authentication failure explicitly (rubric: 'Authentication failures caught and reported')
-        err_lower = err.lower()
-        if any(pattern in err_lower for pattern in _AUTH_FAILURE_PATTERNS):
-            raise AuthenticationError(
-                f"git authentication failed for {repo_url!r}: {err}"
-            )
-        raise CloneError(f"git clone failed: {err}")
+        raise
 
     if not clone_into.exists() or not (clone_into / ".git").exists():
         if cleanup_path is not None:
@@ -281,27 +461,23 @@ def extract_git_history(path: str) -> GitHistoryResult:
     return GitHistoryResult(path=str(root), commits=commits, total=len(commits))
 
 
-def _ast_find_graph_file(repo_path: Path) -> Path | None:
-    """Locate graph definition file (e.g. src/graph.py)."""
-    candidates = [
-        repo_path / "src" / "graph.py",
-        repo_path / "graph.py",
-    ]
-    for p in candidates:
-        if p.exists():
-            return p
-    return None
+def head_commit(path: str) -> str:
+    """Full SHA of HEAD in the repo at path; "" when git cannot tell."""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=path, capture_output=True, text=True, timeout=10
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return ""
+    return result.stdout.strip() if result.returncode == 0 else ""
 
 
-def _get_call_name(node: ast.Call) -> str | None:
-    if isinstance(node.func, ast.Name):
-        return node.func.id
-    if isinstance(node.func, ast.Attribute):
-        return node.func.attr
-    return None
+def _ast_find_graph_file(index: RepoIndex) -> str | None:
+    """Locate graph definition file (e.g. src/graph.py), relative to the repo root."""
+    return index.first_existing("src/graph.py", "graph.py")
 
 
-def analyze_graph_structure(path: str) -> GraphStructureResult:
+def analyze_graph_structure(path: str, index: RepoIndex | None = None) -> GraphStructureResult:
     """Analyze graph definition with Python ast (no regex).
 
     Detects: StateGraph instantiation, add_edge, fan-out pattern,
@@ -309,8 +485,9 @@ def analyze_graph_structure(path: str) -> GraphStructureResult:
     Graph Orchestration Architecture rubric.
     """
     root = Path(path)
-    graph_file = _ast_find_graph_file(root)
-    if not graph_file:
+    index = index or RepoIndex(root)
+    graph_rel = _ast_find_graph_file(index)
+    if not graph_rel:
         return GraphStructureResult(
             path=str(root),
             has_state_graph=False,
@@ -321,9 +498,9 @@ def analyze_graph_structure(path: str) -> GraphStructureResult:
             details="no graph file found (src/graph.py or graph.py)",
         )
 
-    try:
-        source = graph_file.read_text(encoding="utf-8")
-    except OSError as e:
+    graph_file = index.path(graph_rel)
+    source = index.source(graph_rel)
+    if source is None:
         return GraphStructureResult(
             path=str(graph_file),
             has_state_graph=False,
@@ -331,12 +508,11 @@ def analyze_graph_structure(path: str) -> GraphStructureResult:
             has_fan_out=False,
             has_evidence_aggregator=False,
             has_parallel_judges=False,
-            details=f"read error: {e}",
+            details="read error: file could not be read",
         )
 
-    try:
-        tree = ast.parse(source)
-    except SyntaxError as e:
+    parsed = index.parsed(graph_rel)
+    if parsed is None:
         return GraphStructureResult(
             path=str(graph_file),
             has_state_graph=False,
@@ -344,7 +520,7 @@ def analyze_graph_structure(path: str) -> GraphStructureResult:
             has_fan_out=False,
             has_evidence_aggregator=False,
             has_parallel_judges=False,
-            details=f"syntax error: {e}",
+            details=f"syntax error: {index.parse_error(graph_rel)}",
         )
 
     has_state_graph = False
@@ -356,28 +532,27 @@ def analyze_graph_structure(path: str) -> GraphStructureResult:
     has_evidence_aggregator = False
     judge_nodes: set[str] = set()
 
-    for node in ast.walk(tree):
-        if isinstance(node, ast.Call):
-            name = _get_call_name(node)
-            if name and "StateGraph" in name:
-                has_state_graph = True
-            if name == "add_edge":
-                has_add_edge = True
-                edge_count += 1
-                if len(node.args) >= 2:
-                    from_node = _arg_to_str(node.args[0])
-                    to_node = _arg_to_str(node.args[1])
-                    if from_node and to_node:
-                        add_edge_calls.append((from_node, to_node))
-            if name == "add_conditional_edges":
-                has_conditional_edges = True
-            if name == "add_node" and node.args and isinstance(node.args[0], ast.Constant):
-                node_names.add(str(node.args[0].value))
-        if isinstance(node, ast.Name):
-            if "EvidenceAggregator" in node.id:
-                has_evidence_aggregator = True
-            if "judge" in node.id.lower() or "Judge" in node.id:
-                judge_nodes.add(node.id)
+    for call in parsed.calls:
+        name, node = call.name, call.node
+        if "StateGraph" in name:
+            has_state_graph = True
+        if name == "add_edge":
+            has_add_edge = True
+            edge_count += 1
+            if len(node.args) >= 2:
+                from_node = _arg_to_str(node.args[0])
+                to_node = _arg_to_str(node.args[1])
+                if from_node and to_node:
+                    add_edge_calls.append((from_node, to_node))
+        if name == "add_conditional_edges":
+            has_conditional_edges = True
+        if name == "add_node" and node.args and isinstance(node.args[0], ast.Constant):
+            node_names.add(str(node.args[0].value))
+    for name_id in parsed.names:
+        if "EvidenceAggregator" in name_id:
+            has_evidence_aggregator = True
+        if "judge" in name_id.lower() or "Judge" in name_id:
+            judge_nodes.add(name_id)
 
     # Fan-out: multiple outgoing add_edge from one node, or add_conditional_edges (router returns list[Send])
     from_groups: dict[str, set[str]] = {}
@@ -399,7 +574,7 @@ def analyze_graph_structure(path: str) -> GraphStructureResult:
     if has_conditional_edges:
         details_parts.append("add_conditional_edges: present (fan-out via router)")
     # Include source snippet so judges can see actual fan-out/fan-in code
-    graph_snippet = _read_snippet(graph_file, 2500)
+    graph_snippet = source[:2500]
     if graph_snippet:
         details_parts.append(f"\nGraph source (first 2500 chars):\n{graph_snippet}")
 
@@ -425,55 +600,30 @@ def _arg_to_str(node: ast.AST) -> str | None:
     return None
 
 
-def list_repo_files(repo_path: str, extensions: tuple[str, ...] = (".py", ".json", ".md", ".toml")) -> list[str]:
-    """List relative paths under repo root for cross-reference (Report Accuracy)."""
-    root = Path(repo_path)
-    if not root.is_dir():
-        return []
-    out: list[str] = []
-    for f in root.rglob("*"):
-        if f.is_file() and f.suffix.lower() in extensions:
-            try:
-                rel = f.relative_to(root)
-                out.append(str(rel).replace("\\", "/"))
-            except ValueError:
-                pass
-    return sorted(out)
+def list_repo_files(
+    repo_path: str,
+    extensions: tuple[str, ...] = (".py", ".json", ".md", ".toml"),
+    index: RepoIndex | None = None,
+) -> list[str]:
+    """List relative paths under repo root for cross-reference (Report Accuracy).
 
+    In a sparse checkout the working tree holds only a few files, so the listing
+    comes from the git index instead.
+    """
+    index = index or RepoIndex(repo_path)
+    return index.list_files(tuple(e.lower() for e in extensions))
 
-def _read_snippet(file_path: Path, max_chars: int = 2000) -> str:
-    """Read file and return content up to max_chars."""
-    try:
-        return file_path.read_text(encoding="utf-8", errors="replace")[:max_chars]
-    except OSError:
-        return ""
 
+JUDGES_FILE = "src/nodes/judges.py"
 
-def _ast_has_os_system_call(file_path: Path) -> bool:
-    """Return True if the file contains an actual os.system(...) call (AST), not docstrings/comments."""
-    try:
-        source = file_path.read_text(encoding="utf-8", errors="replace")
-        tree = ast.parse(source)
-    except (OSError, SyntaxError):
-        return False
-    for node in ast.walk(tree):
-        if isinstance(node, ast.Call):
-            if isinstance(node.func, ast.Attribute):
-                attr = node.func
-                if attr.attr == "system":
-                    if isinstance(attr.value, ast.Name) and attr.value.id == "os":
-                        return True
-    return False
-
-
-def analyze_state_management(repo_path: str) -> tuple[bool, str]:
+
+def analyze_state_management(repo_path: str, index: RepoIndex | None = None) -> tuple[bool, str]:
     """Scan state.py for TypedDict, BaseModel, Annotated, operator.add/ior. Return (found, snippet)."""
-    root = Path(repo_path)
-    candidates = [root / "src" / "state.py", root / "state.py"]
-    for p in candidates:
-        if not p.exists():
+    index = index or RepoIndex(repo_path)
+    for rel in ("src/state.py", "state.py"):
+        if not index.has(rel):
             continue
-        text = _read_snippet(p, 3500)
+        text = index.snippet(rel, 3500)
         has_typed = "TypedDict" in text or "BaseModel" in text
         has_annotated = "Annotated" in text
         has_reducers = "operator.add" in text or "operator.ior" in text
@@ -488,22 +638,21 @@ def analyze_state_management(repo_path: str) -> tuple[bool, str]:
     return False, "No src/state.py or state.py with TypedDict/BaseModel and reducers found."
 
 
-def analyze_safe_tool_engineering(repo_path: str) -> tuple[bool, str]:
+def analyze_safe_tool_engineering(repo_path: str, index: RepoIndex | None = None) -> tuple[bool, str]:
     """Scan tools for tempfile, subprocess.run, no os.system. Return (found, snippet).
-    Uses AST for os.system so docstrings/comments do not trigger a fail."""
-    root = Path(repo_path)
-    tools_dir = root / "src" / "tools"
-    if not tools_dir.exists():
+    Uses AST call sites for os.system so docstrings/comments do not trigger a fail."""
+    index = index or RepoIndex(repo_path)
+    if not (index.root / "src" / "tools").is_dir():
         return False, "No src/tools directory."
     # Prioritize repo_tools.py (has tempfile, subprocess, auth handling) over other tool files
-    tool_files = sorted(tools_dir.glob("*.py"), key=lambda f: (0 if "repo" in f.name else 1, f.name))
+    tool_files = sorted(index.files_in("src/tools", ".py"), key=lambda f: (0 if "repo" in Path(f).name else 1, Path(f).name))
     text_parts: list[str] = []
     for f in tool_files:
-        text_parts.append(_read_snippet(f, 6000))
+        text_parts.append(index.snippet(f, 6000))
     combined = "\n---\n".join(text_parts)
     has_tempfile = "tempfile" in combined
     has_subprocess = "subprocess.run" in combined or "subprocess." in combined
-    has_os_system = any(_ast_has_os_system_call(f) for f in tool_files)
+    has_os_system = any(index.has_call(f, "os.system") for f in tool_files)
     # Show the most relevant file (repo_tools.py) snippet first
     primary_snippet = text_parts[0] if text_parts else ""
     if has_tempfile and has_subprocess and not has_os_system:
@@ -517,13 +666,12 @@ def analyze_safe_tool_engineering(repo_path: str) -> tuple[bool, str]:
     )
 
 
-def analyze_structured_output(repo_path: str) -> tuple[bool, str]:
+def analyze_structured_output(repo_path: str, index: RepoIndex | None = None) -> tuple[bool, str]:
     """Scan judges.py for with_structured_output(JudicialOpinion), retry logic. Return (found, snippet)."""
-    root = Path(repo_path)
-    p = root / "src" / "nodes" / "judges.py"
-    if not p.exists():
+    index = index or RepoIndex(repo_path)
+    if not index.has(JUDGES_FILE):
         return False, "No src/nodes/judges.py."
-    text = _read_snippet(p, 6000)
+    text = index.snippet(JUDGES_FILE, 6000)
     has_structured = "with_structured_output" in text and "JudicialOpinion" in text
     has_retry = "retry" in text.lower() or "MAX_PARSE_RETRIES" in text or "attempt" in text
     if has_structured:
@@ -534,13 +682,12 @@ def analyze_structured_output(repo_path: str) -> tuple[bool, str]:
     return False, "with_structured_output(JudicialOpinion) or equivalent not found in judges.py."
 
 
-def analyze_chief_justice_synthesis(repo_path: str) -> tuple[bool, str]:
+def analyze_chief_justice_synthesis(repo_path: str, index: RepoIndex | None = None) -> tuple[bool, str]:
     """Scan justice.py for deterministic rules: security_override, fact_supremacy, functionality_weight. Return (found, snippet)."""
-    root = Path(repo_path)
-    p = root / "src" / "nodes" / "justice.py"
-    if not p.exists():
+    index = index or RepoIndex(repo_path)
+    if not index.has("src/nodes/justice.py"):
         return False, "No src/nodes/justice.py."
-    text = _read_snippet(p, 3000)
+    text = index.snippet("src/nodes/justice.py", 3000)
     has_security = "security_override" in text or "Rule of Security" in text
     has_fact = "fact_supremacy" in text or "Rule of Evidence" in text
     has_functionality = "functionality_weight" in text
@@ -556,3 +703,68 @@ def analyze_chief_justice_synthesis(repo_path: str) -> tuple[bool, str]:
         f"Deterministic rules: security={has_security} fact={has_fact} functionality={has_functionality}. "
         "Chief Justice must use hardcoded Python logic, not LLM."
     )
+
+
+def analyze_judicial_nuance(repo_path: str, index: RepoIndex | None = None) -> tuple[bool, str]:
+    """Scan judges.py for three distinct personas (adversarial, charitable, pragmatic). Return (found, snippet)."""
+    index = index or RepoIndex(repo_path)
+    if not index.has(JUDGES_FILE):
+        return False, "No src/nodes/judges.py."
+    text = index.snippet(JUDGES_FILE, 3000)
+    has_prosecutor = "Prosecutor" in text and "adversarial" in text.lower()
+    has_defense = "Defense" in text and ("forgiving" in text.lower() or "charitable" in text.lower())
+    has_techlead = "TechLead" in text or "Tech Lead" in text
+    all_distinct = has_prosecutor and has_defense and has_techlead
+    return all_distinct, (
+        f"Prosecutor(adversarial)={has_prosecutor} Defense(charitable)={has_defense} "
+        f"TechLead(pragmatic)={has_techlead}. Snippet: {text[:2000]}"
+    )
+
+
+# -----------------------------------------------------------------------------
+# Analyzer runner (repo_detective)
+# -----------------------------------------------------------------------------
+
+# Source analyzers: pure AST/text work over the index, CPU-bound.
+_SOURCE_ANALYZERS = {
+    "graph_structure": analyze_graph_structure,
+    "state_management": analyze_state_management,
+    "safe_tool_engineering": analyze_safe_tool_engineering,
+    "structured_output": analyze_structured_output,
+    "chief_justice_synthesis": analyze_chief_justice_synthesis,
+    "judicial_nuance": analyze_judicial_nuance,
+}
+
+
+def run_repo_analyzers(repo_path: str) -> dict[str, object]:
+    """Run git history, file listing and all source analyzers for a cloned repo.
+
+    The file listing and the AST analyzers run one after another in this
+    process over one shared RepoIndex (the tree is walked and each file parsed
+    once). Only git log, which waits on a subprocess, overlaps with them on a
+    helper thread. Every entry in the returned dict is either the analyzer's
+    result or the exception it raised, so one failing analyzer never affects
+    the others.
+
+    Keys: git_history, repo_files, plus every name in _SOURCE_ANALYZERS.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    results: dict[str, object] = {}
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="git-log") as io_pool:
+        git_future = io_pool.submit(extract_git_history, repo_path)
+        index = RepoIndex(repo_path)
+        calls = {
+            "repo_files": lambda: list_repo_files(repo_path, index=index),
+            **{name: (lambda fn=fn: fn(repo_path, index=index)) for name, fn in _SOURCE_ANALYZERS.items()},
+        }
+        for name, call in calls.items():
+            try:
+                results[name] = call()
+            except Exception as e:
+                results[name] = e
+        try:
+            results["git_history"] = git_future.result()
+        except Exception as e:
+            results["git_history"] = e
+    return results
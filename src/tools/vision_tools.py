@@ -2,19 +2,20 @@
 
 from __future__ import annotations
 
+import asyncio
+import base64
 import logging
+import os
 import tempfile
 from concurrent.futures import TimeoutError as FuturesTimeoutError
-from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Literal
 
 from pydantic import BaseModel
 
-logger = logging.getLogger(__name__)
+from src.tools.doc_tools import PDF_CONVERT_TIMEOUT_SEC
 
-# Docling convert can be very slow on CPU; cap wait to avoid indefinite stall.
-PDF_CONVERT_TIMEOUT_SEC = 90
+logger = logging.getLogger(__name__)
 
 DiagramClassification = Literal["StateGraph diagram", "Linear pipeline", "Generic flowchart"]
 
@@ -30,23 +31,25 @@ DIAGRAM_PROMPT = (
 class DiagramResult(BaseModel):
     """Classification of a diagram image."""
 
-    image_path: str
+    image_path: str  # image store handle or file path
     classification: DiagramClassification
     raw_response: str = ""
 
 
 def extract_images_from_pdf(path: str) -> tuple[list[str], Path | None]:
-    """Extract images (figures, tables, pages) from PDF into temp files.
+    """Extract images (figures, tables, pages) from PDF into the image store.
 
-    Uses Docling with generate_picture_images and generate_page_images.
-    Caller must call shutil.rmtree(cleanup_path) when done if cleanup_path is not None.
+    Uses Docling with generate_picture_images and generate_page_images, or with
+    AUDITOR_RASTER_PDF=1 (and no AUDITOR_FULL_PDF) renders only pages with graphics.
+    Caller must release the handles (src.image_store) and call
+    shutil.rmtree(cleanup_path) when done if cleanup_path is not None.
 
     Args:
         path: Path to PDF file.
 
     Returns:
-        (image_paths, cleanup_path): list of paths to PNGs; cleanup_path is the
-        temp dir to remove with shutil.rmtree when done, or None.
+        (image_handles, cleanup_path): image store handles of PNGs; cleanup_path is
+        the temp dir (holding Docling output) to remove with shutil.rmtree when done.
     """
     path_obj = Path(path).resolve()
     if not path_obj.exists():
@@ -56,137 +59,206 @@ def extract_images_from_pdf(path: str) -> tuple[list[str], Path | None]:
     image_paths: list[str] = []
 
     # Req: VisionInspector "running it to get results is optional". Without FULL_PDF we skip heavy conversion.
-    import os
     if os.environ.get("AUDITOR_FULL_PDF", "").strip() not in ("1", "true", "yes"):
+        from src.tools.pdf_raster import raster_pdf_enabled, rasterize_graphic_pages
+
+        if raster_pdf_enabled():
+            return rasterize_graphic_pages(path_obj), tmp_dir
         logger.info("Vision: AUDITOR_FULL_PDF not set; skipping image extraction.")
         return image_paths, tmp_dir
 
-    try:
-        from docling.datamodel.base_models import InputFormat
-        from docling.datamodel.pipeline_options import PdfPipelineOptions
-        from docling.document_converter import DocumentConverter, PdfFormatOption
-    except ImportError:
+    from src.image_store import get_image_store
+    from src.tools.docling_worker import DoclingWorkerError, docling_available, get_worker
+
+    if not docling_available():
         return image_paths, tmp_dir
 
-    pipeline_options = PdfPipelineOptions()
-    pipeline_options.images_scale = 2.0
-    pipeline_options.generate_page_images = True
-    pipeline_options.generate_picture_images = True
-    pipeline_options.document_timeout = float(PDF_CONVERT_TIMEOUT_SEC)
-    converter = DocumentConverter(
-        format_options={InputFormat.PDF: PdfFormatOption(pipeline_options=pipeline_options)}
-    )
     logger.info("Vision: converting PDF to extract images (timeout=%ds)...", PDF_CONVERT_TIMEOUT_SEC)
     try:
-        with ThreadPoolExecutor(max_workers=1) as ex:
-            future = ex.submit(converter.convert, str(path_obj))
-            result = future.result(timeout=PDF_CONVERT_TIMEOUT_SEC)
+        _, files = get_worker().convert_to_files(path_obj, tmp_dir)
     except FuturesTimeoutError:
         logger.warning("Vision: PDF conversion timed out after %ds; skipping image extraction.", PDF_CONVERT_TIMEOUT_SEC)
         return image_paths, tmp_dir
-    logger.info("Vision: PDF conversion done, extracting page/figure images.")
-    doc_name = path_obj.stem
-    doc = result.document
-
-    # Page images
-    pages = getattr(doc, "pages", None)
-    if pages:
-        for page_no, page in pages.items():
-            img = getattr(page, "image", None)
-            if img is not None and hasattr(img, "pil_image"):
-                out = tmp_dir / f"{doc_name}-page-{page_no}.png"
-                try:
-                    img.pil_image.save(str(out), format="PNG")
-                    image_paths.append(str(out))
-                except Exception:
-                    pass
-
-    # Figures and tables via iterate_items
-    PictureItem = TableItem = None
-    try:
-        from docling.document_core import PictureItem, TableItem
-    except ImportError:
-        try:
-            from docling_core.types.doc import PictureItem, TableItem  # type: ignore
-        except ImportError:
-            pass
-
-    if PictureItem is not None and TableItem is not None:
-        it = getattr(doc, "iterate_items", None)
-        if it is not None:
-            pic_count = table_count = 0
-            iter_gen = it() if callable(it) else (it or [])
-            for element, _ in iter_gen:
-                if isinstance(element, TableItem):
-                    table_count += 1
-                    out = tmp_dir / f"{doc_name}-table-{table_count}.png"
-                    try:
-                        im = element.get_image(doc)
-                        if im is not None:
-                            im.save(str(out), "PNG")
-                            image_paths.append(str(out))
-                    except Exception:
-                        pass
-                if isinstance(element, PictureItem):
-                    pic_count += 1
-                    out = tmp_dir / f"{doc_name}-picture-{pic_count}.png"
-                    try:
-                        im = element.get_image(doc)
-                        if im is not None:
-                            im.save(str(out), "PNG")
-                            image_paths.append(str(out))
-                    except Exception:
-                        pass
+    except (DoclingWorkerError, ImportError) as e:
+        logger.warning("Vision: PDF conversion failed (%s); skipping image extraction.", e)
+        return image_paths, tmp_dir
+    logger.info("Vision: PDF conversion done, extracted %d page/figure images.", len(files))
+    store = get_image_store()
+    image_paths = [store.put_file(f) for f in files]
 
     return image_paths, tmp_dir
 
 
+# -----------------------------------------------------------------------------
+# Concurrent classification: one AsyncOpenAI client on the shared loop
+# (src.async_runtime), bounded by a process-wide semaphore.
+# -----------------------------------------------------------------------------
+
+VISION_MODEL = "gpt-4o"
+# Max vision requests in flight at once (AUDITOR_VISION_CONCURRENCY).
+DEFAULT_VISION_CONCURRENCY = 8
+# Images in the first early-exit wave (AUDITOR_VISION_FIRST_WAVE); later waves double up to the concurrency cap.
+DEFAULT_VISION_FIRST_WAVE = 2
+# Per-image request timeout (AUDITOR_VISION_TIMEOUT_SEC); a timed-out image falls back like any failure.
+DEFAULT_VISION_TIMEOUT_SEC = 60.0
+
+_vision_client = None
+_vision_semaphore: asyncio.Semaphore | None = None
+
+
+def _env_number(name: str, default: float) -> float:
+    raw = os.environ.get(name, "").strip()
+    try:
+        return float(raw) if raw else default
+    except ValueError:
+        return default
+
+
+def _get_vision_client():
+    """AsyncOpenAI client shared by every classification; only call from coroutines on the shared loop."""
+    global _vision_client
+    if _vision_client is None:
+        from openai import AsyncOpenAI
+
+        _vision_client = AsyncOpenAI()
+    return _vision_client
+
+
+def _get_vision_semaphore() -> asyncio.Semaphore:
+    """Semaphore bound to the shared loop; only call from coroutines running on it."""
+    global _vision_semaphore
+    if _vision_semaphore is None:
+        limit = int(_env_number("AUDITOR_VISION_CONCURRENCY", DEFAULT_VISION_CONCURRENCY))
+        _vision_semaphore = asyncio.Semaphore(max(1, limit))
+    return _vision_semaphore
+
+
+def _image_data_url(ref: str) -> str:
+    from src.image_store import get_image_store
+
+    b64 = base64.standard_b64encode(get_image_store().get_bytes(ref)).decode("ascii")
+    return f"data:image/png;base64,{b64}"
+
+
+def _parse_classification(raw: str) -> DiagramClassification:
+    if "StateGraph diagram" in raw:
+        return "StateGraph diagram"
+    if "Linear pipeline" in raw:
+        return "Linear pipeline"
+    return "Generic flowchart"
+
+
+async def _aclassify_image(img_path: str, prompt: str, timeout: float) -> DiagramResult:
+    """Classify one image (store handle or path); missing images, errors and timeouts yield Generic flowchart."""
+    from src.image_store import get_image_store
+
+    store = get_image_store()
+    name = store.name(img_path)
+    if not store.exists(img_path):
+        return DiagramResult(image_path=img_path, classification="Generic flowchart", raw_response="file missing")
+    try:
+        client = _get_vision_client()
+        async with _get_vision_semaphore():
+            data_url = await asyncio.to_thread(_image_data_url, img_path)
+            resp = await asyncio.wait_for(
+                client.chat.completions.create(
+                    model=VISION_MODEL,
+                    messages=[
+                        {
+                            "role": "user",
+                            "content": [
+                                {"type": "text", "text": prompt},
+                                {"type": "image_url", "image_url": {"url": data_url}},
+                            ],
+                        }
+                    ],
+                    max_tokens=50,
+                ),
+                timeout=timeout,
+            )
+        raw = (resp.choices[0].message.content or "").strip()
+        return DiagramResult(image_path=img_path, classification=_parse_classification(raw), raw_response=raw)
+    except asyncio.TimeoutError:
+        logger.warning("Vision: classification of %s timed out after %gs.", name, timeout)
+    except Exception as e:
+        logger.debug("Vision: classification of %s failed: %s", name, e)
+    return DiagramResult(image_path=img_path, classification="Generic flowchart", raw_response="")
+
+
+async def aclassify_diagrams(image_paths: list[str], prompt: str = DIAGRAM_PROMPT) -> list[DiagramResult]:
+    """Classify all images concurrently on the running loop; results are in input order."""
+    timeout = _env_number("AUDITOR_VISION_TIMEOUT_SEC", DEFAULT_VISION_TIMEOUT_SEC)
+    return list(await asyncio.gather(*(_aclassify_image(p, prompt, timeout) for p in image_paths)))
+
+
+def vision_early_exit_enabled() -> bool:
+    """Stop classifying once a StateGraph diagram is found; AUDITOR_NO_VISION_EARLY_EXIT=1 classifies every image."""
+    return os.environ.get("AUDITOR_NO_VISION_EARLY_EXIT", "").strip() not in ("1", "true", "yes")
+
+
+def is_confident_stategraph(result: DiagramResult) -> bool:
+    """The model answered with exactly the StateGraph label (not a hedged or mixed reply)."""
+    return result.raw_response.strip().rstrip(".").lower() == "stategraph diagram"
+
+
+async def aclassify_until_stategraph(image_paths: list[str], prompt: str = DIAGRAM_PROMPT) -> list[DiagramResult]:
+    """Classify images (most likely diagram first) until one is confidently a StateGraph diagram.
+
+    Images go out in waves that start at AUDITOR_VISION_FIRST_WAVE and double
+    up to AUDITOR_VISION_CONCURRENCY: the hit is usually among the top-ranked
+    images, so the common case costs one small wave. A confident hit cancels
+    the rest of its wave and no further wave is sent. Without a hit every wave
+    is a round trip, so a larger first wave trades requests for latency.
+    Returns the results that completed, in input order.
+    """
+    timeout = _env_number("AUDITOR_VISION_TIMEOUT_SEC", DEFAULT_VISION_TIMEOUT_SEC)
+    max_wave = max(1, int(_env_number("AUDITOR_VISION_CONCURRENCY", DEFAULT_VISION_CONCURRENCY)))
+    done: dict[int, DiagramResult] = {}
+    wave_size = min(max(1, int(_env_number("AUDITOR_VISION_FIRST_WAVE", DEFAULT_VISION_FIRST_WAVE))), max_wave)
+    start, found = 0, False
+    while start < len(image_paths) and not found:
+        wave = {
+            asyncio.ensure_future(_aclassify_image(image_paths[i], prompt, timeout)): i
+            for i in range(start, min(start + wave_size, len(image_paths)))
+        }
+        try:
+            for next_done in asyncio.as_completed(wave):
+                if is_confident_stategraph(await next_done):
+                    found = True
+                    break
+        finally:
+            pending = [t for t in wave if not t.done()]
+            for t in pending:
+                t.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        done.update({i: t.result() for t, i in wave.items() if not t.cancelled()})
+        start += len(wave)
+        wave_size = min(wave_size * 2, max_wave)
+    if found and len(done) < len(image_paths):
+        logger.info("Vision: StateGraph diagram found; skipped %d of %d images.", len(image_paths) - len(done), len(image_paths))
+    return [done[i] for i in sorted(done)]
+
+
 def classify_diagram_with_vision(
     image_paths: list[str],
     prompt: str = DIAGRAM_PROMPT,
+    stop_on_stategraph: bool = False,
 ) -> list[DiagramResult]:
-    """Send images to multimodal model and return classification per image.
+    """Send images to multimodal model and return classification per image, in input order.
 
-    Uses OpenAI vision (gpt-4o or gpt-4-vision). Execution optional: if
-    OPENAI_API_KEY is missing or request fails, returns Generic flowchart.
+    Uses OpenAI vision (gpt-4o). Requests run concurrently on the shared event
+    loop with one client (AUDITOR_VISION_CONCURRENCY in flight, each capped by
+    AUDITOR_VISION_TIMEOUT_SEC). With stop_on_stategraph, images are sent in
+    list order in growing waves (AUDITOR_VISION_FIRST_WAVE, doubling) and nothing more is sent after
+    the first confident StateGraph diagram, so only completed
+    classifications are returned. Execution
+    optional: if OPENAI_API_KEY is missing or a request fails, that image is
+    classified Generic flowchart.
     """
-    results: list[DiagramResult] = []
-    valid: DiagramClassification = "Generic flowchart"
-
-    for img_path in image_paths:
-        path = Path(img_path)
-        if not path.exists():
-            results.append(DiagramResult(image_path=img_path, classification=valid, raw_response="file missing"))
-            continue
+    if not image_paths:
+        return []
+    from src.async_runtime import run_coroutine
 
-        try:
-            import base64
-
-            client = __import__("openai").OpenAI()
-            with path.open("rb") as f:
-                b64 = base64.standard_b64encode(f.read()).decode("ascii")
-            resp = client.chat.completions.create(
-                model="gpt-4o",
-                messages=[
-                    {
-                        "role": "user",
-                        "content": [
-                            {"type": "text", "text": prompt},
-                            {"type": "image_url", "image_url": {"url": f"data:image/png;base64,{b64}"}},
-                        ],
-                    }
-                ],
-                max_tokens=50,
-            )
-            raw = (resp.choices[0].message.content or "").strip()
-            if "StateGraph diagram" in raw:
-                classification: DiagramClassification = "StateGraph diagram"
-            elif "Linear pipeline" in raw:
-                classification = "Linear pipeline"
-            else:
-                classification = "Generic flowchart"
-            results.append(DiagramResult(image_path=img_path, classification=classification, raw_response=raw))
-        except Exception:
-            results.append(DiagramResult(image_path=img_path, classification=valid, raw_response=""))
-
-    return results
+    if stop_on_stategraph:
+        return run_coroutine(aclassify_until_stategraph(image_paths, prompt))
+    return run_coroutine(aclassify_diagrams(image_paths, prompt))
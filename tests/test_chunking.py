@@ -0,0 +1,87 @@
+"""Differential tests: streaming markdown chunker vs. the original whole-string chunker."""
+
+import random
+import re
+
+import pytest
+
+from src.tools.doc_tools import (
+    CHUNK_MAX_CHARS,
+    CHUNK_MIN_CHARS,
+    _BLOCK_SPLIT,
+    _chunk_markdown,
+    iter_chunks,
+    iter_markdown_blocks,
+)
+
+
+def _reference_chunks(markdown: str) -> list[str]:
+    """The pre-streaming _chunk_markdown, kept verbatim as the oracle."""
+    raw = re.split(r"\n(?=\s*#+\s|\n)", markdown)
+    chunks: list[str] = []
+    current: list[str] = []
+
+    def flush():
+        nonlocal current
+        if current:
+            text = "\n\n".join(current).strip()
+            if len(text) > CHUNK_MAX_CHARS:
+                while len(text) > CHUNK_MAX_CHARS:
+                    head = text[:CHUNK_MAX_CHARS]
+                    last_break = max(head.rfind("\n\n"), head.rfind(". "))
+                    if last_break > CHUNK_MIN_CHARS:
+                        chunks.append(text[: last_break + 1].strip())
+                        text = text[last_break + 1 :].lstrip()
+                    else:
+                        chunks.append(text[:CHUNK_MAX_CHARS])
+                        text = text[CHUNK_MAX_CHARS:].lstrip()
+            if text:
+                chunks.append(text)
+            current = []
+
+    for block in raw:
+        block = block.strip()
+        if not block:
+            continue
+        current.append(block)
+        if sum(len(s) for s in current) >= CHUNK_MAX_CHARS:
+            flush()
+
+    flush()
+    return chunks
+
+
+# Fragments biased towards the characters the block splitter cares about.
+_ATOMS = ["\n", "\n\n", " ", "\t", "#", "## ", "# Title", ". ", "word", "x" * 40, "Sentence. ", "\n  # h\n"]
+
+
+def _random_markdown(rng: random.Random) -> str:
+    n = rng.choice([0, 1, 5, 50, 400, 1500])
+    parts = [rng.choice(_ATOMS) for _ in range(n)]
+    if rng.random() < 0.2:
+        parts.append("y" * rng.randint(CHUNK_MAX_CHARS, 3 * CHUNK_MAX_CHARS))
+    return "".join(parts)
+
+
+def _random_pieces(rng: random.Random, text: str) -> list[str]:
+    cuts = sorted(rng.randint(0, len(text)) for _ in range(rng.randint(0, 12)))
+    bounds = [0, *cuts, len(text)]
+    return [text[a:b] for a, b in zip(bounds, bounds[1:])]
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_streaming_chunker_matches_reference(seed):
+    rng = random.Random(seed)
+    for _ in range(100):
+        text = _random_markdown(rng)
+        pieces = _random_pieces(rng, text)
+        expected = _reference_chunks(text)
+        assert list(iter_markdown_blocks(pieces)) == _BLOCK_SPLIT.split(text)
+        assert list(iter_chunks(pieces)) == expected
+        assert _chunk_markdown(text) == expected
+
+
+def test_page_join_matches_whole_document():
+    pages = ["# Intro\nfirst page", "", "## Part\n\n" + "Body. " * 400, "# End"]
+    pieces = [p if i == 0 else f"\n\n{p}" for i, p in enumerate(pages)]
+    assert list(iter_chunks(pieces)) == _reference_chunks("\n\n".join(pages))